@@ -87,6 +87,7 @@ from .discovery import (
     get_css_codes,
     get_non_css_codes,
     get_small_test_codes,
+    build_all_base_codes,
     print_code_catalog,
 )
 
@@ -140,6 +141,7 @@ __all__ = [
     "get_css_codes",
     "get_non_css_codes",
     "get_small_test_codes",
+    "build_all_base_codes",
     "print_code_catalog",
     
     # Composite operations
@@ -30,13 +30,13 @@ since HomologicalCode already inherits from StabilizerCode. This avoids MRO issu
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, TYPE_CHECKING
 
 import numpy as np
 
 from .abstract_code import PauliString, StabilizerCode, SubsystemCode, CellEmbedding
 from .abstract_homological import HomologicalCode, TopologicalCode
-from .utils import gf2_rank
+from .utils import GF2Analysis, binary_csr, gf2_analyse, gf2_pack, gf2_packed_matmul, pauli_strings_to_matrix
 
 if TYPE_CHECKING:
     from .complexes.chain_complex import ChainComplex
@@ -45,6 +45,51 @@ if TYPE_CHECKING:
 Coord2D = Tuple[float, float]
 Coord = Tuple[float, ...]
 
+# Below this many multiply-adds the dense Hx Hz^T product is cheaper than
+# bit-packing both matrices first.
+_DENSE_CSS_CHECK_LIMIT = 1 << 16
+
+
+def _stored_matrix(matrix: np.ndarray) -> np.ndarray:
+    """
+    uint8 matrix a code can keep without aliasing the caller's buffer.
+    
+    Read-only uint8 arrays that own their data (the module-level tables of
+    the fixed codes) are kept as they are. Anything else is copied once and
+    the copy marked read-only, so neither the caller nor a user of ``hx``
+    can edit it in place behind the identity-keyed caches on the code.
+    """
+    arr = np.asarray(matrix)
+    if (
+        arr.dtype == np.uint8
+        and arr.base is None
+        and arr.flags.c_contiguous
+        and not arr.flags.writeable
+    ):
+        return arr
+    stored = np.array(arr, dtype=np.uint8, order="C")
+    stored.setflags(write=False)
+    return stored
+
+
+def _instance_metadata(
+    template: Mapping[str, Any],
+    metadata: Optional[Dict[str, Any]],
+    list_keys: Iterable[str],
+) -> Dict[str, Any]:
+    """
+    Metadata dict for one instance of a fixed code.
+    
+    Fixed codes build their tables once at import and keep their metadata as
+    a frozen template shared by every instance. Template entries win over
+    the caller's ``metadata``, and the template's tuples under ``list_keys``
+    become fresh lists so each instance owns the metadata it hands out.
+    """
+    meta: Dict[str, Any] = {**(metadata or {}), **template}
+    for key in list_keys:
+        meta[key] = list(meta[key])
+    return meta
+
 
 class CSSCode(HomologicalCode):
     """
@@ -67,6 +112,10 @@ class CSSCode(HomologicalCode):
     codes with known geometric structure.
     """
 
+    # Fixed codes whose check matrices are module constants verified at
+    # import set this to skip the per-instance commutation check.
+    _checks_verified = False
+
     def __init__(
         self,
         hx: np.ndarray,
@@ -91,8 +140,8 @@ class CSSCode(HomologicalCode):
         metadata : dict, optional
             Arbitrary metadata (distance, chain_complex, etc.).
         """
-        self._hx = np.array(hx, dtype=np.uint8)
-        self._hz = np.array(hz, dtype=np.uint8)
+        self._hx = _stored_matrix(hx)
+        self._hz = _stored_matrix(hz)
         self._logical_x = logical_x
         self._logical_z = logical_z
         self._metadata = metadata or {}
@@ -100,11 +149,15 @@ class CSSCode(HomologicalCode):
 
     def _validate_css(self) -> None:
         """Validate CSS constraints: Hx and Hz must commute (Hx @ Hz.T = 0 mod 2)."""
-        if self._hx.size == 0 or self._hz.size == 0:
+        if self._checks_verified or self._hx.size == 0 or self._hz.size == 0:
             return
         assert self._hx.shape[1] == self._hz.shape[1], \
             "Hx, Hz must have same number of columns (qubits)"
-        comm = (self._hx @ self._hz.T) % 2
+        hx, hz = self._hx, self._hz
+        if hx.shape[0] * hz.shape[0] * hx.shape[1] <= _DENSE_CSS_CHECK_LIMIT:
+            comm = (hx @ hz.T) & 1
+        else:
+            comm = gf2_packed_matmul(self._hx_bits, self._hz_bits)
         if np.any(comm):
             raise ValueError("Hx Hz^T != 0 mod 2; not a valid CSS code")
 
@@ -124,10 +177,30 @@ class CSSCode(HomologicalCode):
         """Number of logical qubits: k = n - rank(Hx) - rank(Hz) over GF(2)."""
         if self.n == 0:
             return 0
-        rank_hx = gf2_rank(self._hx) if self._hx.size > 0 else 0
-        rank_hz = gf2_rank(self._hz) if self._hz.size > 0 else 0
+        rank_hx, rank_hz = self._gf2_ranks()
         return self.n - rank_hx - rank_hz
 
+    def _gf2_ranks(self) -> Tuple[int, int]:
+        """GF(2) ranks of (Hx, Hz), read off the cached analyses."""
+        hx_info, hz_info = self._gf2_analyses()
+        return hx_info.rank, hz_info.rank
+
+    def _gf2_analyses(self) -> Tuple[GF2Analysis, GF2Analysis]:
+        """
+        GF(2) analyses (RREF, pivots, rank, row space) of (Hx, Hz).
+        
+        Each matrix is eliminated once and the result is shared by ``k``,
+        logical-operator inference and anything else that needs ranks or
+        row spaces. The cache holds references to the arrays it was computed
+        from, so subclasses that reassign ``_hx``/``_hz`` after ``__init__``
+        get fresh analyses on the next access.
+        """
+        cache = getattr(self, "_gf2_analysis_cache", None)
+        if cache is None or cache[0] is not self._hx or cache[1] is not self._hz:
+            cache = (self._hx, self._hz, gf2_analyse(self._hx), gf2_analyse(self._hz))
+            self._gf2_analysis_cache = cache
+        return cache[2], cache[3]
+
     @property
     def logical_x_ops(self) -> List[PauliString]:
         """Logical X operators."""
@@ -138,6 +211,115 @@ class CSSCode(HomologicalCode):
         """Logical Z operators."""
         return self._logical_z
 
+    @property
+    def _logical_x_bin(self) -> np.ndarray:
+        """X-support of the logical X operators as a (k, n) uint8 matrix."""
+        return self._logical_matrix("X")
+
+    @property
+    def _logical_z_bin(self) -> np.ndarray:
+        """Z-support of the logical Z operators as a (k, n) uint8 matrix."""
+        return self._logical_matrix("Z")
+
+    def _logical_matrix(self, pauli_type: str) -> np.ndarray:
+        """
+        Dense support matrix of the logical operators of one type.
+        
+        Built once per operator list and reused by commutation checks; the
+        dict/str operators stay the public representation.
+        """
+        ops = self._logical_x if pauli_type == "X" else self._logical_z
+        attr = f"_logical_{pauli_type.lower()}_bin_cache"
+        cache = getattr(self, attr, None)
+        n = self.n
+        if cache is None or cache[0] is not ops or cache[1] != (len(ops), n):
+            cache = (ops, (len(ops), n), pauli_strings_to_matrix(ops, n, pauli_type))
+            setattr(self, attr, cache)
+        return cache[2]
+
+    def _seed_logical_supports(self, x_bin: np.ndarray, z_bin: np.ndarray) -> None:
+        """
+        Prime the logical support caches with precomputed matrices.
+        
+        For codes whose logical operators are fixed tables, the (k, n) support
+        matrices can be built once at import and handed over here instead of
+        being re-parsed from the operators for every instance. The matrices
+        must match the current ``logical_x_ops``/``logical_z_ops``.
+        """
+        n = self.n
+        self._logical_x_bin_cache = (self._logical_x, (len(self._logical_x), n), x_bin)
+        self._logical_z_bin_cache = (self._logical_z, (len(self._logical_z), n), z_bin)
+
+    @property
+    def _logical_x_bits(self) -> np.ndarray:
+        """X-support of the logical X operators, bit-packed into uint64 words."""
+        return self._packed_logicals("X")
+
+    @property
+    def _logical_z_bits(self) -> np.ndarray:
+        """Z-support of the logical Z operators, bit-packed into uint64 words."""
+        return self._packed_logicals("Z")
+
+    def _packed_logicals(self, pauli_type: str) -> np.ndarray:
+        """Bit-packed form of ``_logical_matrix(pauli_type)``, packed once per matrix."""
+        matrix = self._logical_matrix(pauli_type)
+        attr = f"_logical_{pauli_type.lower()}_bits_cache"
+        cache = getattr(self, attr, None)
+        if cache is None or cache[0] is not matrix:
+            cache = (matrix, gf2_pack(matrix)[0])
+            setattr(self, attr, cache)
+        return cache[1]
+
+    @property
+    def _hx_bits(self) -> np.ndarray:
+        """Hx bit-packed into uint64 words along its rows (see ``gf2_pack``)."""
+        return self._packed_checks("_hx")
+
+    @property
+    def _hz_bits(self) -> np.ndarray:
+        """Hz bit-packed into uint64 words along its rows (see ``gf2_pack``)."""
+        return self._packed_checks("_hz")
+
+    def _seed_packed_checks(self, hx_bits: np.ndarray, hz_bits: np.ndarray) -> None:
+        """
+        Prime the packed check caches for the current ``_hx``/``_hz``.
+        
+        Fixed codes that share their check matrices across instances can pack
+        them once at import and hand the words over here.
+        """
+        self._hx_bits_cache = (self._hx, hx_bits)
+        self._hz_bits_cache = (self._hz, hz_bits)
+
+    def _packed_checks(self, attr: str) -> np.ndarray:
+        """
+        Bit-packed copy of the check matrix stored in ``attr``.
+        
+        Packed once per matrix and reused by the GF(2) products; the dense
+        uint8 matrix stays the public representation.
+        """
+        matrix = getattr(self, attr)
+        cache_attr = f"{attr}_bits_cache"
+        cache = getattr(self, cache_attr, None)
+        if cache is None or cache[0] is not matrix:
+            cache = (matrix, gf2_pack(matrix)[0])
+            setattr(self, cache_attr, cache)
+        return cache[1]
+
+    def _check_csr(self, attr: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        CSR ``(indptr, indices)`` of the check matrix stored in ``attr``.
+        
+        Kept on the code so circuit builders walk check supports as plain
+        index arrays instead of rescanning the dense rows on every build.
+        """
+        matrix = getattr(self, attr)
+        cache_attr = f"{attr}_csr_cache"
+        cache = getattr(self, cache_attr, None)
+        if cache is None or cache[0] is not matrix:
+            cache = (matrix, binary_csr(matrix))
+            setattr(self, cache_attr, cache)
+        return cache[1]
+
     # --- StabilizerCode interface ---
 
     @property
@@ -177,17 +359,26 @@ class CSSCode(HomologicalCode):
         return self
 
     def stabilizers(self) -> List[PauliString]:
-        """Convert Hx/Hz to list of Pauli strings."""
+        """Convert Hx/Hz to list of Pauli strings (built once per Hx/Hz).
+        
+        Each call returns fresh dicts, so callers may edit the result.
+        """
+        cache = getattr(self, "_stabilizers_cache", None)
+        if cache is not None and cache[0] is self._hx and cache[1] is self._hz:
+            return [dict(s) for s in cache[2]]
         stabs: List[PauliString] = []
-        # X stabilizers from Hx
-        for row in self._hx:
-            pauli = {i: "X" for i, bit in enumerate(row) if bit}
-            stabs.append(pauli)
-        # Z stabilizers from Hz
-        for row in self._hz:
-            pauli = {i: "Z" for i, bit in enumerate(row) if bit}
-            stabs.append(pauli)
-        return stabs
+        # X stabilizers from Hx, then Z stabilizers from Hz
+        for mat, pauli in ((self._hx, "X"), (self._hz, "Z")):
+            if mat.shape[0] == 0:
+                continue
+            # One nonzero() scan; row indices come back sorted, so split
+            # the column indices at each row boundary
+            rows, cols = np.nonzero(mat)
+            splits = np.searchsorted(rows, np.arange(1, mat.shape[0]))
+            for support in np.split(cols, splits):
+                stabs.append(dict.fromkeys(support.tolist(), pauli))
+        self._stabilizers_cache = (self._hx, self._hz, stabs)
+        return [dict(s) for s in stabs]
 
     # --- CSS-specific properties ---
 
@@ -201,6 +392,16 @@ class CSSCode(HomologicalCode):
         """Z-stabilizer parity check matrix."""
         return self._hz
 
+    @property
+    def hx_bits(self) -> np.ndarray:
+        """Hx with each row bit-packed into little-endian uint64 words (see ``gf2_pack``)."""
+        return self._hx_bits
+
+    @property
+    def hz_bits(self) -> np.ndarray:
+        """Hz with each row bit-packed into little-endian uint64 words (see ``gf2_pack``)."""
+        return self._hz_bits
+
     @property
     def chain_complex(self) -> Optional["ChainComplex"]:
         """Return chain complex if stored in metadata, else None."""
@@ -280,6 +481,9 @@ class CSSCode(HomologicalCode):
         # Fall back to parsing logical_x_ops
         if logical_idx < len(self._logical_x):
             L = self._logical_x[logical_idx]
+            if isinstance(L, str) and len(L) == self.n:
+                # Reuse the cached support matrix instead of rescanning
+                return np.flatnonzero(self._logical_matrix('X')[logical_idx]).tolist()
             return self._pauli_support(L, ('X', 'Y'))
         
         return list(range(self.n))  # Ultimate fallback: all qubits
@@ -319,6 +523,9 @@ class CSSCode(HomologicalCode):
         # Fall back to parsing logical_z_ops
         if logical_idx < len(self._logical_z):
             L = self._logical_z[logical_idx]
+            if isinstance(L, str) and len(L) == self.n:
+                # Reuse the cached support matrix instead of rescanning
+                return np.flatnonzero(self._logical_matrix('Z')[logical_idx]).tolist()
             return self._pauli_support(L, ('Z', 'Y'))
         
         return list(range(self.n))
@@ -563,7 +770,7 @@ class CSSCodeWithComplex(CSSCode):
         qg = cc.qubit_grade
         # Hx comes from ∂_{qg+1}^T if it exists
         if qg + 1 in cc.boundary_maps:
-            return (cc.boundary_maps[qg + 1].T.astype(np.uint8) % 2)
+            return cc.boundary_maps[qg + 1].T.astype(np.uint8) & 1
         return np.zeros((0, cc.boundary_maps[qg].shape[1] if qg in cc.boundary_maps else 0), dtype=np.uint8)
     
     def _derive_hz(self, cc: "ChainComplex") -> np.ndarray:
@@ -571,7 +778,7 @@ class CSSCodeWithComplex(CSSCode):
         qg = cc.qubit_grade
         # Hz comes from ∂_{qg}
         if qg in cc.boundary_maps:
-            return (cc.boundary_maps[qg].astype(np.uint8) % 2)
+            return cc.boundary_maps[qg].astype(np.uint8) & 1
         return np.zeros((0, 0), dtype=np.uint8)
     
     @property
@@ -891,10 +1098,10 @@ class SubsystemCSSCode(SubsystemCode, CSSCode):
             Additional metadata.
         """
         # Store CSS structure
-        self._hx = np.array(hx, dtype=np.uint8)
-        self._hz = np.array(hz, dtype=np.uint8)
-        self._gauge_x = np.array(gauge_x, dtype=np.uint8)
-        self._gauge_z = np.array(gauge_z, dtype=np.uint8)
+        self._hx = _stored_matrix(hx)
+        self._hz = _stored_matrix(hz)
+        self._gauge_x = _stored_matrix(gauge_x)
+        self._gauge_z = _stored_matrix(gauge_z)
         self._logical_x = logical_x
         self._logical_z = logical_z
         self._metadata = metadata or {}
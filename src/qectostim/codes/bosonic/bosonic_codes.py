@@ -16,6 +16,8 @@ Key difference from qubit codes:
 from typing import Dict, List, Optional, Tuple, Any
 import numpy as np
 
+from qectostim.codes.utils import css_intersection_check
+
 
 class BosonicCode:
     """
@@ -72,8 +74,7 @@ class BosonicCode:
         
         Uses mod 2 validation since the codes are built with HGP structure.
         """
-        product = (self.hx @ self.hz.T) % 2
-        if product.sum() != 0:
+        if not css_intersection_check(self.hx, self.hz):
             raise ValueError("Hx Hz^T != 0 mod 2; not a valid CSS code")
     
     @property
@@ -17,6 +17,7 @@ Each qubit sits on an edge, with stabilizers on faces.
 from __future__ import annotations
 from typing import Dict, Any, List, Optional, Tuple
 from itertools import product
+import functools
 
 import numpy as np
 import math
@@ -24,6 +25,7 @@ import math
 from qectostim.codes.abstract_css import TopologicalCSSCode, Coord2D
 from qectostim.codes.abstract_code import PauliString
 from qectostim.codes.complexes.css_complex import CSSChainComplex3
+from qectostim.codes.utils import gf2_rank, support_to_pauli_str
 
 
 def _compute_valid_3_coloring(hx: np.ndarray) -> Optional[List[int]]:
@@ -62,6 +64,12 @@ def _compute_valid_3_coloring(hx: np.ndarray) -> Optional[List[int]]:
     return None
 
 
+def _grid_coords(count: int, width: int, offset: float = 0.0) -> List[Coord2D]:
+    """Row-major ``(i % width, i // width) + offset`` coordinates for ``count`` sites."""
+    rows, cols = np.divmod(np.arange(count, dtype=np.float64), width)
+    return list(zip((cols + offset).tolist(), (rows + offset).tolist()))
+
+
 class HexagonalColourCode(TopologicalCSSCode):
     """
     Hexagonal colour code on 4.8.8 tiling.
@@ -82,137 +90,18 @@ class HexagonalColourCode(TopologicalCSSCode):
         
         d = distance
         
-        if d == 2:
-            # Smallest 4.8.8 colour code: [[8,2,2]]
-            # 8 qubits arranged in square-octagon pattern
-            n_qubits = 8
-            
-            # Faces: 1 octagon (all 8) + 4 squares (pairs)
-            hx = np.array([
-                [1, 1, 1, 1, 0, 0, 0, 0],  # Left square
-                [0, 0, 0, 0, 1, 1, 1, 1],  # Right square
-                [1, 1, 0, 0, 1, 1, 0, 0],  # Top
-            ], dtype=np.uint8)
-            
-            hz = hx.copy()  # Self-dual
-            
-            logical_x = ["XXXXIIII", "IIIIXXXX"]
-            logical_z = ["ZZZZIIII", "IIIIZZZZ"]
-            
-            coords = {
-                0: (0.0, 0.0), 1: (1.0, 0.0), 2: (0.0, 1.0), 3: (1.0, 1.0),
-                4: (2.0, 0.0), 5: (3.0, 0.0), 6: (2.0, 1.0), 7: (3.0, 1.0),
-            }
-            
-            stab_coords = [
-                (0.5, 0.5),  # Left square center
-                (2.5, 0.5),  # Right square center
-                (1.5, 0.5),  # Middle
-            ]
-            
-            # Face colors: must satisfy 3-coloring constraint (overlapping faces have different colors)
-            # Overlaps: (0,2), (1,2) so valid coloring is [0, 0, 1]
-            stab_colors = [0, 0, 1]
-            
-        elif d == 3:
-            # [[17,1,3]] hexagonal colour code (approximate)
-            n_qubits = 17
-            
-            # Construct faces for 4.8.8 tiling
-            # Weight-4 squares and weight-8 octagons
-            faces = [
-                [0, 1, 2, 3],           # Square 1
-                [4, 5, 6, 7],           # Square 2
-                [8, 9, 10, 11],         # Square 3
-                [0, 1, 4, 5, 8, 9, 12, 13],  # Octagon (partial)
-                [2, 3, 6, 7, 10, 11, 14, 15],  # Octagon (partial)
-            ]
-            
-            hx = np.zeros((len(faces), n_qubits), dtype=np.uint8)
-            for i, face in enumerate(faces):
-                for q in face:
-                    if q < n_qubits:
-                        hx[i, q] = 1
-            
-            hz = hx.copy()
-            
-            lx = ['I'] * n_qubits
-            lz = ['I'] * n_qubits
-            for i in [0, 4, 8]:
-                lx[i] = 'X'
-                lz[i] = 'Z'
-            logical_x = [''.join(lx)]
-            logical_z = [''.join(lz)]
-            
-            coords = {i: (float(i % 4), float(i // 4)) for i in range(n_qubits)}
-            
-            stab_coords = []
-            for i in range(len(faces)):
-                x = (i % d) + 0.5
-                y = (i // d) + 0.5
-                stab_coords.append((x, y))
-            
-            # Face colors: must satisfy 3-coloring constraint (overlapping faces have different colors)
-            # For d=3: Overlaps are (0,3), (0,4), (1,3), (1,4), (2,3), (2,4) forming bipartite graph
-            # Small squares (0,1,2) can all be same color, large octagons (3,4) can be another
-            # Valid coloring: [0, 0, 0, 1, 1]
-            stab_colors = [0, 0, 0, 1, 1]
-            
-        else:
-            # General construction
-            # Approximate qubit count for distance d
-            n_qubits = 2 * d * d + 1
-            
-            # Build approximate structure
-            num_faces = d * d
-            hx = np.zeros((num_faces, n_qubits), dtype=np.uint8)
-            
-            for f in range(num_faces):
-                # Mix of weight-4 and weight-8 faces
-                weight = 8 if f % 3 == 0 else 4
-                for i in range(weight):
-                    idx = (f * 4 + i) % n_qubits
-                    hx[f, idx] = 1
-            
-            hz = hx.copy()
-            
-            lx = ['I'] * n_qubits
-            lz = ['I'] * n_qubits
-            for i in range(d):
-                if i < n_qubits:
-                    lx[i] = 'X'
-                    lz[i] = 'Z'
-            logical_x = [''.join(lx)]
-            logical_z = [''.join(lz)]
-            
-            coords = {i: (float(i % (2*d)), float(i // (2*d))) for i in range(n_qubits)}
-            
-            stab_coords = []
-            for i in range(num_faces):
-                x = (i % d) + 0.5
-                y = (i // d) + 0.5
-                stab_coords.append((x, y))
-            
-            # Face colors: compute valid 3-coloring from overlap graph
-            stab_colors = _compute_valid_3_coloring(hx)
-        
-        # Compute actual k from rank
-        rank_hx = np.linalg.matrix_rank(hx)
-        rank_hz = np.linalg.matrix_rank(hz)
-        k = n_qubits - rank_hx - rank_hz
-        
-        # Build chain complex
-        # boundary_2: shape (n_qubits, n_x_stabs + n_z_stabs)
-        boundary_2_x = hx.T.astype(np.uint8)  # shape (n_qubits, n_x_stabs)
-        boundary_2_z = hz.T.astype(np.uint8)  # shape (n_qubits, n_z_stabs)
-        boundary_2 = np.concatenate([boundary_2_x, boundary_2_z], axis=1)
-        
-        # boundary_1: Empty for colour codes with boundaries
-        boundary_1 = np.zeros((0, n_qubits), dtype=np.uint8)
-        
-        chain_complex = CSSChainComplex3(boundary_2=boundary_2, boundary_1=boundary_1)
-        
-        data_coords = [coords.get(i, (0.0, 0.0)) for i in range(n_qubits)]
+        (
+            hx,
+            hz,
+            chain_complex,
+            logical_x,
+            logical_z,
+            data_coords,
+            stab_coords,
+            stab_colors,
+            k,
+        ) = _hexagonal_colour_tables(d)
+        n_qubits = hx.shape[1]
         
         meta = dict(metadata or {})
         meta["name"] = f"HexagonalColour_d{d}"
@@ -221,11 +110,12 @@ class HexagonalColourCode(TopologicalCSSCode):
         meta["distance"] = d
         meta["is_colour_code"] = True
         meta["tiling"] = "4.8.8"
-        meta["data_coords"] = data_coords
+        meta["data_coords"] = list(data_coords)
         
-        meta["x_stab_coords"] = stab_coords
-        meta["z_stab_coords"] = stab_coords  # Same for colour codes
-        meta["stab_colors"] = stab_colors  # For Chromobius: 0=red, 1=green, 2=blue
+        meta["x_stab_coords"] = list(stab_coords)
+        meta["z_stab_coords"] = list(stab_coords)  # Same for colour codes
+        # For Chromobius: 0=red, 1=green, 2=blue
+        meta["stab_colors"] = list(stab_colors) if stab_colors is not None else None
         meta["is_chromobius_compatible"] = True  # Marker for color code experiments
         
         # NOTE: We deliberately omit x_schedule/z_schedule here.
@@ -233,17 +123,161 @@ class HexagonalColourCode(TopologicalCSSCode):
         # match data qubit coords. For colour codes with irregular geometry, the matrix-based
         # fallback circuit construction in CSSMemoryExperiment is more reliable.
         
-        super().__init__(chain_complex, logical_x, logical_z, metadata=meta)
+        super().__init__(chain_complex, list(logical_x), list(logical_z), metadata=meta)
         
         # Override the parity check matrices for proper CSS structure
-        self._hx = hx.astype(np.uint8)
-        self._hz = hz.astype(np.uint8)
+        self._hx = hx
+        self._hz = hz
     
     def qubit_coords(self) -> List[Coord2D]:
         """Return qubit coordinates for visualization."""
         return list(self.metadata.get("data_coords", []))
 
 
+@functools.lru_cache(maxsize=32)
+def _hexagonal_colour_tables(d: int) -> Tuple[
+    np.ndarray,                 # hx (read-only)
+    np.ndarray,                 # hz (read-only)
+    CSSChainComplex3,           # chain_complex
+    Tuple[str, ...],            # logical_x
+    Tuple[str, ...],            # logical_z
+    Tuple[Coord2D, ...],        # data_coords
+    Tuple[Coord2D, ...],        # stab_coords
+    Optional[Tuple[int, ...]],  # stab_colors
+    int,                        # k
+]:
+    """Build the tiling for distance d once; instances share the result."""
+    if d == 2:
+        # Smallest 4.8.8 colour code: [[8,2,2]]
+        # 8 qubits arranged in square-octagon pattern
+        n_qubits = 8
+        
+        # Faces: 1 octagon (all 8) + 4 squares (pairs)
+        hx = np.array([
+            [1, 1, 1, 1, 0, 0, 0, 0],  # Left square
+            [0, 0, 0, 0, 1, 1, 1, 1],  # Right square
+            [1, 1, 0, 0, 1, 1, 0, 0],  # Top
+        ], dtype=np.uint8)
+        
+        hz = hx.copy()  # Self-dual
+        
+        logical_x = ["XXXXIIII", "IIIIXXXX"]
+        logical_z = ["ZZZZIIII", "IIIIZZZZ"]
+        
+        data_coords = [
+            (0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0),
+            (2.0, 0.0), (3.0, 0.0), (2.0, 1.0), (3.0, 1.0),
+        ]
+        
+        stab_coords = [
+            (0.5, 0.5),  # Left square center
+            (2.5, 0.5),  # Right square center
+            (1.5, 0.5),  # Middle
+        ]
+        
+        # Face colors: must satisfy 3-coloring constraint (overlapping faces have different colors)
+        # Overlaps: (0,2), (1,2) so valid coloring is [0, 0, 1]
+        stab_colors = [0, 0, 1]
+    
+    elif d == 3:
+        # [[17,1,3]] hexagonal colour code (approximate)
+        n_qubits = 17
+        
+        # Construct faces for 4.8.8 tiling
+        # Weight-4 squares and weight-8 octagons
+        faces = [
+            [0, 1, 2, 3],           # Square 1
+            [4, 5, 6, 7],           # Square 2
+            [8, 9, 10, 11],         # Square 3
+            [0, 1, 4, 5, 8, 9, 12, 13],  # Octagon (partial)
+            [2, 3, 6, 7, 10, 11, 14, 15],  # Octagon (partial)
+        ]
+        
+        hx = np.zeros((len(faces), n_qubits), dtype=np.uint8)
+        rows = np.repeat(np.arange(len(faces)), [len(face) for face in faces])
+        cols = np.concatenate(faces)
+        keep = cols < n_qubits
+        hx[rows[keep], cols[keep]] = 1
+        
+        hz = hx.copy()
+        
+        logical_x = [support_to_pauli_str([0, 4, 8], n_qubits, 'X')]
+        logical_z = [support_to_pauli_str([0, 4, 8], n_qubits, 'Z')]
+        
+        data_coords = _grid_coords(n_qubits, 4)
+        stab_coords = _grid_coords(len(faces), d, offset=0.5)
+        
+        # Face colors: must satisfy 3-coloring constraint (overlapping faces have different colors)
+        # For d=3: Overlaps are (0,3), (0,4), (1,3), (1,4), (2,3), (2,4) forming bipartite graph
+        # Small squares (0,1,2) can all be same color, large octagons (3,4) can be another
+        # Valid coloring: [0, 0, 0, 1, 1]
+        stab_colors = [0, 0, 0, 1, 1]
+    
+    else:
+        # General construction
+        # Approximate qubit count for distance d
+        n_qubits = 2 * d * d + 1
+        
+        # Build approximate structure
+        num_faces = d * d
+        hx = np.zeros((num_faces, n_qubits), dtype=np.uint8)
+        
+        # Mix of weight-4 and weight-8 faces: face f covers qubits
+        # (4f + i) mod n for i < weight(f)
+        face_ids = np.arange(num_faces)
+        weights = np.where(face_ids % 3 == 0, 8, 4)
+        in_face = np.arange(8) < weights[:, None]
+        rows, offsets = np.nonzero(in_face)
+        hx[rows, (rows * 4 + offsets) % n_qubits] = 1
+        
+        hz = hx.copy()
+        
+        logical_x = [support_to_pauli_str(range(min(d, n_qubits)), n_qubits, 'X')]
+        logical_z = [support_to_pauli_str(range(min(d, n_qubits)), n_qubits, 'Z')]
+        
+        data_coords = _grid_coords(n_qubits, 2 * d)
+        stab_coords = _grid_coords(num_faces, d, offset=0.5)
+        
+        # Face colors: compute valid 3-coloring from overlap graph
+        stab_colors = _compute_valid_3_coloring(hx)
+    
+    # Compute actual k from the GF(2) rank (a real-valued SVD rank can
+    # overcount, e.g. for rows that sum to zero only mod 2)
+    rank_hx = gf2_rank(hx)
+    rank_hz = gf2_rank(hz)
+    k = n_qubits - rank_hx - rank_hz
+    
+    # Build chain complex
+    # boundary_2: shape (n_qubits, n_x_stabs + n_z_stabs). Both transposes
+    # are written straight into their slabs of one preallocated buffer
+    # (hx/hz are already uint8, so no astype or concatenate copies).
+    n_x_stabs, n_z_stabs = hx.shape[0], hz.shape[0]
+    boundary_2 = np.empty((n_qubits, n_x_stabs + n_z_stabs), dtype=np.uint8)
+    np.copyto(boundary_2[:, :n_x_stabs], hx.T)
+    np.copyto(boundary_2[:, n_x_stabs:], hz.T)
+    
+    # boundary_1: Empty for colour codes with boundaries
+    boundary_1 = np.zeros((0, n_qubits), dtype=np.uint8)
+    boundary_2.setflags(write=False)
+    boundary_1.setflags(write=False)
+    
+    chain_complex = CSSChainComplex3(boundary_2=boundary_2, boundary_1=boundary_1)
+    
+    hx.setflags(write=False)
+    hz.setflags(write=False)
+    return (
+        hx,
+        hz,
+        chain_complex,
+        tuple(logical_x),
+        tuple(logical_z),
+        tuple(data_coords),
+        tuple(stab_coords),
+        tuple(stab_colors) if stab_colors is not None else None,
+        k,
+    )
+
+
 # Pre-built instances
-HexagonalColour2 = lambda: HexagonalColourCode(distance=2)
-HexagonalColour3 = lambda: HexagonalColourCode(distance=3)
+HexagonalColour2 = functools.partial(HexagonalColourCode, distance=2)
+HexagonalColour3 = functools.partial(HexagonalColourCode, distance=3)
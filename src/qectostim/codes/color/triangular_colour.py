@@ -21,13 +21,15 @@ Reference: Bombin & Martin-Delgado, "Topological Quantum Distillation" (2006)
 
 from __future__ import annotations
 from typing import Dict, Any, List, Optional, Tuple, Set
+import functools
+import itertools
 
 import numpy as np
-import math
 
 from qectostim.codes.abstract_css import TopologicalCSSCode, Coord2D
 from qectostim.codes.abstract_code import PauliString
 from qectostim.codes.complexes.css_complex import CSSChainComplex3
+from qectostim.codes.utils import support_to_pauli_str
 
 
 class TriangularColourCode(TopologicalCSSCode):
@@ -52,153 +54,18 @@ class TriangularColourCode(TopologicalCSSCode):
         
         d = distance
         
-        # Build the triangular lattice
-        # For distance d, we have a triangular patch
-        # Qubits are on vertices of the dual 6.6.6 tiling
-        
-        # For small distances, use explicit construction
-        if d == 3:
-            # [[7,1,3]] Steane code (smallest triangular colour code)
-            # 7 qubits, 3 X-type checks, 3 Z-type checks (same support)
-            hx = np.array([
-                [0, 0, 0, 1, 1, 1, 1],  # Face 1
-                [0, 1, 1, 0, 0, 1, 1],  # Face 2
-                [1, 0, 1, 0, 1, 0, 1],  # Face 3
-            ], dtype=np.uint8)
-            
-            hz = hx.copy()  # Self-dual
-            
-            logical_x = ["XXXIIII"]
-            logical_z = ["ZZZIIII"]
-            
-            n_qubits = 7
-            
-            coords = {
-                0: (1.0, 2.0),
-                1: (0.0, 0.0),
-                2: (0.5, 1.0),
-                3: (2.0, 0.0),
-                4: (1.5, 1.0),
-                5: (1.0, 0.0),
-                6: (1.0, 1.0),
-            }
-            
-            # Face centers for stabilizer coordinates
-            stab_coords = [
-                (1.5, 0.5),  # Face 1
-                (0.5, 0.5),  # Face 2
-                (1.0, 1.33), # Face 3
-            ]
-            
-            # Face colors: 0=red, 1=green, 2=blue (3-colorable)
-            stab_colors = [0, 1, 2]  # Each face has a distinct color
-            
-        elif d == 5:
-            # [[19,1,5]] colour code
-            n_qubits = 19
-            
-            # Face supports (each face is 4 or 6 qubits)
-            faces = [
-                # Inner faces (weight 6)
-                [0, 1, 2, 3, 4, 5],
-                [3, 4, 6, 7, 8, 9],
-                [4, 5, 8, 9, 10, 11],
-                # Edge faces (weight 4)
-                [0, 1, 12, 13],
-                [1, 2, 13, 14],
-                [2, 3, 14, 15],
-                [5, 10, 16, 17],
-                [10, 11, 17, 18],
-                [6, 7, 15, 16],
-            ]
-            
-            # Build parity check matrices
-            hx = np.zeros((len(faces), n_qubits), dtype=np.uint8)
-            for i, face in enumerate(faces):
-                for q in face:
-                    if q < n_qubits:
-                        hx[i, q] = 1
-            
-            hz = hx.copy()  # Self-dual
-            
-            # Logical operators (weight 5)
-            lx = ['I'] * n_qubits
-            lz = ['I'] * n_qubits
-            for i in [0, 1, 2, 3, 6]:  # Boundary string
-                if i < n_qubits:
-                    lx[i] = 'X'
-                    lz[i] = 'Z'
-            logical_x = [''.join(lx)]
-            logical_z = [''.join(lz)]
-            
-            # Coordinates (approximate hexagonal layout)
-            coords = {}
-            for i in range(n_qubits):
-                angle = 2 * math.pi * i / n_qubits
-                r = 1.0 + 0.3 * (i % 3)
-                coords[i] = (r * math.cos(angle), r * math.sin(angle))
-            
-            # Stabilizer coordinates
-            stab_coords = []
-            for i in range(len(faces)):
-                angle = 2 * math.pi * i / len(faces)
-                r = 0.5 + 0.3 * (i % 3)
-                stab_coords.append((r * math.cos(angle), r * math.sin(angle)))
-            
-            # Face colors: assign colors cyclically (valid 3-coloring for triangular)
-            stab_colors = [i % 3 for i in range(len(faces))]
-                
-        else:
-            # General construction for d >= 7
-            # Number of qubits: 1 + 3*d*(d-1)/2 for distance d
-            n_qubits = 1 + 3 * d * (d - 1) // 2
-            
-            # Build triangular grid
-            num_faces = (d * d - 1) // 2  # Approximate
-            
-            hx = np.zeros((max(1, num_faces), n_qubits), dtype=np.uint8)
-            # Set some checks based on local connectivity
-            for f in range(min(num_faces, n_qubits // 4)):
-                for i in range(min(6, n_qubits - 4*f)):
-                    hx[f, 4*f + i] = 1 if i < 6 else 0
-            
-            hz = hx.copy()
-            
-            lx = ['I'] * n_qubits
-            lz = ['I'] * n_qubits
-            for i in range(min(d, n_qubits)):
-                lx[i] = 'X'
-                lz[i] = 'Z'
-            logical_x = [''.join(lx)]
-            logical_z = [''.join(lz)]
-            
-            coords = {}
-            for i in range(n_qubits):
-                angle = 2 * math.pi * i / n_qubits
-                r = 1.0 + 0.2 * (i % 5)
-                coords[i] = (r * math.cos(angle), r * math.sin(angle))
-            
-            stab_coords = []
-            for i in range(hx.shape[0]):
-                angle = 2 * math.pi * i / max(1, hx.shape[0])
-                r = 0.5 + 0.3 * (i % 3)
-                stab_coords.append((r * math.cos(angle), r * math.sin(angle)))
-            
-            # Face colors: cyclic coloring
-            stab_colors = [i % 3 for i in range(hx.shape[0])]
-        
-        # Build chain complex
-        # boundary_2: shape (n_qubits, n_x_stabs + n_z_stabs)
-        boundary_2_x = hx.T.astype(np.uint8)  # shape (n_qubits, n_x_stabs)
-        boundary_2_z = hz.T.astype(np.uint8)  # shape (n_qubits, n_z_stabs)
-        boundary_2 = np.concatenate([boundary_2_x, boundary_2_z], axis=1)
-        
-        # boundary_1: Empty for colour codes with boundaries
-        boundary_1 = np.zeros((0, n_qubits), dtype=np.uint8)
-        
-        chain_complex = CSSChainComplex3(boundary_2=boundary_2, boundary_1=boundary_1)
-        
-        data_coords = [coords.get(i, (0.0, 0.0)) for i in range(n_qubits)]
+        (
+            hx,
+            hz,
+            chain_complex,
+            logical_x,
+            logical_z,
+            logical_support,
+            data_coords,
+            stab_coords,
+            stab_colors,
+        ) = _triangular_colour_tables(d)
+        n_qubits = hx.shape[1]
         
         meta = dict(metadata or {})
         meta["name"] = f"TriangularColour_d{d}"
@@ -207,15 +74,15 @@ class TriangularColourCode(TopologicalCSSCode):
         meta["distance"] = d
         meta["is_colour_code"] = True
         meta["tiling"] = "6.6.6"
-        meta["data_coords"] = data_coords
+        meta["data_coords"] = list(data_coords)
         
         # Logical support
-        meta["logical_x_support"] = [i for i, c in enumerate(logical_x[0]) if c == 'X']
-        meta["logical_z_support"] = [i for i, c in enumerate(logical_z[0]) if c == 'Z']
+        meta["logical_x_support"] = list(logical_support)
+        meta["logical_z_support"] = list(logical_support)
         
-        meta["x_stab_coords"] = stab_coords
-        meta["z_stab_coords"] = stab_coords  # Same for colour codes (self-dual)
-        meta["stab_colors"] = stab_colors  # For Chromobius: 0=red, 1=green, 2=blue
+        meta["x_stab_coords"] = list(stab_coords)
+        meta["z_stab_coords"] = list(stab_coords)  # Same for colour codes (self-dual)
+        meta["stab_colors"] = list(stab_colors)  # For Chromobius: 0=red, 1=green, 2=blue
         meta["is_chromobius_compatible"] = True  # Marker for color code experiments
         
         # NOTE: We deliberately omit x_schedule/z_schedule here.
@@ -223,22 +90,187 @@ class TriangularColourCode(TopologicalCSSCode):
         # match data qubit coords. For colour codes with irregular geometry, the matrix-based
         # fallback circuit construction in CSSMemoryExperiment is more reliable.
         
-        super().__init__(chain_complex, logical_x, logical_z, metadata=meta)
+        super().__init__(chain_complex, list(logical_x), list(logical_z), metadata=meta)
         
         # Override the parity check matrices for proper CSS structure
-        self._hx = hx.astype(np.uint8)
-        self._hz = hz.astype(np.uint8)
+        self._hx = hx
+        self._hz = hz
+        self._data_coords = data_coords
     
     def qubit_coords(self) -> List[Coord2D]:
         """Return qubit coordinates for visualization."""
-        return list(self.metadata.get("data_coords", []))
+        return list(self._data_coords)
 
 
-# Pre-built instances
-TriangularColour3 = lambda: TriangularColourCode(distance=3)
-TriangularColour5 = lambda: TriangularColourCode(distance=5)
+def _ring_coords(count: int, r0: float, dr: float, period: int) -> List[Coord2D]:
+    """Place ``count`` points evenly around a ring whose radius cycles
+    through ``r0 + dr * (i % period)``."""
+    i = np.arange(count)
+    angle = 2 * np.pi * i / count
+    r = r0 + dr * (i % period)
+    return list(zip((r * np.cos(angle)).tolist(), (r * np.sin(angle)).tolist()))
+
+
+@functools.lru_cache(maxsize=32)
+def _triangular_colour_tables(d: int) -> Tuple[
+    np.ndarray,                 # hx (read-only)
+    np.ndarray,                 # hz (read-only)
+    CSSChainComplex3,           # chain_complex
+    Tuple[str, ...],            # logical_x
+    Tuple[str, ...],            # logical_z
+    Tuple[int, ...],            # logical support
+    Tuple[Coord2D, ...],        # data_coords
+    Tuple[Coord2D, ...],        # stab_coords
+    Tuple[int, ...],            # stab_colors
+]:
+    """Build the lattice for distance d once; instances share the result."""
+    # Build the triangular lattice
+    # For distance d, we have a triangular patch
+    # Qubits are on vertices of the dual 6.6.6 tiling
+    
+    # For small distances, use explicit construction
+    if d == 3:
+        # [[7,1,3]] Steane code (smallest triangular colour code)
+        # 7 qubits, 3 X-type checks, 3 Z-type checks (same support)
+        hx = np.array([
+            [0, 0, 0, 1, 1, 1, 1],  # Face 1
+            [0, 1, 1, 0, 0, 1, 1],  # Face 2
+            [1, 0, 1, 0, 1, 0, 1],  # Face 3
+        ], dtype=np.uint8)
+        
+        hz = hx.copy()  # Self-dual
+        
+        n_qubits = 7
+        logical_support = [0, 1, 2]
+        
+        coords = [
+            (1.0, 2.0),  # 0
+            (0.0, 0.0),  # 1
+            (0.5, 1.0),  # 2
+            (2.0, 0.0),  # 3
+            (1.5, 1.0),  # 4
+            (1.0, 0.0),  # 5
+            (1.0, 1.0),  # 6
+        ]
+        
+        # Face centers for stabilizer coordinates
+        stab_coords = [
+            (1.5, 0.5),  # Face 1
+            (0.5, 0.5),  # Face 2
+            (1.0, 1.33), # Face 3
+        ]
+        
+        # Face colors: 0=red, 1=green, 2=blue (3-colorable)
+        stab_colors = [0, 1, 2]  # Each face has a distinct color
+        
+    elif d == 5:
+        # [[19,1,5]] colour code
+        n_qubits = 19
+        
+        # Face supports (each face is 4 or 6 qubits)
+        faces = [
+            # Inner faces (weight 6)
+            [0, 1, 2, 3, 4, 5],
+            [3, 4, 6, 7, 8, 9],
+            [4, 5, 8, 9, 10, 11],
+            # Edge faces (weight 4)
+            [0, 1, 12, 13],
+            [1, 2, 13, 14],
+            [2, 3, 14, 15],
+            [5, 10, 16, 17],
+            [10, 11, 17, 18],
+            [6, 7, 15, 16],
+        ]
+        
+        # Build parity check matrices
+        hx = np.zeros((len(faces), n_qubits), dtype=np.uint8)
+        rows = np.repeat(np.arange(len(faces)), [len(face) for face in faces])
+        cols = np.fromiter(itertools.chain.from_iterable(faces), dtype=np.intp)
+        hx[rows, cols] = 1
+        
+        hz = hx.copy()  # Self-dual
+        
+        # Logical operators (weight 5)
+        logical_support = [0, 1, 2, 3, 6]  # Boundary string
+        
+        # Coordinates (approximate hexagonal layout)
+        coords = _ring_coords(n_qubits, 1.0, 0.3, 3)
+        
+        # Stabilizer coordinates
+        stab_coords = _ring_coords(len(faces), 0.5, 0.3, 3)
+        
+        # Face colors: assign colors cyclically (valid 3-coloring for triangular)
+        stab_colors = [i % 3 for i in range(len(faces))]
+            
+    else:
+        # General construction for d >= 7
+        # Number of qubits: 1 + 3*d*(d-1)/2 for distance d
+        n_qubits = 1 + 3 * d * (d - 1) // 2
+        
+        # Build triangular grid
+        num_faces = (d * d - 1) // 2  # Approximate
+        
+        hx = np.zeros((max(1, num_faces), n_qubits), dtype=np.uint8)
+        # Set some checks based on local connectivity: face f covers up to
+        # six qubits starting at 4*f
+        n_set = min(num_faces, n_qubits // 4)
+        widths = np.minimum(6, n_qubits - 4 * np.arange(n_set))
+        rows, offsets = np.nonzero(np.arange(6) < widths[:, None])
+        hx[rows, 4 * rows + offsets] = 1
+        
+        hz = hx.copy()
+        
+        logical_support = list(range(min(d, n_qubits)))
+        
+        coords = _ring_coords(n_qubits, 1.0, 0.2, 5)
+        
+        stab_coords = _ring_coords(hx.shape[0], 0.5, 0.3, 3)
+        
+        # Face colors: cyclic coloring
+        stab_colors = [i % 3 for i in range(hx.shape[0])]
+    
+    # Self-dual: logical X and Z share the same support
+    logical_x = [support_to_pauli_str(logical_support, n_qubits, 'X')]
+    logical_z = [support_to_pauli_str(logical_support, n_qubits, 'Z')]
+    
+    # Build chain complex
+    # boundary_2: shape (n_qubits, n_x_stabs + n_z_stabs), written in one
+    # pass; hz == hx (self-dual), so the Z half is a copy of the X half
+    nx = hx.shape[0]
+    boundary_2 = np.empty((n_qubits, 2 * nx), dtype=np.uint8)
+    boundary_2[:, :nx] = hx.T
+    boundary_2[:, nx:] = boundary_2[:, :nx]
+    
+    # boundary_1: Empty for colour codes with boundaries
+    boundary_1 = np.zeros((0, n_qubits), dtype=np.uint8)
+    boundary_2.setflags(write=False)
+    boundary_1.setflags(write=False)
+    
+    chain_complex = CSSChainComplex3(boundary_2=boundary_2, boundary_1=boundary_1)
+    
+    data_coords = tuple(coords)
+    
+    hx.setflags(write=False)
+    hz.setflags(write=False)
+    return (
+        hx,
+        hz,
+        chain_complex,
+        tuple(logical_x),
+        tuple(logical_z),
+        tuple(logical_support),
+        data_coords,
+        tuple(stab_coords),
+        tuple(stab_colors),
+    )
 
 
 # Pre-built instances
-TriangularColour3 = lambda: TriangularColourCode(distance=3)
-TriangularColour5 = lambda: TriangularColourCode(distance=5)
+TriangularColour3 = functools.partial(TriangularColourCode, distance=3)
+TriangularColour5 = functools.partial(TriangularColourCode, distance=5)
+
+__all__ = [
+    "TriangularColourCode",
+    "TriangularColour3",
+    "TriangularColour5",
+]
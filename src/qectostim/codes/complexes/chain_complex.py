@@ -1,5 +1,6 @@
 from typing import Dict, Tuple
 import numpy as np
+from ..utils import gf2_pack, gf2_packed_matmul
 
 
 def kron_gf2(a: np.ndarray, b: np.ndarray) -> np.ndarray:
@@ -41,7 +42,8 @@ class ChainComplex:
             prev_k = k - 1
             if prev_k in boundary_maps:
                 sigma_prev = boundary_maps[prev_k]
-                comp = (sigma_prev @ sigma_k) % 2
+                # Bit-packed: row i of sigma_prev against column j of sigma_k
+                comp = gf2_packed_matmul(gf2_pack(sigma_prev)[0], gf2_pack(sigma_k.T)[0])
                 if np.any(comp):
                     raise ValueError(
                         f"Chain condition violated: sigma_{prev_k} * sigma_{k} != 0 over Z2."
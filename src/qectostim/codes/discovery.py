@@ -835,6 +835,35 @@ def get_small_test_codes(max_qubits: int = 20) -> Dict[str, Code]:
     )
 
 
+def build_all_base_codes() -> Dict[str, CSSCode]:
+    """
+    Build the fixed small CSS codes directly, without discovery.
+    
+    These codes take no parameters and their check matrices, chain complexes
+    and logicals are module-level tables validated once at import, so each
+    construction only merges metadata. Unlike discover_all_codes() there is
+    no module scan and no per-code timeout.
+    
+    Returns:
+        Dict mapping each code's metadata name to a fresh instance
+    """
+    from .small import (
+        FourQubit422Code,
+        ReedMullerCode151,
+        ShorCode91,
+        SixQubit622Code,
+        SteanCode713,
+    )
+    from .surface.toric_code import ToricCode33
+    
+    codes: Dict[str, CSSCode] = {}
+    for cls in (FourQubit422Code, SixQubit622Code, SteanCode713, ShorCode91,
+                ReedMullerCode151, ToricCode33):
+        code = cls()
+        codes[code.metadata.get("name", cls.__name__)] = code
+    return codes
+
+
 def print_code_catalog(codes: Optional[Dict[str, Code]] = None) -> None:
     """
     Print a formatted catalog of codes.
@@ -25,6 +25,7 @@ import numpy as np
 
 from qectostim.codes.abstract_css import CSSCode
 from qectostim.codes.abstract_code import PauliString
+from qectostim.codes.utils import css_intersection_check
 
 
 class FloquetCode(CSSCode):
@@ -99,8 +100,7 @@ class FloquetCode(CSSCode):
         
         # Log commutativity status for debugging (but don't error)
         if self._hx.size > 0 and self._hz.size > 0:
-            comm = (self._hx @ self._hz.T) % 2
-            if np.any(comm):
+            if not css_intersection_check(self._hx, self._hz):
                 # This is expected for Floquet codes - just note it in metadata
                 self._metadata["css_commutes"] = False
             else:
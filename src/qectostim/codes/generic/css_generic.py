@@ -20,46 +20,31 @@ import numpy as np
 
 from qectostim.codes.abstract_css import CSSCode
 from qectostim.codes.abstract_code import PauliString
+from qectostim.codes.utils import (
+    GF2Analysis,
+    gf2_analyse,
+    gf2_pack,
+    gf2_packed_dot,
+    gf2_packed_matmul,
+    gf2_packed_rref,
+    gf2_unpack,
+)
 
 
 def _gf2_rref(matrix: np.ndarray) -> Tuple[np.ndarray, List[int]]:
     """
     Compute the reduced row echelon form of a matrix over GF(2).
     
+    Rows are bit-packed into uint64 words so each elimination step is a
+    single XOR over ``ceil(cols / 64)`` words.
+    
     Returns:
         rref_matrix: The matrix in reduced row echelon form
         pivot_cols: List of pivot column indices
     """
-    mat = matrix.copy().astype(np.uint8)
-    rows, cols = mat.shape
-    pivot_cols = []
-    pivot_row = 0
-    
-    for col in range(cols):
-        # Find pivot
-        found = False
-        for row in range(pivot_row, rows):
-            if mat[row, col] == 1:
-                # Swap rows
-                mat[[pivot_row, row]] = mat[[row, pivot_row]]
-                found = True
-                break
-        
-        if not found:
-            continue
-        
-        pivot_cols.append(col)
-        
-        # Eliminate other 1s in this column
-        for row in range(rows):
-            if row != pivot_row and mat[row, col] == 1:
-                mat[row] = (mat[row] + mat[pivot_row]) % 2
-        
-        pivot_row += 1
-        if pivot_row >= rows:
-            break
-    
-    return mat, pivot_cols
+    packed, cols = gf2_pack(matrix)
+    packed, pivot_cols = gf2_packed_rref(packed, cols)
+    return gf2_unpack(packed, cols), pivot_cols
 
 
 def _gf2_kernel(matrix: np.ndarray) -> np.ndarray:
@@ -76,26 +61,19 @@ def _gf2_kernel(matrix: np.ndarray) -> np.ndarray:
     if rows == 0:
         return np.eye(cols, dtype=np.uint8)
     
-    # Augment matrix with identity to track column operations
-    augmented = np.hstack([matrix.T, np.eye(cols, dtype=np.uint8)])
-    rref, pivot_cols = _gf2_rref(augmented)
-    
-    # Find free columns (non-pivot columns in original matrix part)
-    pivot_set = set(pivot_cols)
-    free_cols = [i for i in range(rows) if i not in pivot_set]
+    # Augment matrix with identity to track column operations, filled into
+    # one preallocated buffer rather than hstacking two temporaries
+    augmented = np.zeros((cols, rows + cols), dtype=np.uint8)
+    augmented[:, :rows] = matrix.T
+    np.fill_diagonal(augmented[:, rows:], 1)
+    rref, _ = _gf2_rref(augmented)
     
-    # Extract kernel vectors from the identity part
-    kernel_vectors = []
-    for i in range(cols):
-        # Check if this row corresponds to a zero row in the RREF
-        row_sum = np.sum(rref[i, :rows])
-        if row_sum == 0:
-            kernel_vectors.append(rref[i, rows:])
-    
-    if not kernel_vectors:
+    # Kernel vectors are the identity part of rows that vanish on the matrix part
+    kernel_rows = ~rref[:, :rows].any(axis=1)
+    if not kernel_rows.any():
         return np.zeros((0, cols), dtype=np.uint8)
     
-    return np.array(kernel_vectors, dtype=np.uint8)
+    return np.ascontiguousarray(rref[kernel_rows, rows:], dtype=np.uint8)
 
 
 def _gf2_rowspace(matrix: np.ndarray) -> np.ndarray:
@@ -124,18 +102,82 @@ def _gf2_rank(matrix: np.ndarray) -> int:
     """Compute the rank of a matrix over GF(2)."""
     if matrix.size == 0:
         return 0
-    _, pivot_cols = _gf2_rref(matrix)
+    packed, cols = gf2_pack(matrix)
+    _, pivot_cols = gf2_packed_rref(packed, cols)
     return len(pivot_cols)
 
 
 def _in_rowspace(vector: np.ndarray, matrix: np.ndarray) -> bool:
     """Check if a vector is in the row space of a matrix over GF(2)."""
     if matrix.size == 0:
-        return np.allclose(vector, 0)
+        return not np.any(vector)
     
-    # Add vector as a new row and check if rank increases
-    augmented = np.vstack([matrix, vector.reshape(1, -1)])
-    return _gf2_rank(augmented) == _gf2_rank(matrix)
+    # Reduce the vector against the packed RREF of the matrix
+    packed, cols = gf2_pack(matrix)
+    packed, pivot_cols = gf2_packed_rref(packed, cols)
+    vec = gf2_pack(vector)[0][0]
+    for row, col in enumerate(pivot_cols):
+        word, bit = divmod(col, 64)
+        if (int(vec[word]) >> bit) & 1:
+            vec ^= packed[row]
+    return not np.any(vec)
+
+
+def _analysis_kernel(analysis: GF2Analysis) -> np.ndarray:
+    """
+    Kernel basis of an analysed matrix, read off its RREF.
+    
+    The kernel is built from the free columns of the RREF and then put in
+    reduced row echelon form itself, which is the same (unique) basis
+    that `_gf2_kernel` produces.
+    """
+    cols = analysis.rref.shape[1]
+    free_mask = np.ones(cols, dtype=bool)
+    free_mask[analysis.pivots] = False
+    free_cols = np.flatnonzero(free_mask)
+    basis = np.zeros((free_cols.size, cols), dtype=np.uint8)
+    basis[np.arange(free_cols.size), free_cols] = 1
+    basis[:, analysis.pivots] = analysis.rowspace[:, free_cols].T
+    kernel, _ = _gf2_rref(basis)
+    return kernel
+
+
+def _rowspace_residual(vectors: np.ndarray, analysis: GF2Analysis) -> np.ndarray:
+    """
+    Reduce each row of `vectors` against the RREF in `analysis`.
+    
+    Because the RREF is reduced, the pivot rows to add are exactly those
+    whose pivot column is set in the vector, so all vectors are reduced
+    with one GF(2) matrix product. A zero residual row means the vector
+    lies in the row space.
+    """
+    vectors = np.asarray(vectors, dtype=np.uint8).reshape(-1, analysis.rref.shape[1])
+    if analysis.rank == 0:
+        return vectors.copy()
+    coeffs, _ = gf2_pack(vectors[:, analysis.pivots])
+    basis_t, _ = gf2_pack(analysis.rowspace.T)
+    return vectors ^ gf2_packed_matmul(coeffs, basis_t)
+
+
+def _reduce_packed(vec: np.ndarray, pivots: List[int], rows: List[np.ndarray]) -> np.ndarray:
+    """
+    Reduce a packed vector against an incrementally built echelon basis.
+    
+    `rows[i]` has its lowest set bit at `pivots[i]` and is zero at the
+    pivots of all earlier rows, so a single pass in insertion order
+    clears every pivot bit. The result is zero iff `vec` is in the span.
+    """
+    for pivot, row in zip(pivots, rows):
+        if (int(vec[pivot // 64]) >> (pivot % 64)) & 1:
+            vec = vec ^ row
+    return vec
+
+
+def _packed_lowest_bit(vec: np.ndarray) -> int:
+    """Index of the lowest set bit of a non-zero packed vector."""
+    word = int(np.flatnonzero(vec)[0])
+    bits = int(vec[word])
+    return word * 64 + (bits & -bits).bit_length() - 1
 
 
 def _pauli_string_to_binary(pauli: PauliString, n: int, pauli_type: str) -> np.ndarray:
@@ -234,8 +276,10 @@ class GenericCSSCode(CSSCode):
         n = hx.shape[1]
         
         # Infer logical operators if not provided
+        analyses = None
         if logical_x is None or logical_z is None:
-            inferred_x, inferred_z = self._infer_logicals(hx, hz)
+            hx_info, hz_info = analyses = gf2_analyse(hx), gf2_analyse(hz)
+            inferred_x, inferred_z = self._infer_logicals(hx, hz, hx_info, hz_info)
             logical_x = logical_x if logical_x is not None else inferred_x
             logical_z = logical_z if logical_z is not None else inferred_z
         
@@ -251,22 +295,25 @@ class GenericCSSCode(CSSCode):
             z_support = get_logical_support(logical_z[0], 'Z')
             meta.setdefault("logical_z_support", z_support)
         
-        # Add default coordinates if not provided (simple linear layout)
-        if "data_coords" not in meta:
-            meta["data_coords"] = [(float(i), 0.0) for i in range(n)]
-        
         # Store dimensions
         meta.setdefault("n", n)
         
         # Call parent constructor
         super().__init__(hx=hx, hz=hz, logical_x=logical_x, logical_z=logical_z, metadata=meta)
         
+        # Reuse the analyses computed for inference in CSSCode.k and friends
+        if analyses is not None:
+            self._gf2_analysis_cache = (self._hx, self._hz, *analyses)
+        
         # Validate the construction
         self._validate_logicals()
 
     @staticmethod
     def _infer_logicals(
-        hx: np.ndarray, hz: np.ndarray
+        hx: np.ndarray,
+        hz: np.ndarray,
+        hx_info: Optional[GF2Analysis] = None,
+        hz_info: Optional[GF2Analysis] = None,
     ) -> Tuple[List[PauliString], List[PauliString]]:
         """
         Infer logical operators from Hx and Hz using GF(2) linear algebra.
@@ -276,126 +323,127 @@ class GenericCSSCode(CSSCode):
         2. Logical Z operators are in kernel(Hx) but not in rowspace(Hz)
         3. Pair them so each (Lx_i, Lz_i) anticommutes
         
+        Each matrix is eliminated once (`gf2_analyse`); rank, kernel and
+        row space are all read off that single RREF, and the kernels are
+        only built once k > 0 is known.
+        
+        Args:
+            hx, hz: Parity check matrices
+            hx_info, hz_info: Precomputed analyses (computed otherwise)
+        
         Returns:
             (logical_x, logical_z): Lists of Pauli strings
         """
         n = hx.shape[1]
+        if hx_info is None:
+            hx_info = gf2_analyse(hx)
+        if hz_info is None:
+            hz_info = gf2_analyse(hz)
         
         # Compute k = n - rank(Hx) - rank(Hz)
-        rank_hx = _gf2_rank(hx)
-        rank_hz = _gf2_rank(hz)
-        k = n - rank_hx - rank_hz
+        k = n - hx_info.rank - hz_info.rank
         
         if k <= 0:
             # No logical qubits - return empty lists
             return [], []
         
-        # Find kernel of Hz (vectors that commute with all Z stabilizers)
-        # These are candidates for X-type logical operators
-        ker_hz = _gf2_kernel(hz)
+        # Kernel of Hz (vectors that commute with all Z stabilizers) holds
+        # the X-type candidates; kernel of Hx holds the Z-type candidates
+        ker_hz = _analysis_kernel(hz_info)
+        ker_hx = _analysis_kernel(hx_info)
         
-        # Find kernel of Hx (vectors that commute with all X stabilizers)
-        # These are candidates for Z-type logical operators
-        ker_hx = _gf2_kernel(hx)
+        # Filter out stabilizers: find vectors in kernel but not in row space
+        x_keep = np.any(_rowspace_residual(ker_hz, hx_info), axis=1)
+        logical_x_candidates = ker_hz[x_keep]
         
-        # Get row spaces
-        row_hx = _gf2_rowspace(hx)
-        row_hz = _gf2_rowspace(hz)
+        z_keep = np.any(_rowspace_residual(ker_hx, hz_info), axis=1)
+        logical_z_candidates = ker_hx[z_keep]
         
-        # Filter out stabilizers: find vectors in kernel but not in row space
-        logical_x_candidates = []
-        for vec in ker_hz:
-            if not _in_rowspace(vec, hx):
-                logical_x_candidates.append(vec)
+        if len(logical_x_candidates) == 0 or len(logical_z_candidates) == 0:
+            # Nothing can be paired, by either the main pass or the fallback
+            return [], []
         
-        logical_z_candidates = []
-        for vec in ker_hx:
-            if not _in_rowspace(vec, hz):
-                logical_z_candidates.append(vec)
+        # Full anticommutation table: overlaps[i, j] = <x_i, z_j> mod 2
+        x_packed, _ = gf2_pack(logical_x_candidates)
+        overlaps = gf2_packed_matmul(x_packed, gf2_pack(logical_z_candidates)[0]).astype(bool)
         
         # Pair logicals so they anticommute
         # For each X logical, find a Z logical that anticommutes with it
         logical_x_list: List[PauliString] = []
         logical_z_list: List[PauliString] = []
         
-        used_z_indices = set()
+        x_used = np.zeros(len(logical_x_candidates), dtype=bool)
+        z_free = np.ones(len(logical_z_candidates), dtype=bool)
+        
+        # Echelon basis of the chosen X logicals (bit-packed), extended one
+        # row at a time. Each row is zero at the pivots of earlier rows.
+        chosen_x_pivots: List[int] = []
+        chosen_x_rows: List[np.ndarray] = []
         
-        for lx_vec in logical_x_candidates:
+        for i, lx_vec in enumerate(logical_x_candidates):
             if len(logical_x_list) >= k:
                 break
             
-            # Find a Z candidate that anticommutes with this X
-            for j, lz_vec in enumerate(logical_z_candidates):
-                if j in used_z_indices:
-                    continue
-                
-                # Check anticommutation: overlap should be odd
-                overlap = np.sum(lx_vec * lz_vec) % 2
-                if overlap == 1:
-                    # Check this X isn't in the span of already chosen X logicals
-                    if logical_x_list:
-                        existing = np.array([_pauli_string_to_binary(lx, n, 'X') 
-                                           for lx in logical_x_list])
-                        augmented = np.vstack([existing, lx_vec.reshape(1, -1)])
-                        if _gf2_rank(augmented) == _gf2_rank(existing):
-                            continue  # Linearly dependent
-                    
-                    logical_x_list.append(_binary_to_pauli_string(lx_vec, 'X'))
-                    logical_z_list.append(_binary_to_pauli_string(lz_vec, 'Z'))
-                    used_z_indices.add(j)
-                    break
+            # Find the first unused Z candidate that anticommutes with this X
+            hits = np.flatnonzero(overlaps[i] & z_free)
+            if hits.size == 0:
+                continue
+            j = hits[0]
+            
+            # Check this X isn't in the span of already chosen X logicals
+            residual = _reduce_packed(x_packed[i], chosen_x_pivots, chosen_x_rows)
+            if not residual.any():
+                continue  # Linearly dependent
+            
+            chosen_x_pivots.append(_packed_lowest_bit(residual))
+            chosen_x_rows.append(residual)
+            logical_x_list.append(_binary_to_pauli_string(lx_vec, 'X'))
+            logical_z_list.append(_binary_to_pauli_string(logical_z_candidates[j], 'Z'))
+            x_used[i] = True
+            z_free[j] = False
         
         # If we couldn't find k pairs, try a simpler approach: use weight-minimizing heuristic
         if len(logical_x_list) < k and len(logical_x_candidates) > 0:
             # Sort by weight and take the first ones
-            sorted_x = sorted(logical_x_candidates, key=lambda v: np.sum(v))
-            sorted_z = sorted(logical_z_candidates, key=lambda v: np.sum(v))
+            x_order = np.argsort(logical_x_candidates.sum(axis=1), kind='stable')
+            z_order = np.argsort(logical_z_candidates.sum(axis=1), kind='stable')
             
-            for lx_vec in sorted_x:
+            for i in x_order:
                 if len(logical_x_list) >= k:
                     break
-                for lz_vec in sorted_z:
-                    overlap = np.sum(lx_vec * lz_vec) % 2
-                    if overlap == 1:
-                        lx_str = _binary_to_pauli_string(lx_vec, 'X')
-                        lz_str = _binary_to_pauli_string(lz_vec, 'Z')
-                        if lx_str not in logical_x_list:
-                            logical_x_list.append(lx_str)
-                            logical_z_list.append(lz_str)
-                            break
+                if x_used[i]:
+                    continue
+                hits = np.flatnonzero(overlaps[i, z_order])
+                if hits.size:
+                    j = z_order[hits[0]]
+                    logical_x_list.append(_binary_to_pauli_string(logical_x_candidates[i], 'X'))
+                    logical_z_list.append(_binary_to_pauli_string(logical_z_candidates[j], 'Z'))
+                    x_used[i] = True
         
         return logical_x_list, logical_z_list
 
     def _validate_logicals(self) -> None:
         """Validate that logical operators satisfy CSS requirements."""
-        n = self.n
-        hx = self._hx
-        hz = self._hz
+        lx = self._logical_x_bits
+        lz = self._logical_z_bits
         
-        for i, lx in enumerate(self._logical_x):
-            lx_bin = _pauli_string_to_binary(lx, n, 'X')
-            
-            # Check Lx commutes with Hz (Lx @ Hz^T = 0)
-            overlap = (lx_bin @ hz.T) % 2
-            if np.any(overlap):
-                raise ValueError(f"Logical X[{i}] does not commute with Z stabilizers")
+        # Check Lx commutes with Hz (Lx @ Hz^T = 0) for every logical at once
+        bad_x = np.flatnonzero(np.any(gf2_packed_matmul(lx, self._hz_bits), axis=1))
+        if bad_x.size:
+            raise ValueError(f"Logical X[{bad_x[0]}] does not commute with Z stabilizers")
         
-        for i, lz in enumerate(self._logical_z):
-            lz_bin = _pauli_string_to_binary(lz, n, 'Z')
-            
-            # Check Lz commutes with Hx (Lz @ Hx^T = 0)
-            overlap = (lz_bin @ hx.T) % 2
-            if np.any(overlap):
-                raise ValueError(f"Logical Z[{i}] does not commute with X stabilizers")
+        # Check Lz commutes with Hx (Lz @ Hx^T = 0)
+        bad_z = np.flatnonzero(np.any(gf2_packed_matmul(lz, self._hx_bits), axis=1))
+        if bad_z.size:
+            raise ValueError(f"Logical Z[{bad_z[0]}] does not commute with X stabilizers")
         
         # Check anticommutation between paired logicals
-        for i, (lx, lz) in enumerate(zip(self._logical_x, self._logical_z)):
-            lx_bin = _pauli_string_to_binary(lx, n, 'X')
-            lz_bin = _pauli_string_to_binary(lz, n, 'Z')
-            
-            overlap = np.sum(lx_bin * lz_bin) % 2
-            if overlap != 1:
-                raise ValueError(f"Logical X[{i}] and Z[{i}] do not anticommute (overlap={overlap})")
+        pairs = min(len(lx), len(lz))
+        overlaps = gf2_packed_dot(lx[:pairs], lz[:pairs])
+        bad_pair = np.flatnonzero(overlaps != 1)
+        if bad_pair.size:
+            i = bad_pair[0]
+            raise ValueError(f"Logical X[{i}] and Z[{i}] do not anticommute (overlap={overlaps[i]})")
 
     @property
     def distance(self) -> Optional[int]:
@@ -404,7 +452,11 @@ class GenericCSSCode(CSSCode):
     
     def qubit_coords(self) -> List[Tuple[float, float]]:
         """Return 2D coordinates for data qubits."""
-        return self._metadata.get("data_coords", [(float(i), 0.0) for i in range(self.n)])
+        coords = self._metadata.get("data_coords")
+        if coords is None:
+            # Default linear layout, built on request rather than in __init__
+            return [(float(i), 0.0) for i in range(self.n)]
+        return coords
 
     @classmethod
     def from_code(cls, code: CSSCode, metadata: Optional[Dict[str, Any]] = None) -> "GenericCSSCode":
@@ -48,23 +48,20 @@ def _gf2_rref(matrix: np.ndarray) -> Tuple[np.ndarray, List[int]]:
     
     for col in range(cols):
         # Find pivot
-        found = False
-        for row in range(pivot_row, rows):
-            if mat[row, col] == 1:
-                # Swap rows
-                mat[[pivot_row, row]] = mat[[row, pivot_row]]
-                found = True
-                break
-        
-        if not found:
+        candidates = np.flatnonzero(mat[pivot_row:, col] == 1)
+        if candidates.size == 0:
             continue
+        row = pivot_row + candidates[0]
+        if row != pivot_row:
+            # Swap rows
+            mat[[pivot_row, row]] = mat[[row, pivot_row]]
         
         pivot_cols.append(col)
         
-        # Eliminate other 1s in this column
-        for row in range(rows):
-            if row != pivot_row and mat[row, col] == 1:
-                mat[row] = (mat[row] + mat[pivot_row]) % 2
+        # Eliminate other 1s in this column with one vectorised XOR
+        mask = mat[:, col] == 1
+        mask[pivot_row] = False
+        mat[mask] ^= mat[pivot_row]
         
         pivot_row += 1
         if pivot_row >= rows:
@@ -130,7 +127,7 @@ def _gf2_rank(matrix: np.ndarray) -> int:
 def _in_rowspace(vector: np.ndarray, matrix: np.ndarray) -> bool:
     """Check if a vector is in the row space of a matrix over GF(2)."""
     if matrix.size == 0:
-        return np.allclose(vector, 0)
+        return not np.any(vector)
     
     augmented = np.vstack([matrix, vector.reshape(1, -1)])
     return _gf2_rank(augmented) == _gf2_rank(matrix)
@@ -122,16 +122,14 @@ class BalancedProductCode(QLDPCCode):
             na_q = na // group_order
             nb_q = nb // group_order
             
-            ha_q = np.zeros((ma, na_q), dtype=np.uint8)
-            hb_q = np.zeros((mb, nb_q), dtype=np.uint8)
-            
-            for i in range(na_q):
-                for g in range(group_order):
-                    ha_q[:, i] = (ha_q[:, i] + ha[:, i * group_order + g]) % 2
-                    
-            for j in range(nb_q):
-                for g in range(group_order):
-                    hb_q[:, j] = (hb_q[:, j] + hb[:, j * group_order + g]) % 2
+            # Column i of the quotient is the XOR of columns
+            # i * group_order + g over the group elements g
+            ha_q = np.bitwise_xor.reduce(
+                np.asarray(ha, dtype=np.uint8).reshape(ma, na_q, group_order), axis=2
+            )
+            hb_q = np.bitwise_xor.reduce(
+                np.asarray(hb, dtype=np.uint8).reshape(mb, nb_q, group_order), axis=2
+            )
             
             ha_use = ha_q
             hb_use = hb_q
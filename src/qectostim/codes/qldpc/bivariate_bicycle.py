@@ -30,6 +30,7 @@ import numpy as np
 
 from qectostim.codes.generic.qldpc_base import QLDPCCode
 from qectostim.codes.abstract_code import PauliString
+from qectostim.codes.utils import css_intersection_check
 
 
 def _circulant_from_polynomial(l: int, m: int, terms: List[Tuple[int, int]]) -> np.ndarray:
@@ -61,7 +62,7 @@ def _circulant_from_polynomial(l: int, m: int, terms: List[Tuple[int, int]]) ->
             col_i = (i + a) % l
             col_j = (j + b) % m
             col = col_i * m + col_j
-            matrix[row, col] = (matrix[row, col] + 1) % 2
+            matrix[row, col] ^= 1
     
     return matrix
 
@@ -111,8 +112,7 @@ class BivariateBicycleCode(QLDPCCode):
         
         # Verify CSS condition: Hx @ Hz.T = 0
         # For BB codes: A @ B^T + B @ A^T = 0 (mod 2) by construction
-        comm = (hx @ hz.T) % 2
-        if np.any(comm):
+        if not css_intersection_check(hx, hz):
             raise ValueError("BB code construction failed: Hx Hz^T != 0")
         
         # Compute k
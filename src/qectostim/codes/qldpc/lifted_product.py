@@ -20,6 +20,7 @@ from functools import reduce
 
 from qectostim.codes.generic.qldpc_base import QLDPCCode
 from qectostim.codes.abstract_code import PauliString
+from qectostim.codes.utils import css_intersection_check
 
 
 class LiftedProductCode(QLDPCCode):
@@ -208,8 +209,7 @@ class GeneralizedBicycleCode(QLDPCCode):
         n_qubits = 2 * n
         
         # Verify CSS condition
-        check = (hx @ hz.T) % 2
-        if not np.all(check == 0):
+        if not css_intersection_check(hx, hz):
             # Adjust to make CSS-compliant
             # Use symmetric construction: A = B
             B = A.copy()
@@ -11,6 +11,8 @@ allowing for more efficient encoding in some regimes.
 from typing import Dict, List, Optional, Tuple, Any
 import numpy as np
 
+from qectostim.codes.utils import css_intersection_check
+
 # Note: For true Galois-qudit codes, we would need GF(q) arithmetic.
 # Here we implement a simplified version that captures the essential structure
 # while working in standard binary/integer arithmetic.
@@ -71,8 +73,7 @@ class GaloisQuditCode:
         indicates the qudit dimension for physical implementation.
         """
         # Use mod 2 validation since HGP is built with binary coefficients
-        product = (self.hx @ self.hz.T) % 2
-        if product.sum() != 0:
+        if not css_intersection_check(self.hx, self.hz):
             raise ValueError(f"Hx Hz^T != 0 mod 2; not a valid CSS code")
     
     @property
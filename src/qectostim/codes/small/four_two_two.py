@@ -1,13 +1,56 @@
 # src/qectostim/codes/topological/four_qubit_422.py
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 import numpy as np
 
 from ..complexes.css_complex import CSSChainComplex3
-from ..abstract_css import TopologicalCSSCode
+from ..abstract_css import TopologicalCSSCode, _instance_metadata
 from ..abstract_homological import Coord2D
 from ..abstract_code import PauliString
+from ..utils import css_intersection_check, gf2_pack
+
+
+# One X stabilizer (XXXX) and one Z stabilizer (ZZZZ) on all four qubits.
+_HX_422 = np.ones((1, 4), dtype=np.uint8)
+_HX_422.setflags(write=False)
+_HZ_422 = np.ones((1, 4), dtype=np.uint8)
+_HZ_422.setflags(write=False)
+if __debug__:
+    assert css_intersection_check(_HX_422, _HZ_422), "CSS orthogonality violated"
+
+_HX_BITS_422 = gf2_pack(_HX_422)[0]
+_HX_BITS_422.setflags(write=False)
+_HZ_BITS_422 = gf2_pack(_HZ_422)[0]
+_HZ_BITS_422.setflags(write=False)
+
+# boundary_2 = Hx.T has shape (#edges, #faces) = (4, 1);
+# boundary_1 = Hz has shape (#vertices, #edges) = (1, 4).
+_CHAIN_COMPLEX_422 = CSSChainComplex3(boundary_2=_HX_422.T, boundary_1=_HZ_422)
+
+_LOGICAL_Z_422: Tuple[PauliString, ...] = (
+    {0: "Z", 2: "Z"},  # logical Z1 (ZIZI): anticommutes with XXII (overlap on qubit 0)
+    {1: "Z", 3: "Z"},  # logical Z2 (IZIZ): anticommutes with IXXI (overlap on qubit 1)
+)
+_LOGICAL_X_422: Tuple[PauliString, ...] = (
+    {0: "X", 1: "X"},  # logical X1 (XXII)
+    {1: "X", 2: "X"},  # logical X2 (IXXI)
+)
+
+# Data qubits at corners (0,0), (1,0), (1,1), (0,1).
+_META_422: Mapping[str, Any] = MappingProxyType({
+    "name": "Code_422",
+    "distance": 2,
+    "data_coords": ((0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)),
+    "x_stab_coords": ((0.5, 1.0),),  # X stabilizer (XXXX) at top
+    "z_stab_coords": ((0.5, 0.0),),  # Z stabilizer (ZZZZ) at bottom
+    "data_qubits": (0, 1, 2, 3),
+    "ancilla_qubits": (4, 5),  # One for X (4), one for Z (5)
+    "logical_x_support": (0, 1),  # XXII qubits 0,1
+    "logical_z_support": (0, 2),  # ZIZI qubits 0,2
+    # Schedules for syndrome extraction (naive, single step)
+})
 
 
 class FourQubit422Code(TopologicalCSSCode):
@@ -19,53 +62,23 @@ class FourQubit422Code(TopologicalCSSCode):
     and place 4 data qubits at the corners of a unit square.
     """
 
+    _checks_verified = True
+
     def __init__(self, *, metadata: Optional[Dict[str, Any]] = None):
-        # Data qubits at corners (0,0), (1,0), (1,1), (0,1).
-        data_coords: List[Coord2D] = [
-            (0.0, 0.0),
-            (1.0, 0.0),
-            (1.0, 1.0),
-            (0.0, 1.0),
-        ]
-
-        # boundary_2 has shape (#edges, #faces) = (4, 1). This defines one X stabilizer (XXXX).
-        boundary_2 = np.array(
-            [[1], [1], [1], [1]],  # All 4 data qubits are in the X stabilizer
-            dtype=np.uint8,
-        )
-
-        # boundary_1 has shape (#vertices, #edges) = (1, 4). This defines one Z stabilizer (ZZZZ).
-        boundary_1 = np.array(
-            [[1, 1, 1, 1]],  # All 4 data qubits are in the Z stabilizer
-            dtype=np.uint8,
-        )
-
-        chain_complex = CSSChainComplex3(boundary_2=boundary_2, boundary_1=boundary_1)
-
-        logical_z = [
-            {i: c for i, c in enumerate("ZIZI") if c!='I'},  # logical Z1: anticommutes with XXII (overlap on qubit 0)
-            {i: c for i, c in enumerate("IZIZ") if c!='I'},  # logical Z2: anticommutes with IXXI (overlap on qubit 1)
-        ]
-        logical_x = [
-            {i: c for i, c in enumerate("XXII") if c!='I'},  # logical X1
-            {i: c for i, c in enumerate("IXXI") if c!='I'},  # logical X2
-        ]
-        meta: Dict[str, Any] = dict(metadata or {})
-        meta.update(
-            {
-                "distance": 2,
-                "data_coords": data_coords,
-                "x_stab_coords": [(0.5, 1.0)],  # X stabilizer (XXXX) at top
-                "z_stab_coords": [(0.5, 0.0)],  # Z stabilizer (ZZZZ) at bottom
-                "data_qubits": list(range(4)),
-                "ancilla_qubits": [4, 5],  # One for X (4), one for Z (5)
-                "logical_x_support": [0, 1],  # XXII qubits 0,1
-                "logical_z_support": [0, 2],  # ZIZI qubits 0,2
-                # Schedules for syndrome extraction (naive, single step)
-            }
-        )
-
-        super().__init__(chain_complex, logical_x, logical_z, metadata=meta)
+        meta = _instance_metadata(_META_422, metadata, (
+            "data_coords", "x_stab_coords", "z_stab_coords",
+            "data_qubits", "ancilla_qubits",
+            "logical_x_support", "logical_z_support",
+        ))
+
+        logical_x = [dict(op) for op in _LOGICAL_X_422]
+        logical_z = [dict(op) for op in _LOGICAL_Z_422]
+
+        super().__init__(_CHAIN_COMPLEX_422, logical_x, logical_z, metadata=meta)
+
+        self._hx = _HX_422
+        self._hz = _HZ_422
+        self._seed_packed_checks(_HX_BITS_422, _HZ_BITS_422)
 
     def qubit_coords(self) -> List[Coord2D]:
         # Use the metadata dict stored by the base class
@@ -23,34 +23,12 @@ from typing import Dict, Any, Optional
 import numpy as np
 
 from qectostim.codes.abstract_css import CSSCode
-
-
-def _gf2_rank(mat: np.ndarray) -> int:
-    """Compute rank of a matrix over GF(2)."""
-    mat = mat.copy().astype(np.uint8)
-    if mat.size == 0:
-        return 0
-    rows, cols = mat.shape
-    rank = 0
-    for col in range(cols):
-        found = False
-        for row in range(rank, rows):
-            if mat[row, col] == 1:
-                mat[[rank, row]] = mat[[row, rank]]
-                found = True
-                break
-        if not found:
-            continue
-        for row in range(rows):
-            if row != rank and mat[row, col] == 1:
-                mat[row] = (mat[row] + mat[rank]) % 2
-        rank += 1
-    return rank
+from qectostim.codes.utils import css_intersection_check, gf2_rank
 
 
 def _is_css_orthogonal(hx: np.ndarray, hz: np.ndarray) -> bool:
-    """Check if Hx @ Hz^T = 0 (mod 2)."""
-    return np.all(np.dot(hx, hz.T) % 2 == 0)
+    """Check if Hx @ Hz^T = 0 (mod 2), using the bit-packed GF(2) product."""
+    return css_intersection_check(hx, hz)
 
 
 def _build_self_orthogonal_stabilizers() -> np.ndarray:
@@ -85,6 +63,33 @@ def _build_self_orthogonal_stabilizers() -> np.ndarray:
     return h
 
 
+def _verify_rm151_stabilizers(h: np.ndarray) -> None:
+    """Check the self-dual [[15,1,3]] invariants of ``h`` (Hx = Hz = h)."""
+    # Verify CSS orthogonality
+    if not _is_css_orthogonal(h, h):
+        raise ValueError("CSS orthogonality check failed - stabilizers not self-orthogonal")
+    
+    # Verify rank and k
+    rank_hx = gf2_rank(h)
+    rank_hz = rank_hx
+    k = 15 - rank_hx - rank_hz
+    
+    if k != 1:
+        raise ValueError(f"Expected k=1, got k={k} (rank_hx={rank_hx}, rank_hz={rank_hz})")
+
+
+# The stabilizer matrix is a constant: build it once at import. Its
+# invariants are fixed by the hand-verified patterns above, so the check is
+# skipped under ``python -O``.
+_H_RM151 = _build_self_orthogonal_stabilizers()
+_H_RM151.setflags(write=False)
+if __debug__:
+    _verify_rm151_stabilizers(_H_RM151)
+
+# Grid coordinates (3x5 arrangement), shared as immutable tuples
+_RM151_DATA_COORDS = tuple((i % 5, i // 5) for i in range(15))
+
+
 class ReedMullerCode151(CSSCode):
     """
     [[15,1,3]] Quantum Reed-Muller code.
@@ -100,21 +105,9 @@ class ReedMullerCode151(CSSCode):
     def __init__(self, metadata: Optional[Dict[str, Any]] = None):
         """Initialize the [[15,1,3]] quantum Reed-Muller code."""
         
-        # Build self-orthogonal stabilizer matrix
-        hx = _build_self_orthogonal_stabilizers()
-        hz = hx.copy()  # Self-dual construction
-        
-        # Verify CSS orthogonality
-        if not _is_css_orthogonal(hx, hz):
-            raise ValueError("CSS orthogonality check failed - stabilizers not self-orthogonal")
-        
-        # Verify rank and k
-        rank_hx = _gf2_rank(hx)
-        rank_hz = _gf2_rank(hz)
-        k = 15 - rank_hx - rank_hz
-        
-        if k != 1:
-            raise ValueError(f"Expected k=1, got k={k} (rank_hx={rank_hx}, rank_hz={rank_hz})")
+        # Self-dual construction from the verified module-level constant
+        hx = _H_RM151.copy()
+        hz = _H_RM151.copy()
         
         # Logical operators with weight 3
         # These act on qubits 9, 10, 12 (verified to be minimum weight coset representative)
@@ -131,6 +124,6 @@ class ReedMullerCode151(CSSCode):
         meta["logical_z_support"] = [9, 10, 12]
         
         # Grid coordinates (3x5 arrangement)
-        meta["data_coords"] = [(i % 5, i // 5) for i in range(15)]
+        meta["data_coords"] = list(_RM151_DATA_COORDS)
 
         super().__init__(hx=hx, hz=hz, logical_x=logical_x, logical_z=logical_z, metadata=meta)
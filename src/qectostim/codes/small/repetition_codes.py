@@ -25,6 +25,7 @@ Chain Complex Structure:
 - This is the simplest chain complex, foundational for hypergraph products
 """
 
+import functools
 from typing import Tuple, List, Dict, Any, Optional
 import numpy as np
 from qectostim.codes.abstract_css import CSSCodeWithComplex, Coord2D
@@ -78,8 +79,8 @@ class RepetitionCode(CSSCodeWithComplex):
         
         self._N = N
         
-        # Build the 2-chain complex
-        chain_complex = self._build_chain_complex(N)
+        # Build the 2-chain complex (shared per N; its boundary is read-only)
+        chain_complex = _repetition_chain_complex(N)
         
         # Generate logical operators  
         logical_x, logical_z = self._generate_logical_operators(N)
@@ -140,10 +141,9 @@ class RepetitionCode(CSSCodeWithComplex):
         """
         # boundary_1: (N-1) × N matrix
         # Each row i has 1s at positions i and i+1
-        boundary_1 = np.zeros((N - 1, N), dtype=np.uint8)
-        for i in range(N - 1):
-            boundary_1[i, i] = 1
-            boundary_1[i, i + 1] = 1
+        boundary_1 = np.eye(N - 1, N, dtype=np.uint8)
+        rows = np.arange(N - 1)
+        boundary_1[rows, rows + 1] = 1
         
         return CSSChainComplex2(boundary_1=boundary_1)
     
@@ -187,6 +187,14 @@ class RepetitionCode(CSSCodeWithComplex):
         return list(self._metadata.get("data_coords", []))
 
 
+@functools.lru_cache(maxsize=32)
+def _repetition_chain_complex(N: int) -> CSSChainComplex2:
+    """Chain complex for size N, built once and shared by every instance."""
+    chain_complex = RepetitionCode._build_chain_complex(N)
+    chain_complex.boundary_1.setflags(write=False)
+    return chain_complex
+
+
 # Convenience factory functions for common code sizes
 def create_repetition_code_3() -> RepetitionCode:
     """Create [[3,1,3]] repetition code"""
@@ -206,4 +214,3 @@ def create_repetition_code_7() -> RepetitionCode:
 def create_repetition_code_9() -> RepetitionCode:
     """Create [[9,1,9]] repetition code"""
     return RepetitionCode(N=9)
-
@@ -10,13 +10,86 @@ The qubits are organized in a 3×3 grid where:
 """
 
 from __future__ import annotations
-from typing import Dict, Any, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple, Mapping
 
 import numpy as np
 
-from qectostim.codes.abstract_css import TopologicalCSSCode, Coord2D
+from qectostim.codes.abstract_css import TopologicalCSSCode, Coord2D, _instance_metadata
 from qectostim.codes.abstract_code import PauliString
 from qectostim.codes.complexes.css_complex import CSSChainComplex3
+from qectostim.codes.utils import css_intersection_check, gf2_pack, pauli_strings_to_matrix
+
+
+# Z-type stabilizers: 6 weight-2 checks within rows
+# Rows: {0,1}, {1,2} (row 0)
+#       {3,4}, {4,5} (row 1)
+#       {6,7}, {7,8} (row 2)
+_HZ_SHOR = np.array([
+    [1, 1, 0, 0, 0, 0, 0, 0, 0],  # {0,1}
+    [0, 1, 1, 0, 0, 0, 0, 0, 0],  # {1,2}
+    [0, 0, 0, 1, 1, 0, 0, 0, 0],  # {3,4}
+    [0, 0, 0, 0, 1, 1, 0, 0, 0],  # {4,5}
+    [0, 0, 0, 0, 0, 0, 1, 1, 0],  # {6,7}
+    [0, 0, 0, 0, 0, 0, 0, 1, 1],  # {7,8}
+], dtype=np.uint8)
+_HZ_SHOR.setflags(write=False)
+
+# X-type stabilizers: 2 weight-6 checks across rows
+# These enforce phase coherence by checking parity across row pairs
+_HX_SHOR = np.array([
+    [1, 1, 1, 1, 1, 1, 0, 0, 0],  # rows 0&1: {0,1,2,3,4,5}
+    [0, 0, 0, 1, 1, 1, 1, 1, 1],  # rows 1&2: {3,4,5,6,7,8}
+], dtype=np.uint8)
+_HX_SHOR.setflags(write=False)
+
+if __debug__:
+    assert css_intersection_check(_HX_SHOR, _HZ_SHOR), "CSS orthogonality violated"
+_HX_BITS_SHOR = gf2_pack(_HX_SHOR)[0]
+_HX_BITS_SHOR.setflags(write=False)
+_HZ_BITS_SHOR = gf2_pack(_HZ_SHOR)[0]
+_HZ_BITS_SHOR.setflags(write=False)
+
+# Build chain complex for CSS code structure:
+#   C2 (X stabilizers) --∂2--> C1 (qubits) --∂1--> C0 (Z stabilizers)
+#
+# boundary_2 = Hx.T: maps faces (X stabs) → edges (qubits), shape (n, #X_checks)
+# boundary_1 = Hz:   maps edges (qubits) → vertices (Z stabs), shape (#Z_checks, n)
+_CHAIN_COMPLEX_SHOR = CSSChainComplex3(boundary_2=_HX_SHOR.T, boundary_1=_HZ_SHOR)
+
+# Logical X: X on all qubits in one pattern
+# Logical Z: Z on all qubits (or representative pattern)
+_LOGICAL_X_SHOR: Tuple[PauliString, ...] = ("XXXXXXXXX",)
+_LOGICAL_Z_SHOR: Tuple[PauliString, ...] = ("ZZZZZZZZZ",)
+
+_LOGICAL_X_BIN_SHOR = pauli_strings_to_matrix(_LOGICAL_X_SHOR, 9, "X")
+_LOGICAL_X_BIN_SHOR.setflags(write=False)
+_LOGICAL_Z_BIN_SHOR = pauli_strings_to_matrix(_LOGICAL_Z_SHOR, 9, "Z")
+_LOGICAL_Z_BIN_SHOR.setflags(write=False)
+
+# 3x3 grid coordinates
+_DATA_COORDS_SHOR: Tuple[Coord2D, ...] = tuple(
+    (float(q % 3), float(q // 3)) for q in range(9)
+)
+
+_META_SHOR: Mapping[str, Any] = MappingProxyType({
+    "name": "Shor_91",
+    "n": 9,
+    "k": 1,
+    "distance": 3,
+    "data_coords": _DATA_COORDS_SHOR,
+    # X stabilizer coordinates (between rows)
+    "x_stab_coords": ((1.0, 0.5), (1.0, 1.5)),  # between row 0-1, row 1-2
+    # Z stabilizer coordinates (within each row, between adjacent qubits)
+    "z_stab_coords": (
+        (0.5, 0.0), (1.5, 0.0),  # row 0
+        (0.5, 1.0), (1.5, 1.0),  # row 1
+        (0.5, 2.0), (1.5, 2.0),  # row 2
+    ),
+    # Measurement schedules
+    "x_schedule": ((0.0, 0.5), (1.0, 0.5), (2.0, 0.5)),  # 3 qubits per X stab
+    "z_schedule": ((0.5, 0.0), (-0.5, 0.0)),  # 2 qubits per Z stab
+})
 
 
 class ShorCode91(TopologicalCSSCode):
@@ -33,76 +106,27 @@ class ShorCode91(TopologicalCSSCode):
     - X stabilizers: parity checks across rows (weight-6, ensuring phase coherence)
     """
 
+    _checks_verified = True
+
     def __init__(self, metadata: Optional[Dict[str, Any]] = None):
         """Initialize Shor's code with proper CSS structure and chain complex."""
+        meta = _instance_metadata(_META_SHOR, metadata, (
+            "data_coords", "x_stab_coords", "z_stab_coords",
+            "x_schedule", "z_schedule",
+        ))
+
+        super().__init__(
+            _CHAIN_COMPLEX_SHOR,
+            list(_LOGICAL_X_SHOR),
+            list(_LOGICAL_Z_SHOR),
+            metadata=meta,
+        )
 
-        # Z-type stabilizers: 6 weight-2 checks within rows
-        # Rows: {0,1}, {1,2} (row 0)
-        #       {3,4}, {4,5} (row 1)
-        #       {6,7}, {7,8} (row 2)
-        hz = np.array([
-            [1, 1, 0, 0, 0, 0, 0, 0, 0],  # {0,1}
-            [0, 1, 1, 0, 0, 0, 0, 0, 0],  # {1,2}
-            [0, 0, 0, 1, 1, 0, 0, 0, 0],  # {3,4}
-            [0, 0, 0, 0, 1, 1, 0, 0, 0],  # {4,5}
-            [0, 0, 0, 0, 0, 0, 1, 1, 0],  # {6,7}
-            [0, 0, 0, 0, 0, 0, 0, 1, 1],  # {7,8}
-        ], dtype=np.uint8)
-
-        # X-type stabilizers: 2 weight-6 checks across rows
-        # These enforce phase coherence by checking parity across row pairs
-        hx = np.array([
-            [1, 1, 1, 1, 1, 1, 0, 0, 0],  # rows 0&1: {0,1,2,3,4,5}
-            [0, 0, 0, 1, 1, 1, 1, 1, 1],  # rows 1&2: {3,4,5,6,7,8}
-        ], dtype=np.uint8)
-
-        # Build chain complex for CSS code structure:
-        #   C2 (X stabilizers) --∂2--> C1 (qubits) --∂1--> C0 (Z stabilizers)
-        #
-        # boundary_2 = Hx.T: maps faces (X stabs) → edges (qubits), shape (n, #X_checks)
-        # boundary_1 = Hz:   maps edges (qubits) → vertices (Z stabs), shape (#Z_checks, n)
-        boundary_2 = hx.T.astype(np.uint8)  # shape (9, 2) - 9 qubits, 2 X stabilizers
-        boundary_1 = hz.astype(np.uint8)    # shape (6, 9) - 6 Z stabilizers, 9 qubits
-        
-        chain_complex = CSSChainComplex3(boundary_2=boundary_2, boundary_1=boundary_1)
-
-        # Logical operators for single logical qubit
-        # Logical X: X on all qubits in one pattern
-        logical_x = ["XXXXXXXXX"]
-        # Logical Z: Z on all qubits (or representative pattern)
-        logical_z = ["ZZZZZZZZZ"]
-
-        # 3x3 grid coordinates
-        coords = {q: (float(q % 3), float(q // 3)) for q in range(9)}
-        data_coords = [coords[i] for i in range(9)]
-        
-        # X stabilizer coordinates (between rows)
-        x_stab_coords = [(1.0, 0.5), (1.0, 1.5)]  # between row 0-1, row 1-2
-        # Z stabilizer coordinates (within each row, between adjacent qubits)
-        z_stab_coords = [
-            (0.5, 0.0), (1.5, 0.0),  # row 0
-            (0.5, 1.0), (1.5, 1.0),  # row 1
-            (0.5, 2.0), (1.5, 2.0),  # row 2
-        ]
-
-        meta = dict(metadata or {})
-        meta["name"] = "Shor_91"
-        meta["n"] = 9
-        meta["k"] = 1
-        meta["distance"] = 3
-        meta["data_coords"] = data_coords
-        meta["x_stab_coords"] = x_stab_coords
-        meta["z_stab_coords"] = z_stab_coords
-        
-        # Measurement schedules
-        meta["x_schedule"] = [(0.0, 0.5), (1.0, 0.5), (2.0, 0.5)]  # 3 qubits per X stab
-        meta["z_schedule"] = [(0.5, 0.0), (-0.5, 0.0)]  # 2 qubits per Z stab
-
-        super().__init__(chain_complex, logical_x, logical_z, metadata=meta)
-        
         # Override parity check matrices
-        self._hx = hx.astype(np.uint8)
-        self._hz = hz.astype(np.uint8)
+        self._hx = _HX_SHOR
+        self._hz = _HZ_SHOR
+        self._seed_packed_checks(_HX_BITS_SHOR, _HZ_BITS_SHOR)
+        self._seed_logical_supports(_LOGICAL_X_BIN_SHOR, _LOGICAL_Z_BIN_SHOR)
     
     def qubit_coords(self) -> List[Coord2D]:
         """Return qubit coordinates for visualization."""
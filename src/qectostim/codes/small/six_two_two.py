@@ -21,16 +21,131 @@ Key properties:
 """
 
 from __future__ import annotations
-from typing import Dict, Any, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple, Mapping
 
 import numpy as np
 
-from qectostim.codes.abstract_css import CSSCode
+from qectostim.codes.abstract_css import CSSCode, _instance_metadata
 from qectostim.codes.abstract_code import PauliString
+from qectostim.codes.utils import css_intersection_check, gf2_pack, pauli_strings_to_matrix
 
 Coord2D = Tuple[float, float]
 
 
+# [[6,2,2]] code stabilizers from standard construction
+# Qubits labeled 0,1,2,3,4,5
+# X stabilizers act on disjoint pairs + overlapping qubits
+# Z stabilizers similarly structured to maintain orthogonality
+
+# X-type stabilizer generators (2 stabilizers, 6 qubits)
+# Each row has weight 4, designed for even overlap with each Z stabilizer
+_HX_622 = np.array([
+    [1, 1, 1, 1, 0, 0],  # XXXXII - qubits {0,1,2,3}
+    [1, 1, 0, 0, 1, 1],  # XXIIXX - qubits {0,1,4,5}
+], dtype=np.uint8)
+_HX_622.setflags(write=False)
+
+# Z-type stabilizer generators (2 stabilizers, 6 qubits)
+# Designed so Hx @ Hz^T = 0 (mod 2)
+# First Z check: needs even overlap with both X checks
+# Second Z check: needs even overlap with both X checks
+_HZ_622 = np.array([
+    [1, 0, 1, 0, 1, 0],  # ZIZIZI - qubits {0,2,4} - overlap 2,2 with hx rows
+    [0, 1, 0, 1, 0, 1],  # IZIZIZ - qubits {1,3,5} - overlap 2,2 with hx rows
+], dtype=np.uint8)
+_HZ_622.setflags(write=False)
+
+# Verify CSS orthogonality once, at import: Hx @ Hz^T = 0 (mod 2)
+if __debug__:
+    assert css_intersection_check(_HX_622, _HZ_622), "CSS orthogonality violated"
+_HX_BITS_622 = gf2_pack(_HX_622)[0]
+_HX_BITS_622.setflags(write=False)
+_HZ_BITS_622 = gf2_pack(_HZ_622)[0]
+_HZ_BITS_622.setflags(write=False)
+
+# Logical operators for 2 logical qubits
+# Must commute with all stabilizers and form anticommuting pairs
+# 
+# Lx must be in kernel of Hz (commute with Z stabilizers)
+# Lz must be in kernel of Hx (commute with X stabilizers)
+# Lx[i] and Lz[i] must anticommute (odd overlap)
+#
+# Hz rows: [1,0,1,0,1,0] and [0,1,0,1,0,1]
+# Hx rows: [1,1,1,1,0,0] and [1,1,0,0,1,1]
+#
+# For Lx in kernel(Hz): need x0 + x2 + x4 = 0 AND x1 + x3 + x5 = 0 (mod 2)
+# For Lz in kernel(Hx): need z0 + z1 + z2 + z3 = 0 AND z0 + z1 + z4 + z5 = 0 (mod 2)
+#
+# Logical pair 1:
+#   Lx1 = XIIIII (qubit 0) - fails: 1+0+0 = 1 ≠ 0 for Hz row 1
+#   Need: Lx1 in ker(Hz), Lz1 in ker(Hx), and Lx1 · Lz1 = 1 (mod 2)
+#   
+#   Try Lx1 = XIIXII: x0=1,x3=1 -> Hz·Lx1: 1+0=1, 0+1=1 -> not in kernel
+#   Try Lx1 = XIXIII: x0=1,x2=1 -> Hz·Lx1: 1+1=0, 0+0=0 -> in kernel ✓
+#   For Lz1 to anticommute with XIXIII and be in ker(Hx):
+#     Need odd overlap with {0,2}
+#     Try Lz1 = ZIIIII: overlap = 1 (odd) ✓, check ker(Hx): 1+0+0+0=1 ✗
+#     Try Lz1 = ZIIZII: overlap with {0,2} = 1 (odd) ✓, check ker(Hx): 1+0+1+0=0, 1+0+0+0=1 ✗
+#     Try Lz1 = ZIIIZI: overlap = 1 (odd) ✓, check ker(Hx): 1+0+0+0=1 ✗
+#     Need z0 + z1 + z2 + z3 = 0 AND z0 + z1 + z4 + z5 = 0
+#     Try Lz1 = ZZZZII: 1+1+1+1=0 ✓, 1+1+0+0=0 ✓ -> in kernel ✓
+#     Overlap with Lx1=XIXIII {0,2}: 1+1=0 (even) ✗
+#     Try Lz1 = ZIZZII: 1+0+1+1=1 ✗
+#
+# Let's try a different approach - use weight-3 logical X operators
+#   Lx1 = XIXIXI: x0=1,x2=1,x4=1 -> Hz·Lx1: 1+1+1=1 ✗
+#   Lx1 = XXIXXI: x0=1,x1=1,x3=1,x4=1 -> Hz·Lx1: 1+0+1=0, 1+1+0=0 -> in kernel ✓
+#   For Lz1: need odd overlap with {0,1,3,4} and in ker(Hx)
+#     Lz1 = ZZIIII: overlap = 2 (even) ✗
+#     Lz1 = ZIZIII: overlap = 2 (even) ✗  
+#     Lz1 = ZIIZII: overlap = 1 (odd) ✓, ker(Hx): 1+0+1+0=0, 1+0+0+0=1 ✗
+#
+# Actually, let's use a standard [[6,2,2]] from literature:
+# The "iceberg" code has specific structure. Let me use a known construction.
+#
+# Standard [[6,2,2]] code (from Nielsen & Chuang / standard references):
+# Stabilizers: X1X2X3X4, X1X2X5X6, Z1Z2Z3Z4, Z1Z2Z5Z6
+# But these don't satisfy Hx @ Hz^T = 0!
+#
+# Alternative: Use the [[6,2,2]] constructed from concatenation of [[4,2,2]] with [[3,1,3]].
+# Or use the hypergraph product construction.
+#
+# For now, let's use this WORKING construction:
+# Since the code is working with LER > 0, the logical ops are functional
+# even if the overlap calculation seems off. The memory experiment
+# tests OBSERVABLE_INCLUDE which is based on measurement record coupling.
+_LOGICAL_X_622: Tuple[PauliString, ...] = (
+    "XIXIII",  # Logical X1: qubits {0,2}
+    "IIXIXI",  # Logical X2: qubits {1,3,5}
+)
+_LOGICAL_Z_622: Tuple[PauliString, ...] = (
+    "ZZIIII",  # Logical Z1: qubits {0,1} - anticommutes with Lx1 (overlap = 1)
+    "IIIIZZ",  # Logical Z2: qubits {4,5} - anticommutes with Lx2 (overlap = 1)
+)
+
+_LOGICAL_X_BIN_622 = pauli_strings_to_matrix(_LOGICAL_X_622, 6, "X")
+_LOGICAL_X_BIN_622.setflags(write=False)
+_LOGICAL_Z_BIN_622 = pauli_strings_to_matrix(_LOGICAL_Z_622, 6, "Z")
+_LOGICAL_Z_BIN_622.setflags(write=False)
+
+# Geometric metadata for visualization
+_DATA_COORDS_622: Tuple[Coord2D, ...] = (
+    (0.0, 0.0), (1.0, 0.0), (2.0, 0.0),
+    (0.0, 1.0), (1.0, 1.0), (2.0, 1.0),
+)
+
+_META_622: Mapping[str, Any] = MappingProxyType({
+    "name": "C6",
+    "n": 6,
+    "k": 2,
+    "distance": 2,
+    "data_coords": _DATA_COORDS_622,
+    "x_stab_coords": ((0.5, -0.5), (1.5, 0.5)),
+    "z_stab_coords": ((0.5, 0.5), (1.5, 1.5)),
+})
+
+
 class SixQubit622Code(CSSCode):
     """
     [[6, 2, 2]] CSS code (Iceberg code).
@@ -39,6 +154,8 @@ class SixQubit622Code(CSSCode):
     This is the smallest CSS code with k > 1.
     """
 
+    _checks_verified = True
+
     def __init__(self, metadata: Optional[Dict[str, Any]] = None):
         """Initialize the [[6,2,2]] code with proper CSS structure.
         
@@ -50,114 +167,19 @@ class SixQubit622Code(CSSCode):
         
         We use a known valid construction from quantum error correction literature.
         """
-        # [[6,2,2]] code stabilizers from standard construction
-        # Qubits labeled 0,1,2,3,4,5
-        # X stabilizers act on disjoint pairs + overlapping qubits
-        # Z stabilizers similarly structured to maintain orthogonality
-        
-        # X-type stabilizer generators (2 stabilizers, 6 qubits)
-        # Each row has weight 4, designed for even overlap with each Z stabilizer
-        hx = np.array([
-            [1, 1, 1, 1, 0, 0],  # XXXXII - qubits {0,1,2,3}
-            [1, 1, 0, 0, 1, 1],  # XXIIXX - qubits {0,1,4,5}
-        ], dtype=np.uint8)
-
-        # Z-type stabilizer generators (2 stabilizers, 6 qubits)
-        # Designed so Hx @ Hz^T = 0 (mod 2)
-        # First Z check: needs even overlap with both X checks
-        # Second Z check: needs even overlap with both X checks
-        hz = np.array([
-            [1, 0, 1, 0, 1, 0],  # ZIZIZI - qubits {0,2,4} - overlap 2,2 with hx rows
-            [0, 1, 0, 1, 0, 1],  # IZIZIZ - qubits {1,3,5} - overlap 2,2 with hx rows
-        ], dtype=np.uint8)
-
-        # Verify CSS orthogonality: Hx @ Hz^T = 0 (mod 2)
-        css_check = np.dot(hx, hz.T) % 2
-        assert np.allclose(css_check, 0), f"CSS orthogonality violated: {css_check}"
-
-        # Logical operators for 2 logical qubits
-        # Must commute with all stabilizers and form anticommuting pairs
-        # 
-        # Lx must be in kernel of Hz (commute with Z stabilizers)
-        # Lz must be in kernel of Hx (commute with X stabilizers)
-        # Lx[i] and Lz[i] must anticommute (odd overlap)
-        #
-        # Hz rows: [1,0,1,0,1,0] and [0,1,0,1,0,1]
-        # Hx rows: [1,1,1,1,0,0] and [1,1,0,0,1,1]
-        #
-        # For Lx in kernel(Hz): need x0 + x2 + x4 = 0 AND x1 + x3 + x5 = 0 (mod 2)
-        # For Lz in kernel(Hx): need z0 + z1 + z2 + z3 = 0 AND z0 + z1 + z4 + z5 = 0 (mod 2)
-        #
-        # Logical pair 1:
-        #   Lx1 = XIIIII (qubit 0) - fails: 1+0+0 = 1 ≠ 0 for Hz row 1
-        #   Need: Lx1 in ker(Hz), Lz1 in ker(Hx), and Lx1 · Lz1 = 1 (mod 2)
-        #   
-        #   Try Lx1 = XIIXII: x0=1,x3=1 -> Hz·Lx1: 1+0=1, 0+1=1 -> not in kernel
-        #   Try Lx1 = XIXIII: x0=1,x2=1 -> Hz·Lx1: 1+1=0, 0+0=0 -> in kernel ✓
-        #   For Lz1 to anticommute with XIXIII and be in ker(Hx):
-        #     Need odd overlap with {0,2}
-        #     Try Lz1 = ZIIIII: overlap = 1 (odd) ✓, check ker(Hx): 1+0+0+0=1 ✗
-        #     Try Lz1 = ZIIZII: overlap with {0,2} = 1 (odd) ✓, check ker(Hx): 1+0+1+0=0, 1+0+0+0=1 ✗
-        #     Try Lz1 = ZIIIZI: overlap = 1 (odd) ✓, check ker(Hx): 1+0+0+0=1 ✗
-        #     Need z0 + z1 + z2 + z3 = 0 AND z0 + z1 + z4 + z5 = 0
-        #     Try Lz1 = ZZZZII: 1+1+1+1=0 ✓, 1+1+0+0=0 ✓ -> in kernel ✓
-        #     Overlap with Lx1=XIXIII {0,2}: 1+1=0 (even) ✗
-        #     Try Lz1 = ZIZZII: 1+0+1+1=1 ✗
-        #
-        # Let's try a different approach - use weight-3 logical X operators
-        #   Lx1 = XIXIXI: x0=1,x2=1,x4=1 -> Hz·Lx1: 1+1+1=1 ✗
-        #   Lx1 = XXIXXI: x0=1,x1=1,x3=1,x4=1 -> Hz·Lx1: 1+0+1=0, 1+1+0=0 -> in kernel ✓
-        #   For Lz1: need odd overlap with {0,1,3,4} and in ker(Hx)
-        #     Lz1 = ZZIIII: overlap = 2 (even) ✗
-        #     Lz1 = ZIZIII: overlap = 2 (even) ✗  
-        #     Lz1 = ZIIZII: overlap = 1 (odd) ✓, ker(Hx): 1+0+1+0=0, 1+0+0+0=1 ✗
-        #
-        # Actually, let's use a standard [[6,2,2]] from literature:
-        # The "iceberg" code has specific structure. Let me use a known construction.
-        #
-        # Standard [[6,2,2]] code (from Nielsen & Chuang / standard references):
-        # Stabilizers: X1X2X3X4, X1X2X5X6, Z1Z2Z3Z4, Z1Z2Z5Z6
-        # But these don't satisfy Hx @ Hz^T = 0!
-        #
-        # Alternative: Use the [[6,2,2]] constructed from concatenation of [[4,2,2]] with [[3,1,3]].
-        # Or use the hypergraph product construction.
-        #
-        # For now, let's use this WORKING construction:
-        # Since the code is working with LER > 0, the logical ops are functional
-        # even if the overlap calculation seems off. The memory experiment
-        # tests OBSERVABLE_INCLUDE which is based on measurement record coupling.
-        
-        logical_x: List[PauliString] = [
-            "XIXIII",  # Logical X1: qubits {0,2}
-            "IIXIXI",  # Logical X2: qubits {1,3,5}
-        ]
-        logical_z: List[PauliString] = [
-            "ZZIIII",  # Logical Z1: qubits {0,1} - anticommutes with Lx1 (overlap = 1)
-            "IIIIZZ",  # Logical Z2: qubits {4,5} - anticommutes with Lx2 (overlap = 1)
-        ]
-
-        meta = dict(metadata or {})
-        meta["name"] = "C6"
-        meta["n"] = 6
-        meta["k"] = 2
-        meta["distance"] = 2
-        
-        # Geometric metadata for visualization
-        data_coords_list = [
-            (0.0, 0.0), (1.0, 0.0), (2.0, 0.0),
-            (0.0, 1.0), (1.0, 1.0), (2.0, 1.0),
-        ]
-        meta["data_coords"] = data_coords_list
-        meta["x_stab_coords"] = [(0.5, -0.5), (1.5, 0.5)]
-        meta["z_stab_coords"] = [(0.5, 0.5), (1.5, 1.5)]
+        meta = _instance_metadata(
+            _META_622, metadata, ("data_coords", "x_stab_coords", "z_stab_coords")
+        )
 
         super().__init__(
-            hx=hx,
-            hz=hz,
-            logical_x=logical_x,
-            logical_z=logical_z,
+            hx=_HX_622,
+            hz=_HZ_622,
+            logical_x=list(_LOGICAL_X_622),
+            logical_z=list(_LOGICAL_Z_622),
             metadata=meta,
         )
+        self._seed_packed_checks(_HX_BITS_622, _HZ_BITS_622)
+        self._seed_logical_supports(_LOGICAL_X_BIN_622, _LOGICAL_Z_BIN_622)
 
     @property
     def name(self) -> str:
@@ -165,7 +187,4 @@ class SixQubit622Code(CSSCode):
 
     def qubit_coords(self) -> List[Coord2D]:
         """Return 2D coordinates for each data qubit."""
-        return [
-            (0.0, 0.0), (1.0, 0.0), (2.0, 0.0),
-            (0.0, 1.0), (1.0, 1.0), (2.0, 1.0),
-        ]
\ No newline at end of file
+        return list(_DATA_COORDS_622)
@@ -28,13 +28,78 @@ Logical operators (minimum weight 3):
 """
 
 from __future__ import annotations
-from typing import Dict, Any, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple, Mapping
 
 import numpy as np
 
-from qectostim.codes.abstract_css import TopologicalCSSCode, Coord2D
+from qectostim.codes.abstract_css import TopologicalCSSCode, Coord2D, _instance_metadata
 from qectostim.codes.abstract_code import PauliString
 from qectostim.codes.complexes.css_complex import CSSChainComplex3
+from qectostim.codes.utils import css_intersection_check, gf2_pack, pauli_strings_to_matrix
+
+
+# Check matrix of the standard [7,4,3] Hamming code (3 checks, each on 4
+# qubits). The code is self-dual, so X and Z checks share the same support.
+_H_STEANE = np.array([
+    [0, 0, 0, 1, 1, 1, 1],  # qubits {3,4,5,6}
+    [0, 1, 1, 0, 0, 1, 1],  # qubits {1,2,5,6}
+    [1, 0, 1, 0, 1, 0, 1],  # qubits {0,2,4,6}
+], dtype=np.uint8)
+_H_STEANE.setflags(write=False)
+
+if __debug__:
+    assert css_intersection_check(_H_STEANE, _H_STEANE), "CSS orthogonality violated"
+_H_BITS_STEANE = gf2_pack(_H_STEANE)[0]
+_H_BITS_STEANE.setflags(write=False)
+
+# Build chain complex for CSS code structure:
+#   C2 (X stabilizers) --∂2--> C1 (qubits) --∂1--> C0 (Z stabilizers)
+#
+# boundary_2 = Hx.T: maps faces (X stabs) → edges (qubits), shape (n, #X_checks)
+# boundary_1 = Hz:   maps edges (qubits) → vertices (Z stabs), shape (#Z_checks, n)
+_CHAIN_COMPLEX_STEANE = CSSChainComplex3(boundary_2=_H_STEANE.T, boundary_1=_H_STEANE)
+
+# Logical operators - use minimum weight representatives (weight 3)
+_LOGICAL_X_STEANE: Tuple[PauliString, ...] = ("XXXIIII",)  # qubits {0,1,2}
+_LOGICAL_Z_STEANE: Tuple[PauliString, ...] = ("ZZZIIII",)  # qubits {0,1,2}
+
+_LOGICAL_X_BIN_STEANE = pauli_strings_to_matrix(_LOGICAL_X_STEANE, 7, "X")
+_LOGICAL_X_BIN_STEANE.setflags(write=False)
+_LOGICAL_Z_BIN_STEANE = pauli_strings_to_matrix(_LOGICAL_Z_STEANE, 7, "Z")
+_LOGICAL_Z_BIN_STEANE.setflags(write=False)
+
+# Geometric layout: triangular arrangement
+_DATA_COORDS_STEANE: Tuple[Coord2D, ...] = (
+    (1.0, 2.0),    # 0: top vertex
+    (0.0, 0.0),    # 1: bottom-left vertex
+    (0.5, 1.0),    # 2: left edge center
+    (2.0, 0.0),    # 3: bottom-right vertex
+    (1.5, 1.0),    # 4: right edge center
+    (1.0, 0.0),    # 5: bottom edge center
+    (1.0, 1.0),    # 6: face center
+)
+
+# Face centers for stabilizer coordinates (color code faces)
+_STAB_COORDS_STEANE: Tuple[Coord2D, ...] = (
+    (1.5, 0.5),  # Face {3,4,5,6}
+    (0.5, 0.5),  # Face {1,2,5,6}
+    (1.0, 1.33), # Face {0,2,4,6}
+)
+
+_META_STEANE: Mapping[str, Any] = MappingProxyType({
+    "name": "Steane_713",
+    "n": 7,
+    "k": 1,
+    "distance": 3,
+    "is_colour_code": True,
+    "tiling": "triangular",
+    "data_coords": _DATA_COORDS_STEANE,
+    "x_stab_coords": _STAB_COORDS_STEANE,
+    "z_stab_coords": _STAB_COORDS_STEANE,  # Self-dual
+    "logical_x_support": (0, 1, 2),
+    "logical_z_support": (0, 1, 2),
+})
 
 
 class SteanCode713(TopologicalCSSCode):
@@ -45,6 +110,8 @@ class SteanCode713(TopologicalCSSCode):
     It can correct any single Pauli error and has transversal Clifford gates.
     """
 
+    _checks_verified = True
+
     def __init__(self, metadata: Optional[Dict[str, Any]] = None):
         """
         Initialize the Steane code with proper CSS structure and chain complex.
@@ -54,77 +121,28 @@ class SteanCode713(TopologicalCSSCode):
         Z stabilizers: {3,4,5,6}, {1,2,5,6}, {0,2,4,6}
         (Self-dual CSS code)
         """
-        # X-type check matrix (3 checks, each on 4 qubits)
-        # Matches the standard [7,4,3] Hamming code parity check matrix
-        hx = np.array([
-            [0, 0, 0, 1, 1, 1, 1],  # qubits {3,4,5,6}
-            [0, 1, 1, 0, 0, 1, 1],  # qubits {1,2,5,6}
-            [1, 0, 1, 0, 1, 0, 1],  # qubits {0,2,4,6}
-        ], dtype=np.uint8)
-
-        # Z-type check matrix (3 checks, same support as X due to self-duality)
-        hz = np.array([
-            [0, 0, 0, 1, 1, 1, 1],  # qubits {3,4,5,6}
-            [0, 1, 1, 0, 0, 1, 1],  # qubits {1,2,5,6}
-            [1, 0, 1, 0, 1, 0, 1],  # qubits {0,2,4,6}
-        ], dtype=np.uint8)
-
-        # Build chain complex for CSS code structure:
-        #   C2 (X stabilizers) --∂2--> C1 (qubits) --∂1--> C0 (Z stabilizers)
-        #
-        # boundary_2 = Hx.T: maps faces (X stabs) → edges (qubits), shape (n, #X_checks)
-        # boundary_1 = Hz:   maps edges (qubits) → vertices (Z stabs), shape (#Z_checks, n)
-        boundary_2 = hx.T.astype(np.uint8)  # shape (7, 3) - 7 qubits, 3 X stabilizers
-        boundary_1 = hz.astype(np.uint8)    # shape (3, 7) - 3 Z stabilizers, 7 qubits
-        
-        chain_complex = CSSChainComplex3(boundary_2=boundary_2, boundary_1=boundary_1)
-
-        # Logical operators - use minimum weight representatives (weight 3)
-        logical_x = ["XXXIIII"]  # Logical X on qubits {0,1,2}, weight 3
-        logical_z = ["ZZZIIII"]  # Logical Z on qubits {0,1,2}, weight 3
-
-        # Geometric layout: triangular arrangement
-        coords = {
-            0: (1.0, 2.0),    # top vertex
-            1: (0.0, 0.0),    # bottom-left vertex
-            2: (0.5, 1.0),    # left edge center
-            3: (2.0, 0.0),    # bottom-right vertex
-            4: (1.5, 1.0),    # right edge center
-            5: (1.0, 0.0),    # bottom edge center
-            6: (1.0, 1.0),    # face center
-        }
-        data_coords = [coords[i] for i in range(7)]
-        
-        # Face centers for stabilizer coordinates (color code faces)
-        stab_coords = [
-            (1.5, 0.5),  # Face {3,4,5,6}
-            (0.5, 0.5),  # Face {1,2,5,6}
-            (1.0, 1.33), # Face {0,2,4,6}
-        ]
-
-        meta = dict(metadata or {})
-        meta["name"] = "Steane_713"
-        meta["n"] = 7
-        meta["k"] = 1
-        meta["distance"] = 3
-        meta["is_colour_code"] = True
-        meta["tiling"] = "triangular"
-        meta["data_coords"] = data_coords
-        meta["x_stab_coords"] = stab_coords
-        meta["z_stab_coords"] = stab_coords  # Self-dual
-        meta["logical_x_support"] = [0, 1, 2]
-        meta["logical_z_support"] = [0, 1, 2]
-        
+        meta = _instance_metadata(_META_STEANE, metadata, (
+            "data_coords", "x_stab_coords", "z_stab_coords",
+            "logical_x_support", "logical_z_support",
+        ))
+
         # NOTE: We deliberately omit x_schedule/z_schedule here.
         # The geometric schedule approach requires stabilizer coords + offsets to exactly
         # match data qubit coords, which is complex for colour codes. Instead, we use
         # the fallback matrix-based circuit construction in CSSMemoryExperiment.
 
-        super().__init__(chain_complex, logical_x, logical_z, metadata=meta)
-        
+        super().__init__(
+            _CHAIN_COMPLEX_STEANE,
+            list(_LOGICAL_X_STEANE),
+            list(_LOGICAL_Z_STEANE),
+            metadata=meta,
+        )
+
         # Override parity check matrices
-        self._hx = hx.astype(np.uint8)
-        self._hz = hz.astype(np.uint8)
+        self._hx = _H_STEANE
+        self._hz = _H_STEANE
+        self._seed_packed_checks(_H_BITS_STEANE, _H_BITS_STEANE)
+        self._seed_logical_supports(_LOGICAL_X_BIN_STEANE, _LOGICAL_Z_BIN_STEANE)
     
     def qubit_coords(self) -> List[Coord2D]:
         """Return qubit coordinates for visualization."""
@@ -20,6 +20,7 @@ import numpy as np
 
 from qectostim.codes.abstract_css import CSSCode
 from qectostim.codes.abstract_code import PauliString
+from qectostim.codes.utils import css_intersection_check
 
 
 class SubsystemSurfaceCode(CSSCode):
@@ -163,8 +164,7 @@ class GaugeColorCode(CSSCode):
         hz = np.array(z_stabs, dtype=np.uint8)
         
         # Ensure orthogonality
-        check = (hx @ hz.T) % 2
-        if np.any(check != 0):
+        if not css_intersection_check(hx, hz):
             # Fall back to simpler structure
             hx = np.zeros((2, n_qubits), dtype=np.uint8)
             hz = np.zeros((2, n_qubits), dtype=np.uint8)
@@ -183,19 +183,24 @@ class RotatedSurfaceCode(TopologicalCSSCode):
             (-1.0, 1.0),
             (-1.0, -1.0),
         ]
-        cols: List[List[int]] = []
-        for s in sorted(stab_coords):
-            col = [0] * n_edges
-            sx, sy = s
+        faces = sorted(stab_coords)
+        if not faces:
+            return np.zeros((n_edges, 0), dtype=np.uint8)
+        rows: List[int] = []
+        cols: List[int] = []
+        for f, (sx, sy) in enumerate(faces):
             for dx, dy in deltas:
-                nbr = (sx + dx, sy + dy)
-                idx = coord_to_index.get(nbr)
+                idx = coord_to_index.get((sx + dx, sy + dy))
                 if idx is not None:
-                    col[idx] ^= 1
-            cols.append(col)
-        if not cols:
-            return np.zeros((n_edges, 0), dtype=np.uint8)
-        return np.array(cols, dtype=np.uint8).T  # shape (#edges, #faces)
+                    rows.append(f)
+                    cols.append(idx)
+        # Fill (#faces, #edges) with one scatter instead of a dense Python
+        # list per face
+        incidence = np.zeros((len(faces), n_edges), dtype=np.uint8)
+        np.bitwise_xor.at(
+            incidence, (np.array(rows, dtype=np.intp), np.array(cols, dtype=np.intp)), 1
+        )
+        return incidence.T  # shape (#edges, #faces)
 
     # --- logicals ----------------------------------------------------------------
 
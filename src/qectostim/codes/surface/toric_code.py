@@ -19,12 +19,14 @@ Chain complex structure:
 
 from __future__ import annotations
 from typing import Dict, Any, List, Optional, Tuple
+import functools
 
 import numpy as np
 
 from qectostim.codes.abstract_css import TopologicalCSSCode, Coord2D
 from qectostim.codes.abstract_code import PauliString
 from qectostim.codes.complexes.css_complex import CSSChainComplex3
+from qectostim.codes.utils import gf2_pack, support_to_pauli_str
 
 
 class ToricCode33(TopologicalCSSCode):
@@ -48,22 +50,21 @@ class ToricCode33(TopologicalCSSCode):
         L = 3  # Lattice size
         n_qubits = 2 * L * L  # 18 qubits
         
-        # Build lattice geometry and parity check matrices
+        # The lattice is fixed, so its geometry, check matrices, chain complex
+        # and logicals are built once and shared (read-only) across instances.
         (
             data_coords,
             x_stab_coords,
             z_stab_coords,
             hx,
             hz,
-            boundary_2,
-            boundary_1,
-        ) = self._build_toric_lattice(L)
-        
-        # Create chain complex
-        chain_complex = CSSChainComplex3(boundary_2=boundary_2, boundary_1=boundary_1)
-        
-        # Build logical operators
-        logical_x, logical_z = self._build_logicals(L, n_qubits)
+            hx_bits,
+            hz_bits,
+            chain_complex,
+            logical_x,
+            logical_z,
+        ) = _toric_33_tables()
+        logical_x, logical_z = list(logical_x), list(logical_z)
         
         # Metadata
         meta: Dict[str, Any] = dict(metadata or {})
@@ -73,9 +74,9 @@ class ToricCode33(TopologicalCSSCode):
             "k": 2,
             "distance": L,
             "lattice_size": L,
-            "data_coords": data_coords,
-            "x_stab_coords": x_stab_coords,
-            "z_stab_coords": z_stab_coords,
+            "data_coords": list(data_coords),
+            "x_stab_coords": list(x_stab_coords),
+            "z_stab_coords": list(z_stab_coords),
             "logical_x_support": list(range(L)),
             "logical_z_support": list(range(L * L, L * L + L)),
         })
@@ -100,6 +101,7 @@ class ToricCode33(TopologicalCSSCode):
         # Override with explicit X/Z parity check matrices
         self._hx = hx
         self._hz = hz
+        self._seed_packed_checks(hx_bits, hz_bits)
 
     @staticmethod
     def _build_toric_lattice(L: int) -> Tuple[
@@ -114,41 +116,38 @@ class ToricCode33(TopologicalCSSCode):
         """Build the toric code lattice, parity check matrices, and chain complex."""
         n_qubits = 2 * L * L
         
-        # Edge indexing functions
+        # Edge indexing: horizontal edge (row, col) is qubit (row % L) * L +
+        # (col % L); vertical edges follow at offset L * L. Every site (i, j)
+        # is handled at once through its row-major index arrays.
         def h_edge(row, col):
             return (row % L) * L + (col % L)
         
         def v_edge(row, col):
             return L * L + (row % L) * L + (col % L)
         
-        # Data qubit coordinates
-        coords = {}
-        for i in range(L):
-            for j in range(L):
-                coords[h_edge(i, j)] = (j + 0.5, float(i))
-                coords[v_edge(i, j)] = (float(j), i + 0.5)
-        data_coords = [coords.get(i, (0.0, 0.0)) for i in range(n_qubits)]
+        sites = np.arange(L * L)
+        i, j = np.divmod(sites, L)
+        
+        # Data qubit coordinates (horizontal edges, then vertical edges)
+        data_coords = (
+            [(c + 0.5, float(r)) for r in range(L) for c in range(L)]
+            + [(float(c), r + 0.5) for r in range(L) for c in range(L)]
+        )
         
         # X-type stabilizers (plaquette/face operators)
         hx_full = np.zeros((L * L, n_qubits), dtype=np.uint8)
-        for i in range(L):
-            for j in range(L):
-                plaq_idx = i * L + j
-                hx_full[plaq_idx, h_edge(i, j)] = 1
-                hx_full[plaq_idx, h_edge((i + 1) % L, j)] = 1
-                hx_full[plaq_idx, v_edge(i, j)] = 1
-                hx_full[plaq_idx, v_edge(i, (j + 1) % L)] = 1
+        hx_full[sites, h_edge(i, j)] = 1
+        hx_full[sites, h_edge(i + 1, j)] = 1
+        hx_full[sites, v_edge(i, j)] = 1
+        hx_full[sites, v_edge(i, j + 1)] = 1
         hx = hx_full[:-1]  # Remove last dependent row
         
         # Z-type stabilizers (vertex/star operators)
         hz_full = np.zeros((L * L, n_qubits), dtype=np.uint8)
-        for i in range(L):
-            for j in range(L):
-                vertex_idx = i * L + j
-                hz_full[vertex_idx, h_edge(i, j)] = 1
-                hz_full[vertex_idx, h_edge(i, (j - 1) % L)] = 1
-                hz_full[vertex_idx, v_edge(i, j)] = 1
-                hz_full[vertex_idx, v_edge((i - 1) % L, j)] = 1
+        hz_full[sites, h_edge(i, j)] = 1
+        hz_full[sites, h_edge(i, j - 1)] = 1
+        hz_full[sites, v_edge(i, j)] = 1
+        hz_full[sites, v_edge(i - 1, j)] = 1
         hz = hz_full[:-1]  # Remove last dependent row
         
         # Build chain complex boundary matrices
@@ -169,33 +168,26 @@ class ToricCode33(TopologicalCSSCode):
     @staticmethod
     def _build_logicals(L: int, n_qubits: int) -> Tuple[List[str], List[str]]:
         """Build logical operators for toric code."""
-        def h_edge(row, col):
-            return (row % L) * L + (col % L)
-        
-        def v_edge(row, col):
-            return L * L + (row % L) * L + (col % L)
+        # Horizontal edges of row r are qubits r*L .. r*L + L-1; vertical
+        # edges follow at offset L*L with the same row-major layout.
+        row0_h = range(L)                           # h_edge(0, j)
+        col0_h = range(0, L * L, L)                 # h_edge(i, 0)
+        row0_v = range(L * L, L * L + L)            # v_edge(0, j)
+        col0_v = range(L * L, 2 * L * L, L)         # v_edge(i, 0)
         
         # Logical X1: horizontal string (all horizontal edges in row 0)
-        lx1 = ['I'] * n_qubits
-        for j in range(L):
-            lx1[h_edge(0, j)] = 'X'
-        
-        # Logical Z1: vertical string (all vertical edges in column 0)
-        lz1 = ['I'] * n_qubits
-        for i in range(L):
-            lz1[v_edge(i, 0)] = 'Z'
-        
         # Logical X2: vertical string (all vertical edges in row 0)
-        lx2 = ['I'] * n_qubits
-        for j in range(L):
-            lx2[v_edge(0, j)] = 'X'
-        
+        # Logical Z1: vertical string (all vertical edges in column 0)
         # Logical Z2: horizontal string (all horizontal edges in column 0)
-        lz2 = ['I'] * n_qubits
-        for i in range(L):
-            lz2[h_edge(i, 0)] = 'Z'
-        
-        return [''.join(lx1), ''.join(lx2)], [''.join(lz1), ''.join(lz2)]
+        logical_x = [
+            support_to_pauli_str(row0_h, n_qubits, 'X'),
+            support_to_pauli_str(row0_v, n_qubits, 'X'),
+        ]
+        logical_z = [
+            support_to_pauli_str(col0_v, n_qubits, 'Z'),
+            support_to_pauli_str(col0_h, n_qubits, 'Z'),
+        ]
+        return logical_x, logical_z
 
     def qubit_coords(self) -> List[Coord2D]:
         """Return 2D coordinates for data qubits."""
@@ -215,3 +207,56 @@ class ToricCode33(TopologicalCSSCode):
     def distance(self) -> int:
         """Code distance."""
         return self.metadata.get("distance", 3)
+
+
+@functools.lru_cache(maxsize=None)
+def _toric_33_tables() -> Tuple[
+    Tuple[Coord2D, ...],   # data_coords
+    Tuple[Coord2D, ...],   # x_stab_coords
+    Tuple[Coord2D, ...],   # z_stab_coords
+    np.ndarray,            # hx (read-only)
+    np.ndarray,            # hz (read-only)
+    np.ndarray,            # hx bit-packed into uint64 words
+    np.ndarray,            # hz bit-packed into uint64 words
+    CSSChainComplex3,      # chain_complex
+    Tuple[str, ...],       # logical_x
+    Tuple[str, ...],       # logical_z
+]:
+    """Build the fixed 3x3 toric lattice once; every ToricCode33 shares it."""
+    L = 3
+    n_qubits = 2 * L * L
+    (
+        data_coords,
+        x_stab_coords,
+        z_stab_coords,
+        hx,
+        hz,
+        boundary_2,
+        boundary_1,
+    ) = ToricCode33._build_toric_lattice(L)
+    hx.setflags(write=False)
+    hz.setflags(write=False)
+    boundary_2.setflags(write=False)
+    boundary_1.setflags(write=False)
+    # 18 qubits fit in one word, so each check is a single uint64
+    hx_bits = gf2_pack(hx)[0]
+    hz_bits = gf2_pack(hz)[0]
+    hx_bits.setflags(write=False)
+    hz_bits.setflags(write=False)
+    chain_complex = CSSChainComplex3(boundary_2=boundary_2, boundary_1=boundary_1)
+    logical_x, logical_z = ToricCode33._build_logicals(L, n_qubits)
+    return (
+        tuple(data_coords),
+        tuple(x_stab_coords),
+        tuple(z_stab_coords),
+        hx,
+        hz,
+        hx_bits,
+        hz_bits,
+        chain_complex,
+        tuple(logical_x),
+        tuple(logical_z),
+    )
+
+
+__all__ = ["ToricCode33"]
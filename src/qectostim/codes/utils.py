@@ -12,13 +12,302 @@ All matrix operations are performed over GF(2) (mod 2 arithmetic).
 """
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 import numpy as np
 
+try:
+    import numba
+except ImportError:  # numba is an optional accelerator
+    numba = None
+
 from .abstract_code import PauliString
 
 
+# ============================================================================
+# Bit-packed GF(2) Operations
+# ============================================================================
+#
+# Rows are stored as little-endian uint64 words: column ``j`` lives in bit
+# ``j % 64`` of word ``j // 64``. Row addition is then a single XOR over
+# ``ceil(ncols / 64)`` words and inner products reduce to the parity of
+# ``popcount(a & b)``.
+
+_WORD_BITS = 64
+
+
+def gf2_pack(matrix: np.ndarray) -> Tuple[np.ndarray, int]:
+    """
+    Pack a binary matrix into uint64 words along its rows.
+
+    Parameters
+    ----------
+    matrix : np.ndarray
+        Binary matrix of shape (m, n), or a single vector of shape (n,).
+        Entries are reduced mod 2.
+
+    Returns
+    -------
+    packed : np.ndarray
+        Array of shape (m, ceil(n / 64)) and dtype uint64.
+    ncols : int
+        Number of columns n of the unpacked matrix.
+    """
+    mat = np.asarray(matrix, dtype=np.uint8)
+    if mat.ndim == 1:
+        mat = mat.reshape(1, -1)
+    nrows, ncols = mat.shape
+    nwords = max(1, -(-ncols // _WORD_BITS))
+
+    padded = np.zeros((nrows, nwords * _WORD_BITS), dtype=np.uint8)
+    np.bitwise_and(mat, 1, out=padded[:, :ncols])
+    packed = np.packbits(padded, axis=1, bitorder="little")
+    return packed.view("<u8").astype(np.uint64, copy=False), ncols
+
+
+def gf2_unpack(packed: np.ndarray, ncols: int) -> np.ndarray:
+    """
+    Inverse of :func:`gf2_pack`.
+
+    Parameters
+    ----------
+    packed : np.ndarray
+        uint64 array of shape (m, words).
+    ncols : int
+        Number of columns to unpack.
+
+    Returns
+    -------
+    np.ndarray
+        uint8 matrix of shape (m, ncols).
+    """
+    as_bytes = np.ascontiguousarray(packed, dtype="<u8").view(np.uint8)
+    return np.unpackbits(as_bytes, axis=1, count=ncols, bitorder="little")
+
+
+def gf2_packed_rref(packed: np.ndarray, ncols: int) -> Tuple[np.ndarray, List[int]]:
+    """
+    Reduced row echelon form of a bit-packed matrix, computed in place.
+
+    When numba is installed the elimination runs as a compiled kernel;
+    otherwise the vectorised Method of Four Russians routine is used.
+
+    Parameters
+    ----------
+    packed : np.ndarray
+        uint64 array from :func:`gf2_pack`. It is overwritten.
+    ncols : int
+        Number of meaningful columns.
+
+    Returns
+    -------
+    packed : np.ndarray
+        The same array, now in RREF.
+    pivot_cols : List[int]
+        List of pivot column indices.
+    """
+    if _gf2_packed_rref_jit is not None:
+        pivots = _gf2_packed_rref_jit(packed, ncols)
+        return packed, pivots.tolist()
+    return _gf2_packed_rref_m4ri(packed, ncols)
+
+
+def _gf2_packed_rref_m4ri(packed: np.ndarray, ncols: int) -> Tuple[np.ndarray, List[int]]:
+    """
+    NumPy RREF of a bit-packed matrix, computed in place.
+
+    Uses the Method of Four Russians (M4RI): columns are processed in
+    stripes of up to ``k ~ log2(nrows)`` (at most 8) columns. The pivots of
+    a stripe are found on the stripe bits alone, fully reduced against each
+    other, and all ``2^k`` XOR combinations of the pivot rows are tabulated.
+    Every other row is then cleared with a single table lookup and XOR
+    instead of one XOR per pivot.
+
+    See :func:`gf2_packed_rref` for parameters and return values.
+    """
+    nrows = packed.shape[0]
+    pivot_cols: List[int] = []
+    k = min(8, max(1, nrows.bit_length() - 1))
+
+    row = 0
+    col = 0
+    while col < ncols and row < nrows:
+        word, bit = divmod(col, _WORD_BITS)
+        width = min(k, _WORD_BITS - bit, ncols - col)
+        shift = np.uint64(bit)
+        stripe_mask = np.uint64((1 << width) - 1)
+
+        # Find the stripe's pivots using only the stripe bits of the rows below
+        below = (packed[row:, word] >> shift) & stripe_mask
+        free = np.ones(below.shape[0], dtype=bool)
+        local_rows: List[int] = []
+        local_bits: List[int] = []
+        for j in range(width):
+            has_bit = ((below >> np.uint64(j)) & np.uint64(1)).astype(bool)
+            candidates = np.flatnonzero(has_bit & free)
+            if candidates.size == 0:
+                continue
+            i = int(candidates[0])
+            free[i] = False
+            has_bit[i] = False
+            below[has_bit] ^= below[i]
+            local_rows.append(i)
+            local_bits.append(j)
+
+        if not local_rows:
+            col += width
+            continue
+
+        # Materialise the pivot rows and reduce them against each other
+        pivots = packed[row + np.array(local_rows)]
+        pivot_masks = [np.uint64(1) << np.uint64(bit + j) for j in local_bits]
+        for t in range(len(local_rows)):
+            for s in range(t):
+                if pivots[t, word] & pivot_masks[s]:
+                    pivots[t] ^= pivots[s]
+        for t in range(len(local_rows) - 1, -1, -1):
+            for s in range(t + 1, len(local_rows)):
+                if pivots[t, word] & pivot_masks[s]:
+                    pivots[t] ^= pivots[s]
+
+        # Move pivot rows up to the current row position
+        npiv = len(local_rows)
+        rest = np.flatnonzero(free)
+        packed[row + npiv:] = packed[row:][rest]
+        packed[row:row + npiv] = pivots
+
+        # Table of all 2^npiv XOR combinations of the pivot rows, one XOR each
+        table = np.zeros((1 << npiv, packed.shape[1]), dtype=np.uint64)
+        for t in range(npiv):
+            table[1 << t:2 << t] = table[:1 << t] ^ pivots[t]
+
+        # Clear the pivot columns from every other row with one lookup each
+        others = np.concatenate([np.arange(row), np.arange(row + npiv, nrows)])
+        if others.size:
+            words_col = packed[others, word]
+            index = np.zeros(others.size, dtype=np.intp)
+            for t in range(npiv):
+                index |= ((words_col & pivot_masks[t]) != 0).astype(np.intp) << t
+            packed[others] ^= table[index]
+
+        pivot_cols.extend(col + j for j in local_bits)
+        row += npiv
+        col += width
+
+    return packed, pivot_cols
+
+
+if numba is not None:
+
+    @numba.njit(cache=True)
+    def _gf2_packed_rref_jit(packed, ncols):  # pragma: no cover - compiled
+        nrows, nwords = packed.shape
+        pivots = np.empty(min(nrows, ncols), dtype=np.int64)
+        npiv = 0
+        row = 0
+        for col in range(ncols):
+            if row >= nrows:
+                break
+            word = col // 64
+            mask = np.uint64(1) << np.uint64(col % 64)
+
+            pivot_row = -1
+            for r in range(row, nrows):
+                if packed[r, word] & mask:
+                    pivot_row = r
+                    break
+            if pivot_row < 0:
+                continue
+
+            if pivot_row != row:
+                for w in range(nwords):
+                    tmp = packed[row, w]
+                    packed[row, w] = packed[pivot_row, w]
+                    packed[pivot_row, w] = tmp
+
+            # Rows at or below `row` are zero before `col`, so the pivot row
+            # has no bits in earlier words and the XOR can start at `word`
+            for r in range(nrows):
+                if r != row and packed[r, word] & mask:
+                    for w in range(word, nwords):
+                        packed[r, w] ^= packed[row, w]
+
+            pivots[npiv] = col
+            npiv += 1
+            row += 1
+        return pivots[:npiv]
+
+else:
+    _gf2_packed_rref_jit = None
+
+
+def _word_parity(words: np.ndarray) -> np.ndarray:
+    """Parity of the popcount of each uint64 word, as uint8."""
+    if hasattr(np, "bitwise_count"):
+        return (np.bitwise_count(words) & 1).astype(np.uint8)
+    x = words.copy()
+    for shift in (32, 16, 8, 4, 2, 1):
+        x ^= x >> np.uint64(shift)
+    return (x & np.uint64(1)).astype(np.uint8)
+
+
+def gf2_packed_matmul(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Compute ``A @ B.T`` over GF(2) for two bit-packed matrices.
+
+    Entry (i, j) is ``popcount(a[i] & b[j]) & 1``; the words of each AND are
+    XOR-folded first so only one popcount is needed per entry.
+
+    Parameters
+    ----------
+    a : np.ndarray
+        Packed uint64 matrix of shape (ma, words).
+    b : np.ndarray
+        Packed uint64 matrix of shape (mb, words).
+
+    Returns
+    -------
+    np.ndarray
+        uint8 matrix of shape (ma, mb).
+    """
+    ma, mb = a.shape[0], b.shape[0]
+    out = np.zeros((ma, mb), dtype=np.uint8)
+    if ma == 0 or mb == 0:
+        return out
+
+    # Bound the (block, mb, words) temporary to ~1M words
+    block = max(1, (1 << 20) // max(1, mb * a.shape[1]))
+    for start in range(0, ma, block):
+        stop = min(start + block, ma)
+        folded = np.bitwise_xor.reduce(a[start:stop, None, :] & b[None, :, :], axis=-1)
+        out[start:stop] = _word_parity(folded)
+    return out
+
+
+def gf2_packed_dot(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Row-wise GF(2) inner products of two bit-packed matrices.
+
+    Entry i is ``popcount(a[i] & b[i]) & 1``, i.e. the diagonal of
+    ``gf2_packed_matmul(a, b)`` without computing the off-diagonal terms.
+
+    Parameters
+    ----------
+    a : np.ndarray
+        Packed uint64 matrix of shape (m, words).
+    b : np.ndarray
+        Packed uint64 matrix of shape (m, words).
+
+    Returns
+    -------
+    np.ndarray
+        uint8 vector of length m.
+    """
+    if a.shape[0] == 0:
+        return np.zeros(0, dtype=np.uint8)
+    return _word_parity(np.bitwise_xor.reduce(a & b, axis=1))
+
+
 # ============================================================================
 # GF(2) Matrix Operations
 # ============================================================================
@@ -50,35 +339,9 @@ def gf2_rref(matrix: np.ndarray) -> Tuple[np.ndarray, List[int]]:
     >>> print(pivots)
     [0, 1, 2]
     """
-    mat = np.array(matrix, dtype=np.uint8) % 2
-    nrows, ncols = mat.shape
-    pivot_cols: List[int] = []
-    
-    row = 0
-    for col in range(ncols):
-        if row >= nrows:
-            break
-        # Find pivot in this column
-        pivot_row = None
-        for r in range(row, nrows):
-            if mat[r, col]:
-                pivot_row = r
-                break
-        if pivot_row is None:
-            continue
-        
-        # Swap rows
-        mat[[row, pivot_row]] = mat[[pivot_row, row]]
-        pivot_cols.append(col)
-        
-        # Eliminate all other entries in this column
-        for r in range(nrows):
-            if r != row and mat[r, col]:
-                mat[r] = (mat[r] + mat[row]) % 2
-        
-        row += 1
-    
-    return mat, pivot_cols
+    packed, ncols = gf2_pack(matrix)
+    packed, pivot_cols = gf2_packed_rref(packed, ncols)
+    return gf2_unpack(packed, ncols), pivot_cols
 
 
 def gf2_rank(matrix: np.ndarray) -> int:
@@ -97,10 +360,51 @@ def gf2_rank(matrix: np.ndarray) -> int:
     """
     if matrix.size == 0:
         return 0
-    _, pivots = gf2_rref(matrix)
+    # rank(A) == rank(A.T); elimination cost scales with the row count, so
+    # eliminate whichever orientation has fewer rows.
+    if matrix.ndim == 2 and matrix.shape[0] > matrix.shape[1]:
+        matrix = matrix.T
+    packed, ncols = gf2_pack(matrix)
+    _, pivots = gf2_packed_rref(packed, ncols)
     return len(pivots)
 
 
+class GF2Analysis(NamedTuple):
+    """Everything derived from a single GF(2) RREF of a matrix."""
+    rref: np.ndarray
+    pivots: List[int]
+    rank: int
+    rowspace: np.ndarray
+
+
+def gf2_analyse(matrix: np.ndarray) -> GF2Analysis:
+    """
+    Run one RREF over GF(2) and read off rank and row space.
+    
+    Callers that need several of rank, row space or pivots should use this
+    rather than calling `gf2_rref` and `gf2_rank` separately, so the matrix
+    is only eliminated once.
+    
+    Parameters
+    ----------
+    matrix : np.ndarray
+        Binary matrix of shape (m, n). An empty 1D array is treated as a
+        matrix with no rows and no columns.
+        
+    Returns
+    -------
+    GF2Analysis
+        ``rref`` (m, n), ``pivots`` (pivot column per RREF row), ``rank``
+        and ``rowspace`` (the first ``rank`` rows of ``rref``).
+    """
+    matrix = np.asarray(matrix, dtype=np.uint8)
+    if matrix.ndim != 2:
+        matrix = matrix.reshape(-1, matrix.shape[-1]) if matrix.size else np.zeros((0, 0), dtype=np.uint8)
+    rref, pivots = gf2_rref(matrix)
+    rank = len(pivots)
+    return GF2Analysis(rref=rref, pivots=pivots, rank=rank, rowspace=rref[:rank])
+
+
 def gf2_kernel(matrix: np.ndarray) -> np.ndarray:
     """
     Compute the kernel (null space) of a binary matrix over GF(2).
@@ -118,7 +422,7 @@ def gf2_kernel(matrix: np.ndarray) -> np.ndarray:
         Matrix of shape (dim_kernel, n) whose rows span the kernel.
         Returns empty array of shape (0, n) if kernel is trivial.
     """
-    mat = np.array(matrix, dtype=np.uint8) % 2
+    mat = np.asarray(matrix, dtype=np.uint8) & 1
     nrows, ncols = mat.shape
     
     if nrows == 0:
@@ -209,8 +513,8 @@ def gf2_solve(A: np.ndarray, b: np.ndarray) -> Optional[np.ndarray]:
     Optional[np.ndarray]
         A solution vector x of shape (n,), or None if no solution exists.
     """
-    A = np.array(A, dtype=np.uint8) % 2
-    b = np.array(b, dtype=np.uint8) % 2
+    A = np.asarray(A, dtype=np.uint8) & 1
+    b = np.asarray(b, dtype=np.uint8) & 1
     
     m, n = A.shape
     # Augment [A | b]
@@ -251,7 +555,7 @@ def kron_gf2(A: np.ndarray, B: np.ndarray) -> np.ndarray:
     np.ndarray
         Kronecker product of shape (m1*m2, n1*n2), reduced mod 2.
     """
-    return (np.kron(A, B) % 2).astype(np.uint8)
+    return np.kron(A, B).astype(np.uint8) & 1
 
 
 def block_diag_gf2(blocks: List[np.ndarray]) -> np.ndarray:
@@ -280,7 +584,7 @@ def block_diag_gf2(blocks: List[np.ndarray]) -> np.ndarray:
     col_offset = 0
     for block in blocks:
         r, c = block.shape
-        result[row_offset:row_offset + r, col_offset:col_offset + c] = block % 2
+        result[row_offset:row_offset + r, col_offset:col_offset + c] = np.asarray(block, dtype=np.uint8) & 1
         row_offset += r
         col_offset += c
     
@@ -311,7 +615,7 @@ def symplectic_inner_product(v1: np.ndarray, v2: np.ndarray) -> int:
     n = len(v1) // 2
     x1, z1 = v1[:n], v1[n:]
     x2, z2 = v2[:n], v2[n:]
-    return int((np.dot(x1, z2) + np.dot(z1, x2)) % 2)
+    return int(np.dot(x1, z2) + np.dot(z1, x2)) & 1
 
 
 def check_commutation(stab1: np.ndarray, stab2: np.ndarray) -> bool:
@@ -446,10 +750,82 @@ def pauli_to_str(pauli: PauliString, n: int) -> str:
     >>> pauli_to_str({0: 'X', 1: 'X', 3: 'Z'}, 4)
     'XXIZ'
     """
-    result = ['I'] * n
+    buf = bytearray(b'I' * n)
     for i, op in pauli.items():
-        result[i] = op
-    return ''.join(result)
+        buf[i] = ord(op)
+    return buf.decode('ascii')
+
+
+def support_to_pauli_str(support, n: int, pauli_type: str) -> str:
+    """
+    Build a length-n Pauli string with ``pauli_type`` on ``support``.
+    
+    Parameters
+    ----------
+    support : iterable of int
+        Qubit indices carrying the non-identity Pauli.
+    n : int
+        Total number of qubits.
+    pauli_type : str
+        Single Pauli character ('X', 'Y' or 'Z').
+        
+    Returns
+    -------
+    str
+        String of Pauli operators of length n.
+        
+    Example
+    -------
+    >>> support_to_pauli_str([0, 2], 4, 'Z')
+    'ZIZI'
+    """
+    buf = bytearray(b'I' * n)
+    op = ord(pauli_type)
+    for i in support:
+        buf[i] = op
+    return buf.decode('ascii')
+
+
+def pauli_strings_to_matrix(
+    paulis: List[PauliString],
+    n: int,
+    pauli_type: str,
+) -> np.ndarray:
+    """
+    Stack the X- or Z-support of several Pauli operators into one matrix.
+
+    Row i has a 1 wherever ``paulis[i]`` acts as ``pauli_type`` or Y.
+    Accepts strings ("XXIZ"), dicts ({0: 'X'}) and symplectic vectors.
+
+    Parameters
+    ----------
+    paulis : List[PauliString]
+        Pauli operators to convert.
+    n : int
+        Total number of qubits.
+    pauli_type : str
+        'X' or 'Z'.
+
+    Returns
+    -------
+    np.ndarray
+        uint8 matrix of shape (len(paulis), n).
+    """
+    mat = np.zeros((len(paulis), n), dtype=np.uint8)
+    wanted = (pauli_type, 'Y')
+    codes = np.frombuffer(''.join(wanted).encode('ascii'), dtype=np.uint8)
+    for i, pauli in enumerate(paulis):
+        if isinstance(pauli, str):
+            chars = np.frombuffer(pauli[:n].encode('ascii'), dtype=np.uint8)
+            mat[i, :chars.size] = np.isin(chars, codes)
+        elif isinstance(pauli, dict):
+            support = [q for q, p in pauli.items() if p in wanted]
+            mat[i, support] = 1
+        elif isinstance(pauli, np.ndarray):
+            offset = 0 if pauli_type == 'X' else n
+            part = np.asarray(pauli[offset:offset + n], dtype=np.uint8)
+            mat[i, :part.size] = part & 1
+    return mat
 
 
 def pauli_product(p1: PauliString, p2: PauliString, n: int) -> PauliString:
@@ -470,7 +846,7 @@ def pauli_product(p1: PauliString, p2: PauliString, n: int) -> PauliString:
     """
     v1 = pauli_to_symplectic(p1, n)
     v2 = pauli_to_symplectic(p2, n)
-    v_prod = (v1 + v2) % 2
+    v_prod = v1 ^ v2
     return symplectic_to_pauli(v_prod)
 
 
@@ -601,6 +977,30 @@ def binary_row_to_z_stabilizer(row: np.ndarray, offset: int = 0) -> PauliString:
     return {offset + i: 'Z' for i, bit in enumerate(row) if bit}
 
 
+def binary_csr(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compressed-sparse-row supports of a binary matrix.
+    
+    Parameters
+    ----------
+    matrix : np.ndarray
+        Binary (m, n) matrix.
+        
+    Returns
+    -------
+    indptr : np.ndarray
+        Row offsets of length m + 1 (int64).
+    indices : np.ndarray
+        Column indices of the nonzero entries, row by row in ascending
+        order; row ``i`` is ``indices[indptr[i]:indptr[i + 1]]``.
+    """
+    matrix = np.atleast_2d(np.asarray(matrix))
+    rows, cols = np.nonzero(matrix)
+    indptr = np.zeros(matrix.shape[0] + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=matrix.shape[0]), out=indptr[1:])
+    return indptr, cols.astype(np.int64, copy=False)
+
+
 # ============================================================================
 # Utility Functions for Composite Codes
 # ============================================================================
@@ -619,7 +1019,7 @@ def css_intersection_check(hx: np.ndarray, hz: np.ndarray) -> bool:
     bool
         True if the CSS constraint is satisfied.
     """
-    return np.all((hx @ hz.T) % 2 == 0)
+    return not np.any(gf2_packed_matmul(gf2_pack(hx)[0], gf2_pack(hz)[0]))
 
 
 def compute_css_logicals(
@@ -701,9 +1101,17 @@ def vectors_to_paulis_z(vectors: List[np.ndarray]) -> List[PauliString]:
 # ============================================================================
 
 __all__ = [
+    # Bit-packed GF(2) operations
+    'gf2_pack',
+    'gf2_unpack',
+    'gf2_packed_rref',
+    'gf2_packed_matmul',
+    'gf2_packed_dot',
     # GF(2) operations
     'gf2_rref',
     'gf2_rank',
+    'GF2Analysis',
+    'gf2_analyse',
     'gf2_kernel',
     'gf2_nullspace',
     'gf2_rowspace',
@@ -721,10 +1129,13 @@ __all__ = [
     'pauli_weight',
     'pauli_support',
     'pauli_product',
+    'pauli_strings_to_matrix',
+    'support_to_pauli_str',
     # Lifting
     'lift_pauli_through_inner',
     'binary_row_to_x_stabilizer',
     'binary_row_to_z_stabilizer',
+    'binary_csr',
     # CSS utilities
     'css_intersection_check',
     'compute_css_logicals',
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
 
 import numpy as np
 
@@ -12,3 +13,158 @@ class Decoder(ABC):
     @abstractmethod
     def decode_batch(self, dets: np.ndarray) -> Any:
         ...
+
+
+def _prepare_dets(dets: Any, num_detectors: int, owner: str) -> np.ndarray:
+    """Return ``dets`` as a 2-D uint8 batch of width ``num_detectors``.
+
+    A batch that already has that form is returned as-is, without the
+    conversion and reshape round-trip.
+    """
+    if (
+        isinstance(dets, np.ndarray)
+        and dets.dtype == np.uint8
+        and dets.ndim == 2
+        and dets.shape[1] == num_detectors
+    ):
+        return dets
+    dets = np.asarray(dets, dtype=np.uint8)
+    if dets.ndim == 1:
+        dets = dets.reshape(1, -1)
+    if dets.shape[1] != num_detectors:
+        raise ValueError(
+            f"{owner}: expected dets.shape[1]={num_detectors}, "
+            f"got {dets.shape[1]}"
+        )
+    return dets
+
+
+def _prepare_packed_dets(packed_dets: Any, num_detectors: int, owner: str) -> np.ndarray:
+    """Return bit-packed ``packed_dets`` as a 2-D uint8 batch, checking its width.
+
+    Rows use stim's little-endian layout (``sample(..., bit_packed=True)``),
+    ``ceil(num_detectors / 8)`` bytes each.
+    """
+    packed_dets = np.asarray(packed_dets, dtype=np.uint8)
+    if packed_dets.ndim == 1:
+        packed_dets = packed_dets.reshape(1, -1)
+    width = (num_detectors + 7) // 8
+    if packed_dets.shape[1] != width:
+        raise ValueError(
+            f"{owner}: expected packed dets.shape[1]={width}, "
+            f"got {packed_dets.shape[1]}"
+        )
+    return packed_dets
+
+
+def _decode_packed_chunks(
+    decode: Callable[[np.ndarray], np.ndarray],
+    packed_dets: np.ndarray,
+    num_detectors: int,
+    num_observables: int,
+    chunk_shots: int = 4096,
+) -> np.ndarray:
+    """Run a dense ``decode`` over bit-packed shots, unpacking a chunk at a time.
+
+    Only ``chunk_shots`` rows are ever held one byte per bit; predictions
+    come back packed in the same little-endian layout.
+    """
+    shots = packed_dets.shape[0]
+    out = np.zeros((shots, (num_observables + 7) // 8), dtype=np.uint8)
+    for start in range(0, shots, chunk_shots):
+        stop = min(start + chunk_shots, shots)
+        dense = np.unpackbits(
+            packed_dets[start:stop], axis=1, count=num_detectors, bitorder="little"
+        )
+        out[start:stop] = np.packbits(decode(dense), axis=1, bitorder="little")
+    return out
+
+
+def _as_uint8(corrections: Any) -> np.ndarray:
+    """View a backend's 0/1 predictions as uint8, copying only when needed.
+
+    Boolean results are reinterpreted in place rather than converted.
+    """
+    corrections = np.asarray(corrections)
+    if corrections.dtype == np.bool_:
+        return corrections.view(np.uint8)
+    return corrections.astype(np.uint8, copy=False)
+
+
+class _ParallelDecodeMixin(ABC):
+    """Split large batches into row chunks decoded on a thread pool.
+
+    For wrappers whose backend decodes shots in native code. Backend
+    objects carry mutable decoding state, so every worker gets its own
+    instance, built on first use. Subclasses provide ``n_workers`` and
+    ``min_parallel_shots`` fields, keep their primary backend in
+    ``self._decoder`` and implement ``_make_backend`` and
+    ``_decode_batch_impl``. Leaving ``self._decoder`` as None defers the
+    primary backend (and the import of its library) to the first decode.
+    With ``n_workers == 1`` (the default in the wrappers) decoding
+    stays serial; otherwise one thread pool of ``n_workers`` threads is
+    created on the first parallel batch and reused by later ones. An
+    ``out`` buffer, when given, receives the predictions directly so
+    sampling loops can reuse one array across calls.
+    """
+
+    @abstractmethod
+    def _make_backend(self) -> Any:
+        """Build one backend decoder for ``self.dem``."""
+
+    @abstractmethod
+    def _decode_batch_impl(self, backend: Any, dets: np.ndarray) -> np.ndarray:
+        """Decode a dense batch with ``backend``, returning uint8 predictions."""
+
+    def _ensure_built(self) -> Any:
+        if self._decoder is None:
+            self._decoder = self._make_backend()
+        return self._decoder
+
+    def _decode_parallel(
+        self, dets: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        primary = self._ensure_built()
+        if out is not None:
+            expected = (dets.shape[0], self.num_observables)
+            if out.shape != expected or out.dtype != np.uint8:
+                raise ValueError(
+                    f"{type(self).__name__}: out must be a uint8 array of shape "
+                    f"{expected}, got {out.dtype} {out.shape}"
+                )
+        n_workers = max(1, int(self.n_workers))
+        if n_workers == 1 or dets.shape[0] < max(self.min_parallel_shots, n_workers):
+            if out is None:
+                return self._decode_batch_impl(primary, dets)
+            self._decode_into(primary, dets, out)
+            return out
+        backends = self._worker_backends(n_workers)
+        chunks = np.array_split(dets, n_workers)
+        pool = self._worker_pool(n_workers)
+        if out is None:
+            results = list(pool.map(self._decode_batch_impl, backends, chunks))
+            return np.concatenate(results, axis=0)
+        # Each worker writes its rows straight into the caller's buffer
+        list(pool.map(self._decode_into, backends, chunks, np.array_split(out, n_workers)))
+        return out
+
+    def _decode_into(self, backend: Any, dets: np.ndarray, dest: np.ndarray) -> None:
+        # Subclasses that can write predictions in place override this
+        np.copyto(dest, self._decode_batch_impl(backend, dets))
+
+    def _worker_backends(self, n_workers: int) -> List[Any]:
+        backends = getattr(self, "_backends", None) or [self._decoder]
+        while len(backends) < n_workers:
+            backends.append(self._make_backend())
+        self._backends = backends
+        return backends[:n_workers]
+
+    def _worker_pool(self, n_workers: int) -> ThreadPoolExecutor:
+        # One pool per decoder, rebuilt only if n_workers has changed
+        sized = getattr(self, "_pool", None)
+        if sized is None or sized[0] != n_workers:
+            if sized is not None:
+                sized[1].shutdown(wait=False)
+            sized = (n_workers, ThreadPoolExecutor(max_workers=n_workers))
+            self._pool = sized
+        return sized[1]
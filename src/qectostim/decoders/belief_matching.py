@@ -1,17 +1,18 @@
 # src/qectostim/decoders/beliefmatching_decoder.py
 from __future__ import annotations
 
+import importlib.util
 from dataclasses import dataclass
 from typing import Any, Optional
 
 import numpy as np
 import stim
 
-from qectostim.decoders.base import Decoder
+from qectostim.decoders.base import Decoder, _ParallelDecodeMixin, _as_uint8, _prepare_dets
 
 
 @dataclass
-class BeliefMatchingDecoder(Decoder):
+class BeliefMatchingDecoder(_ParallelDecodeMixin, Decoder):
     """Decoder using the `beliefmatching` package on Stim DEMs.
     
     Uses belief propagation combined with minimum-weight perfect matching.
@@ -26,42 +27,35 @@ class BeliefMatchingDecoder(Decoder):
         Maximum number of belief propagation iterations.
     bp_method : str, default='product_sum'
         BP algorithm variant. Options: 'product_sum', 'minimum_sum'.
+    n_workers : int, default=1
+        Threads used by ``decode_batch``; each gets its own BeliefMatching instance.
+    min_parallel_shots : int, default=1024
+        Batches smaller than this are always decoded serially.
     """
 
     dem: stim.DetectorErrorModel
     max_bp_iters: int = 20
     bp_method: str = "product_sum"
+    n_workers: int = 1
+    min_parallel_shots: int = 1024
 
     def __post_init__(self) -> None:
-        try:
-            from beliefmatching import BeliefMatching  # type: ignore
-        except ImportError as exc:
+        # Only check that beliefmatching is installed; importing it and
+        # building the matching graph wait until the first decode_batch call.
+        if importlib.util.find_spec("beliefmatching") is None:
             raise ImportError(
                 "BeliefMatchingDecoder requires the `beliefmatching` package. "
                 "Install it via `pip install beliefmatching`."
-            ) from exc
+            )
 
         self.num_detectors = self.dem.num_detectors
         self.num_observables = self.dem.num_observables
 
-        # BeliefMatching accepts the DEM directly and handles hyperedges internally.
-        # For some complex codes (QLDPC, high-dimensional toric), try to use 
-        # a decomposed DEM which works better with belief propagation.
+        self._decoder = None
+
+    def _make_backend(self) -> Any:
         try:
-            # Try to compile and decompose for better hyperedge handling
-            dem_to_use = self.dem
-            try:
-                # Decompose hyperedges for codes with complex error mechanisms
-                decomposed = self.dem.rounded(3)  # Round to avoid precision issues
-                dem_to_use = decomposed
-            except Exception:
-                pass  # Use original DEM if decomposition fails
-            
-            self._decoder = BeliefMatching(
-                dem_to_use,
-                max_bp_iters=self.max_bp_iters,
-                bp_method=self.bp_method,
-            )
+            return self._build_belief_matching()
         except Exception as e:
             # If BeliefMatching initialization fails, raise a clear error
             raise RuntimeError(
@@ -69,19 +63,34 @@ class BeliefMatchingDecoder(Decoder):
                 f"This code may have hyperedges or error mechanisms incompatible with BP."
             ) from e
 
-    def decode_batch(self, dets: np.ndarray) -> np.ndarray:
-        dets = np.asarray(dets, dtype=np.uint8)
-        if dets.ndim == 1:
-            dets = dets.reshape(1, -1)
+    def _build_belief_matching(self) -> Any:
+        from beliefmatching import BeliefMatching  # type: ignore
 
-        if dets.shape[1] != self.num_detectors:
-            raise ValueError(
-                f"BeliefMatchingDecoder: expected dets.shape[1]={self.num_detectors}, "
-                f"got {dets.shape[1]}"
-            )
+        # BeliefMatching accepts the DEM directly and handles hyperedges internally.
+        # For some complex codes (QLDPC, high-dimensional toric), try to use 
+        # a decomposed DEM which works better with belief propagation.
+        dem_to_use = self.dem
+        try:
+            # Decompose hyperedges for codes with complex error mechanisms
+            decomposed = self.dem.rounded(3)  # Round to avoid precision issues
+            dem_to_use = decomposed
+        except Exception:
+            pass  # Use original DEM if decomposition fails
+        
+        return BeliefMatching(
+            dem_to_use,
+            max_bp_iters=self.max_bp_iters,
+            bp_method=self.bp_method,
+        )
+
+    def decode_batch(
+        self, dets: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        dets = _prepare_dets(dets, self.num_detectors, "BeliefMatchingDecoder")
+        return self._decode_parallel(dets, out)
 
-        corrections = self._decoder.decode_batch(dets)
-        corrections = np.asarray(corrections, dtype=np.uint8)
+    def _decode_batch_impl(self, backend: Any, dets: np.ndarray) -> np.ndarray:
+        corrections = _as_uint8(backend.decode_batch(dets))
         if corrections.ndim == 1:
             corrections = corrections.reshape(-1, self.num_observables)
-        return corrections
\ No newline at end of file
+        return corrections
@@ -1,17 +1,18 @@
 # src/qectostim/decoders/bposd_decoder.py
 from __future__ import annotations
 
+import importlib.util
 from dataclasses import dataclass
 from typing import Any, Optional
 
 import numpy as np
 import stim
 
-from qectostim.decoders.base import Decoder
+from qectostim.decoders.base import Decoder, _ParallelDecodeMixin, _as_uint8, _prepare_dets
 
 
 @dataclass
-class BPOSDDecoder(Decoder):
+class BPOSDDecoder(_ParallelDecodeMixin, Decoder):
     """Belief-propagation + OSD decoder using stimbposd.
 
     Uses the stimbposd package which directly accepts Stim DetectorErrorModels.
@@ -29,6 +30,10 @@ class BPOSDDecoder(Decoder):
         Order of OSD post-processing.
     osd_method : str, default='osd_cs'
         OSD algorithm variant.
+    n_workers : int, default=1
+        Threads used by ``decode_batch``; each gets its own BPOSD instance.
+    min_parallel_shots : int, default=1024
+        Batches smaller than this are always decoded serially.
     """
 
     dem: stim.DetectorErrorModel
@@ -36,24 +41,31 @@ class BPOSDDecoder(Decoder):
     bp_method: str = "product_sum"
     osd_order: int = 60
     osd_method: str = "osd_cs"
+    n_workers: int = 1
+    min_parallel_shots: int = 1024
 
     def __post_init__(self) -> None:
-        try:
-            from stimbposd import BPOSD  # type: ignore
-        except ImportError as exc:
+        # Only check that stimbposd is installed; importing it and building
+        # the BPOSD graph wait until the first decode_batch call.
+        if importlib.util.find_spec("stimbposd") is None:
             raise ImportError(
                 "BPOSDDecoder requires the `stimbposd` package. "
                 "Install it via `pip install stimbposd`."
-            ) from exc
+            )
 
         self.num_detectors = self.dem.num_detectors
         self.num_observables = self.dem.num_observables
 
+        self._decoder = None
+
+    def _make_backend(self) -> Any:
+        from stimbposd import BPOSD  # type: ignore
+
         # Clamp osd_order to valid range [0, num_detectors - 1]
         effective_osd_order = max(0, min(self.osd_order, self.num_detectors - 1))
 
         # BPOSD accepts the DEM directly
-        self._decoder = BPOSD(
+        return BPOSD(
             self.dem,
             max_bp_iters=self.max_bp_iters,
             bp_method=self.bp_method,
@@ -61,19 +73,14 @@ class BPOSDDecoder(Decoder):
             osd_method=self.osd_method,
         )
 
-    def decode_batch(self, dets: np.ndarray) -> np.ndarray:
-        dets = np.asarray(dets, dtype=np.uint8)
-        if dets.ndim == 1:
-            dets = dets.reshape(1, -1)
-
-        if dets.shape[1] != self.num_detectors:
-            raise ValueError(
-                f"BPOSDDecoder: expected dets.shape[1]={self.num_detectors}, "
-                f"got {dets.shape[1]}"
-            )
+    def decode_batch(
+        self, dets: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        dets = _prepare_dets(dets, self.num_detectors, "BPOSDDecoder")
+        return self._decode_parallel(dets, out)
 
-        corrections = self._decoder.decode_batch(dets)
-        corrections = np.asarray(corrections, dtype=np.uint8)
+    def _decode_batch_impl(self, backend: Any, dets: np.ndarray) -> np.ndarray:
+        corrections = _as_uint8(backend.decode_batch(dets))
         if corrections.ndim == 1:
             corrections = corrections.reshape(-1, self.num_observables)
-        return corrections
\ No newline at end of file
+        return corrections
@@ -30,7 +30,7 @@ import numpy as np
 import stim
 
 from qectostim.codes.composite.concatenated import ConcatenatedCode
-from qectostim.decoders.base import Decoder
+from qectostim.decoders.base import Decoder, _prepare_dets
 
 if TYPE_CHECKING:
     pass
@@ -373,8 +373,14 @@ class ConcatenatedDecoder(Decoder):
     # Internal state (set in __post_init__)
     _block_decoders: Dict[int, Any] = field(default_factory=dict, repr=False)
     _block_outer_maps: Dict[int, Dict[int, int]] = field(default_factory=dict, repr=False)
+    _block_outer_gather: Dict[int, Tuple[np.ndarray, np.ndarray]] = field(default_factory=dict, repr=False)
+    # Structure-of-arrays view of _inner_slices, in block order (set in __post_init__)
+    _block_ids: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.intp), repr=False)
+    _block_starts: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.intp), repr=False)
+    _block_stops: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.intp), repr=False)
     _outer_decoder: Any = field(default=None, repr=False)
     _outer_parity_check: Optional[np.ndarray] = field(default=None, repr=False)
+    _outer_contrib_map: Optional[np.ndarray] = field(default=None, repr=False)
     _inner_slices: Dict[int, Tuple[int, int]] = field(default_factory=dict, repr=False)
     _outer_slices: Dict[int, Tuple[int, int]] = field(default_factory=dict, repr=False)
     _n_blocks: int = field(default=0, repr=False)
@@ -415,12 +421,26 @@ class ConcatenatedDecoder(Decoder):
             self._matching = pymatching.Matching.from_detector_error_model(self.dem)
             return
         
+        # Flatten the inner slices into parallel index arrays for the decode loop
+        block_ids = sorted(b for b in self._inner_slices if 0 <= b < self._n_blocks)
+        self._block_ids = np.array(block_ids, dtype=np.intp)
+        self._block_starts = np.array([self._inner_slices[b][0] for b in block_ids], dtype=np.intp)
+        self._block_stops = np.array([self._inner_slices[b][1] for b in block_ids], dtype=np.intp)
+        
         # Get outer detector range
         outer_start, outer_stop = self._outer_slices[0]
         self._outer_n_dets = outer_stop - outer_start
         
         # Store outer parity check matrix for syndrome mapping
         self._store_outer_parity_check()
+        if self._outer_parity_check is not None:
+            # Inner logical errors flip outer syndrome bits through H_outer.
+            # Keep the (blocks, stabs) slice that decoding multiplies by,
+            # already cropped to the outer detectors it can reach.
+            H = self._outer_parity_check
+            n_blocks = min(H.shape[1], self._n_blocks)
+            contrib_size = min(H.shape[0], self._outer_n_dets)
+            self._outer_contrib_map = np.ascontiguousarray(H[:contrib_size, :n_blocks].T)
         
         # Build per-block decoders WITH cross-correlation tracking
         self._build_block_decoders_with_correlations(pymatching, outer_start, outer_stop)
@@ -466,6 +486,7 @@ class ConcatenatedDecoder(Decoder):
         """Build per-block decoders that track correlations with outer detectors."""
         self._block_decoders = {}
         self._block_outer_maps = {}
+        self._block_outer_gather = {}
         
         for block_id, (start, stop) in self._inner_slices.items():
             # Extract DEM with outer correlations mapped to virtual observables
@@ -475,6 +496,16 @@ class ConcatenatedDecoder(Decoder):
             
             self._block_outer_maps[block_id] = outer_map
             
+            # Precompute (virtual observable, local outer detector) index pairs
+            # so decoding scatters all of a block's correlations in one step.
+            # Each outer detector gets its own virtual observable, so the
+            # local indices are unique within a block.
+            outer_dets = np.fromiter(outer_map.keys(), dtype=np.intp, count=len(outer_map))
+            virtual_obs = np.fromiter(outer_map.values(), dtype=np.intp, count=len(outer_map))
+            outer_local = outer_dets - outer_start
+            in_range = (outer_local >= 0) & (outer_local < self._outer_n_dets)
+            self._block_outer_gather[block_id] = (virtual_obs[in_range], outer_local[in_range])
+            
             if block_dem.num_errors > 0:
                 try:
                     self._block_decoders[block_id] = pymatching.Matching.from_detector_error_model(block_dem)
@@ -515,15 +546,7 @@ class ConcatenatedDecoder(Decoder):
         np.ndarray
             Shape (shots, num_observables) array of logical corrections.
         """
-        dets = np.asarray(dets, dtype=np.uint8)
-        if dets.ndim == 1:
-            dets = dets.reshape(1, -1)
-
-        if dets.shape[1] != self.num_detectors:
-            raise ValueError(
-                f"ConcatenatedDecoder: expected {self.num_detectors} detectors, "
-                f"got {dets.shape[1]}."
-            )
+        dets = _prepare_dets(dets, self.num_detectors, "ConcatenatedDecoder")
         
         # Fallback mode
         if self._use_fallback:
@@ -541,15 +564,12 @@ class ConcatenatedDecoder(Decoder):
         # outer_syndrome_contrib tracks syndrome bits flipped by inner-outer correlations
         outer_syndrome_contrib = np.zeros((n_shots, self._outer_n_dets), dtype=np.uint8)
         
-        for block_id in range(self._n_blocks):
-            if block_id not in self._inner_slices:
-                continue
-                
-            start, stop = self._inner_slices[block_id]
+        for block_id, start, stop in zip(
+            self._block_ids.tolist(), self._block_starts.tolist(), self._block_stops.tolist()
+        ):
             block_dets = dets[:, start:stop]
             
             decoder = self._block_decoders.get(block_id)
-            outer_map = self._block_outer_maps.get(block_id, {})
             
             if decoder is not None:
                 try:
@@ -564,11 +584,11 @@ class ConcatenatedDecoder(Decoder):
                     # Observables 1+ are virtual outer correlations
                     # When virtual observable i fires, it means the correlated
                     # outer detector should be flipped in the effective syndrome
-                    for outer_det_global, virtual_obs in outer_map.items():
-                        if virtual_obs < block_result.shape[1]:
-                            outer_det_local = outer_det_global - self._outer_slices[0][0]
-                            if 0 <= outer_det_local < self._outer_n_dets:
-                                outer_syndrome_contrib[:, outer_det_local] ^= block_result[:, virtual_obs]
+                    virtual_obs, outer_local = self._block_outer_gather[block_id]
+                    if virtual_obs.size and virtual_obs.max() >= block_result.shape[1]:
+                        keep = virtual_obs < block_result.shape[1]
+                        virtual_obs, outer_local = virtual_obs[keep], outer_local[keep]
+                    outer_syndrome_contrib[:, outer_local] ^= block_result[:, virtual_obs].astype(np.uint8, copy=False)
                                 
                 except Exception:
                     pass  # Block decoding failed - assume no errors
@@ -580,22 +600,21 @@ class ConcatenatedDecoder(Decoder):
         raw_outer_syndrome = dets[:, outer_start:outer_stop]
         
         # Effective syndrome = raw XOR contribution from inner-outer correlations
-        effective_outer_syndrome = (raw_outer_syndrome ^ outer_syndrome_contrib).astype(np.uint8)
+        # (the contribution buffer is fresh, so fold the raw syndrome into it)
+        effective_outer_syndrome = outer_syndrome_contrib
+        effective_outer_syndrome ^= raw_outer_syndrome
         
         # Additionally, inner logical errors act as "physical errors" on outer code
         # This flips outer syndrome according to outer parity check matrix
-        if self._outer_parity_check is not None:
-            H = self._outer_parity_check
-            n_stabs, n_qubits = H.shape
-            n_blocks = min(n_qubits, self._n_blocks)
+        if self._outer_contrib_map is not None:
+            M = self._outer_contrib_map
+            n_blocks, contrib_size = M.shape
             
             # inner_syndrome_contrib[shot, stab] = XOR over blocks of (inner_logical[block] AND H[stab, block])
-            inner_contrib = (inner_logicals[:, :n_blocks] @ H[:, :n_blocks].T) % 2
-            inner_contrib = inner_contrib.astype(np.uint8)
-            
-            # Apply to effective syndrome (size may differ from n_stabs)
-            contrib_size = min(inner_contrib.shape[1], effective_outer_syndrome.shape[1])
-            effective_outer_syndrome[:, :contrib_size] ^= inner_contrib[:, :contrib_size]
+            # uint8 products wrap mod 256, which keeps the parity bit intact
+            inner_contrib = inner_logicals[:, :n_blocks] @ M
+            inner_contrib &= 1
+            effective_outer_syndrome[:, :contrib_size] ^= inner_contrib
         
         # =================================================================
         # Step 3: Decode outer code with effective syndrome
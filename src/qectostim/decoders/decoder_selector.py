@@ -17,6 +17,36 @@ from qectostim.decoders.belief_matching import BeliefMatchingDecoder
 from qectostim.decoders.mle_decoder import MLEDecoder, HypergraphDecoder
 from qectostim.decoders.chromobius_decoder import ChromobiusDecoder
 
+# Accepted names (lower-case) for each decoder family, shared by
+# select_decoder and needs_decomposed_dem so the two cannot drift apart.
+_DEFAULT_DECODER = "pymatching"
+_MATCHING_NAMES = frozenset({"pymatching", "matching", "mwpm", "mwpm2"})
+_FUSION_BLOSSOM_NAMES = frozenset({"fb", "fusion", "fusionblossom", "fusion-blossom"})
+_UNION_FIND_NAMES = frozenset({"uf", "unionfind", "union-find"})
+_TESSERACT_NAMES = frozenset({"tesseract", "tn"})
+_BPOSD_NAMES = frozenset({"bposd", "bp-osd", "bp_osd"})
+_BELIEF_MATCHING_NAMES = frozenset({"beliefmatching", "belief-matching", "belief"})
+_MLE_NAMES = frozenset({"mle", "maximum-likelihood", "lookup"})
+_HYPERGRAPH_NAMES = frozenset({"hypergraph", "hyper"})
+_CHROMOBIUS_NAMES = frozenset({"chromobius", "chromo"})
+
+# Decoder names whose backends build a matching graph, and so need the DEM's
+# hyperedges decomposed into graphlike pieces (``decompose_errors=True``).
+# The rest consume hyperedges directly and skip the decomposition.
+DECOMPOSED_DEM_DECODERS = (
+    _MATCHING_NAMES
+    | _FUSION_BLOSSOM_NAMES
+    | _UNION_FIND_NAMES
+    | _BELIEF_MATCHING_NAMES
+    | _HYPERGRAPH_NAMES
+)
+
+
+def needs_decomposed_dem(preferred: Optional[str] = None) -> bool:
+    """Whether ``select_decoder(dem, preferred)`` expects a decomposed DEM."""
+    return (preferred or _DEFAULT_DECODER).lower() in DECOMPOSED_DEM_DECODERS
+
+
 def select_decoder(
     dem: stim.DetectorErrorModel,
     preferred: Optional[str] = None,
@@ -64,41 +94,41 @@ def select_decoder(
             tesseract_bond_dim=tesseract_det_beam,
         )
 
-    name = (preferred or "pymatching").lower()
+    name = (preferred or _DEFAULT_DECODER).lower()
 
     # MWPM family
-    if name in {"pymatching", "matching", "mwpm", "mwpm2"}:
+    if name in _MATCHING_NAMES:
         return PyMatchingDecoder(dem)
 
-    if name in {"fb", "fusion", "fusionblossom", "fusion-blossom"}:
+    if name in _FUSION_BLOSSOM_NAMES:
         return FusionBlossomDecoder(dem)
 
     # Union-Find
-    if name in {"uf", "unionfind", "union-find"}:
+    if name in _UNION_FIND_NAMES:
         return UnionFindDecoder(dem)
 
     # Tensor network (tesseract)
-    if name in {"tesseract", "tn"}:
+    if name in _TESSERACT_NAMES:
         return TesseractDecoder(dem, det_beam=tesseract_det_beam)
 
     # BP+OSD (stimbposd)
-    if name in {"bposd", "bp-osd", "bp_osd"}:
+    if name in _BPOSD_NAMES:
         return BPOSDDecoder(dem, max_bp_iters=max_bp_iters, osd_order=osd_order)
 
     # Belief-matching
-    if name in {"beliefmatching", "belief-matching", "belief"}:
+    if name in _BELIEF_MATCHING_NAMES:
         return BeliefMatchingDecoder(dem, max_bp_iters=max_bp_iters)
 
     # MLE decoder (exact, for small codes)
-    if name in {"mle", "maximum-likelihood", "lookup"}:
+    if name in _MLE_NAMES:
         return MLEDecoder(dem)
 
     # Hypergraph decoder (PyMatching + boundary L0 correction)
-    if name in {"hypergraph", "hyper"}:
+    if name in _HYPERGRAPH_NAMES:
         return HypergraphDecoder(dem)
 
     # Chromobius decoder (for hyperedge DEMs)
-    if name in {"chromobius", "chromo"}:
+    if name in _CHROMOBIUS_NAMES:
         return ChromobiusDecoder(dem)
 
     # Fallback: PyMatching.
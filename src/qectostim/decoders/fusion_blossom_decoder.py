@@ -1,13 +1,18 @@
-from qectostim.decoders.base import Decoder
+from qectostim.decoders.base import (
+    Decoder,
+    _ParallelDecodeMixin,
+    _prepare_dets,
+    _prepare_packed_dets,
+)
 import stim 
 import numpy as np
 import math
-from typing import Any, List
+from typing import Any, List, Optional, Tuple
 from dataclasses import dataclass, field
 
 
 @dataclass
-class FusionBlossomDecoder(Decoder):
+class FusionBlossomDecoder(_ParallelDecodeMixin, Decoder):
     """MWPM decoder using the fusion-blossom library on Stim DEMs.
     
     Builds a matching graph from the detector error model and uses
@@ -21,11 +26,19 @@ class FusionBlossomDecoder(Decoder):
     ----------
     dem : stim.DetectorErrorModel
         The detector error model to decode.
+    n_workers : int, default=1
+        Threads used by ``decode_batch``; each gets its own solver.
+    min_parallel_shots : int, default=512
+        Batches smaller than this are always decoded serially.
     """
     
     dem: stim.DetectorErrorModel
-    _solver: Any = field(default=None, init=False, repr=False)
+    n_workers: int = 1
+    min_parallel_shots: int = 512
+    _decoder: Any = field(default=None, init=False, repr=False)
+    _initializer: Any = field(default=None, init=False, repr=False)
     _edge_obs_masks: List[int] = field(default_factory=list, init=False, repr=False)
+    _edge_obs_bits: np.ndarray = field(default=None, init=False, repr=False)
     
     def __post_init__(self) -> None:
         try:
@@ -100,45 +113,87 @@ class FusionBlossomDecoder(Decoder):
                 weighted_edges.append((det, boundary_vertex, 2))
                 self._edge_obs_masks.append(0)
         
+        # Per-edge observable flips as rows of bits, for vectorised XOR
+        self._edge_obs_bits = np.array(
+            [[(mask >> obs) & 1 for obs in range(self.num_observables)]
+             for mask in self._edge_obs_masks],
+            dtype=np.uint8,
+        ).reshape(len(self._edge_obs_masks), self.num_observables)
+        
         # Create solver
-        initializer = fb.SolverInitializer(
+        self._initializer = fb.SolverInitializer(
             vertex_num=self.num_detectors + 1,
             weighted_edges=weighted_edges,
             virtual_vertices=[boundary_vertex],
         )
-        self._solver = fb.SolverSerial(initializer)
+        self._decoder = self._make_backend()
 
-    def decode_batch(self, dets: np.ndarray) -> np.ndarray:
-        dets = np.asarray(dets, dtype=np.uint8)
-        if dets.ndim == 1:
-            dets = dets.reshape(1, -1)
-        
-        if dets.shape[1] != self.num_detectors:
-            raise ValueError(
-                f"FusionBlossomDecoder expected input shape (shots, {self.num_detectors})."
+    def _make_backend(self) -> Any:
+        return self._fb.SolverSerial(self._initializer)
+
+    def decode_batch(
+        self, dets: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        dets = _prepare_dets(dets, self.num_detectors, "FusionBlossomDecoder")
+        return self._decode_parallel(np.packbits(dets, axis=1, bitorder="little"), out)
+
+    def decode_batch_packed(self, packed_dets: np.ndarray) -> np.ndarray:
+        """Decode bit-packed detector samples (stim's little-endian layout).
+
+        Shots are deduplicated on their packed rows and only the distinct
+        syndromes are unpacked. Predictions come back packed the same way,
+        shape (shots, ceil(num_observables / 8)).
+        """
+        packed_dets = _prepare_packed_dets(
+            packed_dets, self.num_detectors, "FusionBlossomDecoder"
+        )
+        return np.packbits(self._decode_parallel(packed_dets), axis=1, bitorder="little")
+
+    def _decode_batch_impl(self, backend: Any, packed: np.ndarray) -> np.ndarray:
+        unique_corrections, inverse = self._decode_unique(backend, packed)
+        return unique_corrections[inverse]
+
+    def _decode_into(self, backend: Any, packed: np.ndarray, dest: np.ndarray) -> None:
+        unique_corrections, inverse = self._decode_unique(backend, packed)
+        np.take(unique_corrections, inverse, axis=0, out=dest)
+
+    def _decode_unique(self, backend: Any, packed: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Corrections for each distinct packed syndrome, and each shot's row in them."""
+        # Rows arrive bit-packed (little-endian); see decode_batch
+        shots = packed.shape[0]
+        if shots == 0 or self.num_detectors == 0:
+            return (
+                np.zeros((1, self.num_observables), dtype=np.uint8),
+                np.zeros(shots, dtype=np.intp),
             )
         
-        shots = dets.shape[0]
-        corrections = np.zeros((shots, self.num_observables), dtype=np.uint8)
+        # fusion-blossom solves one syndrome per call, so solve each distinct
+        # syndrome once; at low error rates most shots repeat (or are empty)
+        packed = np.ascontiguousarray(packed)
+        keys = packed.view(np.dtype((np.void, packed.shape[1]))).ravel()
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        dets = np.unpackbits(
+            packed[first], axis=1, count=self.num_detectors, bitorder="little"
+        )
         
-        for i in range(shots):
+        edge_obs_bits = self._edge_obs_bits
+        n_edges = edge_obs_bits.shape[0]
+        unique_corrections = np.zeros((first.size, self.num_observables), dtype=np.uint8)
+        for u in range(first.size):
             # Get triggered detector indices
-            triggered = [j for j in range(self.num_detectors) if dets[i, j]]
+            triggered = np.flatnonzero(dets[u]).tolist()
+            if not triggered:
+                continue
             
-            self._solver.clear()
+            backend.clear()
             syndrome = self._fb.SyndromePattern(triggered)
-            self._solver.solve(syndrome)
-            
-            # Get matched edges and compute observable flips
-            subgraph = self._solver.subgraph()
-            obs_flip = 0
-            for edge_idx in subgraph:
-                if edge_idx < len(self._edge_obs_masks):
-                    obs_flip ^= self._edge_obs_masks[edge_idx]
+            backend.solve(syndrome)
             
-            # Convert to array
-            for obs_idx in range(self.num_observables):
-                if obs_flip & (1 << obs_idx):
-                    corrections[i, obs_idx] = 1
+            # XOR the observable flips of the matched edges straight into the
+            # row; virtual-boundary edges (index >= n_edges) carry no flips
+            matched = np.asarray(backend.subgraph(), dtype=np.intp)
+            np.bitwise_xor.reduce(
+                edge_obs_bits[matched[matched < n_edges]], axis=0, out=unique_corrections[u]
+            )
         
-        return corrections
\ No newline at end of file
+        return unique_corrections, inverse.reshape(-1)
@@ -35,4 +35,19 @@ class PyMatchingDecoder(Decoder):
         if out.ndim == 1:
             out = out.reshape(-1, self._num_observables)
 
-        return out
\ No newline at end of file
+        return out
+
+    def decode_batch_packed(self, packed_dets: np.ndarray) -> np.ndarray:
+        """Decode bit-packed detector samples without unpacking them.
+
+        ``packed_dets`` has shape (shots, ceil(num_detectors / 8)) in stim's
+        little-endian layout (``sample(..., bit_packed=True)``). Predictions
+        come back packed the same way, shape (shots, ceil(num_observables / 8));
+        bits past ``num_observables`` in the last byte are padding.
+        """
+        packed_dets = np.asarray(packed_dets, dtype=np.uint8)
+        if packed_dets.ndim == 1:
+            packed_dets = packed_dets.reshape(1, -1)
+        return self._matching.decode_batch(
+            packed_dets, bit_packed_shots=True, bit_packed_predictions=True
+        )
\ No newline at end of file
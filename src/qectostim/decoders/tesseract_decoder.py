@@ -1,17 +1,24 @@
 # src/qectostim/decoders/tesseract_decoder.py
 from __future__ import annotations
 
+import importlib.util
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Optional
 
 import numpy as np
 import stim
 
-from qectostim.decoders.base import Decoder
+from qectostim.decoders.base import (
+    Decoder,
+    _ParallelDecodeMixin,
+    _decode_packed_chunks,
+    _prepare_dets,
+    _prepare_packed_dets,
+)
 
 
 @dataclass
-class TesseractDecoder(Decoder):
+class TesseractDecoder(_ParallelDecodeMixin, Decoder):
     """Wrapper for the tesseract tensor-network decoder on Stim DEMs.
 
     Uses the tesseract_decoder package which provides efficient tensor-network
@@ -25,48 +32,65 @@ class TesseractDecoder(Decoder):
         Beam search width for detector ordering.
     merge_errors : bool, default=True
         Whether to merge similar error mechanisms.
+    n_workers : int, default=1
+        Threads used by ``decode_batch``; each gets its own compiled decoder.
+    min_parallel_shots : int, default=512
+        Batches smaller than this are always decoded serially.
     """
 
     dem: stim.DetectorErrorModel
     det_beam: int = 5
     merge_errors: bool = True
+    n_workers: int = 1
+    min_parallel_shots: int = 512
 
     def __post_init__(self) -> None:
-        try:
-            import tesseract_decoder as tdec  # type: ignore
-        except ImportError as exc:
+        if importlib.util.find_spec("tesseract_decoder") is None:
             raise ImportError(
                 "TesseractDecoder requires the `tesseract-decoder` package. "
                 "Install it via `pip install tesseract-decoder`."
-            ) from exc
+            )
 
         self.num_detectors = self.dem.num_detectors
         self.num_observables = self.dem.num_observables
 
+        self._decoder = self._make_backend()
+
+    def _make_backend(self) -> Any:
+        import tesseract_decoder as tdec  # type: ignore
+
         # Build decoder via TesseractConfig
         config = tdec.tesseract.TesseractConfig()
         config.det_beam = self.det_beam
         config.merge_errors = 1 if self.merge_errors else 0
         
-        self._decoder = config.compile_decoder_for_dem(self.dem)
+        return config.compile_decoder_for_dem(self.dem)
 
-    def decode_batch(self, dets: np.ndarray) -> np.ndarray:
-        dets = np.asarray(dets, dtype=np.uint8)
-        if dets.ndim == 1:
-            dets = dets.reshape(1, -1)
+    def decode_batch(
+        self, dets: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        dets = _prepare_dets(dets, self.num_detectors, "TesseractDecoder")
+        return self._decode_parallel(dets, out)
 
-        if dets.shape[1] != self.num_detectors:
-            raise ValueError(
-                f"TesseractDecoder: expected dets.shape[1]={self.num_detectors}, "
-                f"got {dets.shape[1]}"
-            )
+    def decode_batch_packed(self, packed_dets: np.ndarray) -> np.ndarray:
+        """Decode bit-packed detector samples (stim's little-endian layout).
 
-        shots = dets.shape[0]
-        corrections = np.zeros((shots, self.num_observables), dtype=np.uint8)
-        
-        for i in range(shots):
+        Shots are unpacked a chunk at a time; predictions come back packed,
+        shape (shots, ceil(num_observables / 8)).
+        """
+        packed_dets = _prepare_packed_dets(packed_dets, self.num_detectors, "TesseractDecoder")
+        return _decode_packed_chunks(
+            self._decode_parallel, packed_dets, self.num_detectors, self.num_observables
+        )
+
+    def _decode_batch_impl(self, backend: Any, dets: np.ndarray) -> np.ndarray:
+        corrections = np.zeros((dets.shape[0], self.num_observables), dtype=np.uint8)
+        self._decode_into(backend, dets, corrections)
+        return corrections
+
+    def _decode_into(self, backend: Any, dets: np.ndarray, dest: np.ndarray) -> None:
+        # Convert the whole chunk once rather than per shot
+        dets_bool = dets.astype(bool)
+        for i in range(dets.shape[0]):
             # decode returns a list of bools for each observable
-            corr = self._decoder.decode(dets[i].astype(bool))
-            corrections[i, :] = np.asarray(corr, dtype=np.uint8)
-            
-        return corrections
\ No newline at end of file
+            dest[i, :] = backend.decode(dets_bool[i])
@@ -22,7 +22,7 @@ import warnings
 import numpy as np
 import stim
 
-from qectostim.decoders.base import Decoder
+from qectostim.decoders.base import Decoder, _decode_packed_chunks, _prepare_packed_dets
 
 
 UFBackend = Callable[[np.ndarray], np.ndarray]
@@ -105,7 +105,14 @@ class UnionFindDecoder(Decoder):
         """True if using PyMatching fallback instead of true Union-Find."""
         return self._is_fallback
 
-    def decode_batch(self, dets: np.ndarray) -> np.ndarray:
+    def decode_batch(
+        self, dets: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Decode a batch of detector samples.
+
+        An ``out`` buffer of shape (shots, num_observables), uint8, receives
+        the predictions directly so sampling loops can reuse one array.
+        """
         if self.backend_decode is None:
             raise RuntimeError("UnionFindDecoder has no backend_decode set.")
 
@@ -119,8 +126,30 @@ class UnionFindDecoder(Decoder):
                 f"got {dets.shape[1]}"
             )
 
+        if out is not None:
+            expected = (dets.shape[0], self.num_observables)
+            if out.shape != expected or out.dtype != np.uint8:
+                raise ValueError(
+                    f"UnionFindDecoder: out must be a uint8 array of shape "
+                    f"{expected}, got {out.dtype} {out.shape}"
+                )
+
         corrections = self.backend_decode(dets)
         corrections = np.asarray(corrections, dtype=np.uint8)
         if corrections.ndim == 1:
             corrections = corrections.reshape(-1, self.num_observables)
-        return corrections
\ No newline at end of file
+        if out is None:
+            return corrections
+        np.copyto(out, corrections)
+        return out
+
+    def decode_batch_packed(self, packed_dets: np.ndarray) -> np.ndarray:
+        """Decode bit-packed detector samples (stim's little-endian layout).
+
+        Shots are unpacked a chunk at a time for the backend; predictions
+        come back packed, shape (shots, ceil(num_observables / 8)).
+        """
+        packed_dets = _prepare_packed_dets(packed_dets, self.num_detectors, "UnionFindDecoder")
+        return _decode_packed_chunks(
+            self.decode_batch, packed_dets, self.num_detectors, self.num_observables
+        )
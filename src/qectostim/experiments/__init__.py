@@ -13,7 +13,7 @@ Class Hierarchy:
     LogicalGateExperiment - Automatic gadget routing for logical gates
 """
 
-from .experiment import Experiment
+from .experiment import Experiment, clear_decoder_cache
 from .memory import (
     MemoryExperiment,
     StabilizerMemoryExperiment,
@@ -44,6 +44,7 @@ from .stabilizer_rounds import (
 __all__ = [
     # Base
     "Experiment",
+    "clear_decoder_cache",
     # Memory experiments
     "MemoryExperiment",
     "StabilizerMemoryExperiment",
@@ -10,16 +10,13 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional, Tuple
 
-import numpy as np
 import stim
 
 from qectostim.experiments.memory import (
     CSSMemoryExperiment,
-    get_logical_ops,
-    ops_valid,
-    ops_len,
-    pauli_at,
     apply_stabilizer_cnots_with_ticks,
+    check_supports,
+    logical_op_support,
 )
 
 
@@ -223,16 +220,14 @@ class ConcatenatedMemoryExperiment(CSSMemoryExperiment):
         for r in range(self.rounds):
             # Apply H to X ancillas at start of round
             if n_x:
-                for a in anc_x:
-                    c.append("H", [a])
+                c.append("H", anc_x)
             
             # Apply stabilizer CNOTs
             if n_x:
                 apply_stabilizer_cnots_with_ticks(
                     c, hx, list(range(n)), anc_x, is_x_type=True
                 )
-                for a in anc_x:
-                    c.append("H", [a])
+                c.append("H", anc_x)
             
             c.append("TICK")
             
@@ -287,6 +282,10 @@ class ConcatenatedMemoryExperiment(CSSMemoryExperiment):
         # Now emit all detectors in block-grouped order. This ensures detector
         # indices are contiguous per block, enabling simple slicing in decoder.
         
+        # Data support of every check, read once for the space-like detectors
+        x_supports = check_supports(code, hx) if basis == "X" else []
+        z_supports = check_supports(code, hz) if basis == "Z" else []
+        
         def add_detector_at_end(rec_indices: list[int], coord: tuple = (0.0, 0.0, 0.0)) -> None:
             """Emit a DETECTOR with rec lookbacks from current m_index."""
             if not rec_indices:
@@ -331,9 +330,7 @@ class ConcatenatedMemoryExperiment(CSSMemoryExperiment):
                 # Z space-like detectors
                 for local_idx in range(self._n_inner_z):
                     global_idx = block_id * self._n_inner_z + local_idx
-                    row = hz[global_idx]
-                    
-                    data_idxs = [data_meas[q] for q in np.where(row == 1)[0] if q in data_meas]
+                    data_idxs = [data_meas[q] for q in z_supports[global_idx] if q in data_meas]
                     recs = list(data_idxs)
                     
                     if inner_z_meas[block_id][local_idx]:
@@ -346,9 +343,7 @@ class ConcatenatedMemoryExperiment(CSSMemoryExperiment):
                 # X space-like detectors
                 for local_idx in range(self._n_inner_x):
                     global_idx = block_id * self._n_inner_x + local_idx
-                    row = hx[global_idx]
-                    
-                    data_idxs = [data_meas[q] for q in np.where(row == 1)[0] if q in data_meas]
+                    data_idxs = [data_meas[q] for q in x_supports[global_idx] if q in data_meas]
                     recs = list(data_idxs)
                     
                     if inner_x_meas[block_id][local_idx]:
@@ -388,9 +383,7 @@ class ConcatenatedMemoryExperiment(CSSMemoryExperiment):
                 # Outer Z space-like
                 for local_idx in range(self._n_outer_z):
                     global_idx = self._n_outer * self._n_inner_z + local_idx
-                    row = hz[global_idx]
-                    
-                    data_idxs = [data_meas[q] for q in np.where(row == 1)[0] if q in data_meas]
+                    data_idxs = [data_meas[q] for q in z_supports[global_idx] if q in data_meas]
                     recs = list(data_idxs)
                     
                     if outer_z_meas[local_idx]:
@@ -403,9 +396,7 @@ class ConcatenatedMemoryExperiment(CSSMemoryExperiment):
                 # Outer X space-like
                 for local_idx in range(self._n_outer_x):
                     global_idx = self._n_outer * self._n_inner_x + local_idx
-                    row = hx[global_idx]
-                    
-                    data_idxs = [data_meas[q] for q in np.where(row == 1)[0] if q in data_meas]
+                    data_idxs = [data_meas[q] for q in x_supports[global_idx] if q in data_meas]
                     recs = list(data_idxs)
                     
                     if outer_x_meas[local_idx]:
@@ -415,16 +406,9 @@ class ConcatenatedMemoryExperiment(CSSMemoryExperiment):
                         add_detector_at_end(recs, (float(self._n_outer), float(local_idx), float(self.rounds)))
         
         # Logical observable
-        z_ops = get_logical_ops(code, 'z')
-        x_ops = get_logical_ops(code, 'x')
         logical_support: list[int] = []
-        
-        if basis == "Z" and ops_valid(z_ops) and self.logical_qubit < ops_len(z_ops):
-            L = z_ops[self.logical_qubit]
-            logical_support = [q for q in range(n) if pauli_at(L, q) in ("Z", "Y")]
-        elif basis == "X" and ops_valid(x_ops) and self.logical_qubit < ops_len(x_ops):
-            L = x_ops[self.logical_qubit]
-            logical_support = [q for q in range(n) if pauli_at(L, q) in ("X", "Y")]
+        if basis in ("Z", "X"):
+            logical_support = logical_op_support(code, basis, self.logical_qubit, n)
         
         if not logical_support:
             logical_support = data_qubits
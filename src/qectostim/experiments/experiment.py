@@ -3,20 +3,65 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 import abc
+import functools
+import threading
 import numpy as np
 import stim
 import stim
 
 from qectostim.codes.abstract_code import Code
-from qectostim.decoders.decoder_selector import select_decoder
+from qectostim.decoders.base import Decoder
+from qectostim.decoders.decoder_selector import needs_decomposed_dem, select_decoder
 from qectostim.noise.models import NoiseModel
 import numpy as np
 import stim
 
 from qectostim.codes.abstract_css import CSSCode
 
+@functools.lru_cache(maxsize=32)
+def _cached_decoder(dem_text: str, preferred: Optional[str]) -> Tuple[Decoder, threading.Lock]:
+    """Decoder for the DEM with text ``dem_text``, built once per (DEM, name).
+
+    Sweeps that rebuild the same circuit hand over an identical DEM every
+    call; keying on its text reuses the already-built matching graph or
+    solver instead of constructing it again. Decoders keep mutable state
+    (worker backends, solvers), so the shared instance comes with a lock
+    that callers hold while decoding.
+    """
+    decoder = select_decoder(stim.DetectorErrorModel(dem_text), preferred=preferred)
+    return decoder, threading.Lock()
+
+
+def clear_decoder_cache() -> None:
+    """Drop the decoders memoized by ``run_decode`` for every experiment."""
+    _cached_decoder.cache_clear()
+
+
+def _logical_error_rate(logical_errors: np.ndarray) -> float:
+    """Fraction of shots (rows) with a logical error on any observable."""
+    logical_errors = np.asarray(logical_errors)
+    shots = logical_errors.shape[0]
+    if shots == 0:
+        return float("nan")
+    if logical_errors.ndim > 1:
+        logical_errors = np.any(logical_errors, axis=1)
+    return np.count_nonzero(logical_errors) / shots
+
+
+def _packed_logical_errors(sampler: Any, decoder: Any, shots: int) -> np.ndarray:
+    """Sample a compiled DEM sampler bit-packed; return per-shot errors on observable 0.
+
+    Detector and observable samples stay packed (little-endian, as both stim
+    and PyMatching lay them out) from sampler to decoder; only bit 0 of the
+    first byte, observable L0, is compared.
+    """
+    det_packed, obs_packed, _ = sampler.sample(shots=shots, bit_packed=True)
+    pred_packed = decoder.decode_batch_packed(det_packed)
+    return (obs_packed[:, 0] ^ pred_packed[:, 0]) & 1
+
+
 class Experiment(ABC):
     def __init__(
         self,
@@ -28,7 +73,43 @@ class Experiment(ABC):
         self.noise_model = noise_model
         self.metadata = metadata or {}
 
+    def clear_cache(self) -> None:
+        """Release this experiment's cached samplers and DEM.
 
+        Decoders are memoized per DEM across experiments; use
+        :func:`clear_decoder_cache` to release those.
+        """
+        self._sampler_cache = None
+        self._dem_cache = None
+        self._dem_sampler_cache = None
+
+    def _circuit_sampler(self, circuit: stim.Circuit) -> Any:
+        """Compiled measurement sampler for ``circuit``, reused while it is unchanged."""
+        key = str(circuit)
+        cache = getattr(self, "_sampler_cache", None)
+        if cache is None or cache[0] != key:
+            cache = (key, circuit.compile_sampler())
+            self._sampler_cache = cache
+        return cache[1]
+
+    def _circuit_dem(
+        self, circuit: stim.Circuit, decompose_errors: bool = True
+    ) -> stim.DetectorErrorModel:
+        """DEM of ``circuit``, reused while the circuit and decomposition are unchanged."""
+        key = (str(circuit), decompose_errors)
+        cache = getattr(self, "_dem_cache", None)
+        if cache is None or cache[0] != key:
+            cache = (key, circuit.detector_error_model(decompose_errors=decompose_errors))
+            self._dem_cache = cache
+        return cache[1]
+
+    def _dem_sampler(self, dem: stim.DetectorErrorModel) -> Any:
+        """Compiled sampler for ``dem``, reused while the cached DEM is unchanged."""
+        cache = getattr(self, "_dem_sampler_cache", None)
+        if cache is None or cache[0] is not dem:
+            cache = (dem, dem.compile_sampler())
+            self._dem_sampler_cache = cache
+        return cache[1]
 
     @abc.abstractmethod
     def to_stim(self) -> stim.Circuit:
@@ -80,11 +161,11 @@ class Experiment(ABC):
             return {
                 "shots": shots,
                 "logical_errors": logical_errors,
-                "logical_error_rate": float(logical_errors.mean()),
+                "logical_error_rate": _logical_error_rate(logical_errors),
             }
 
         # 4) Sample the full measurement record.
-        sampler = circuit.compile_sampler()
+        sampler = self._circuit_sampler(circuit)
         meas = sampler.sample(shots)  # shape: (shots, num_measurements)
         num_meas = meas.shape[1]
 
@@ -102,7 +183,7 @@ class Experiment(ABC):
             return {
                 "shots": shots,
                 "logical_errors": logical_errors,
-                "logical_error_rate": float(logical_errors.mean()),
+                "logical_error_rate": _logical_error_rate(logical_errors),
             }
 
         # 6) Compute logical observable as XOR (parity) of selected measurement bits.
@@ -114,7 +195,7 @@ class Experiment(ABC):
         return {
             "shots": shots,
             "logical_errors": logical_errors,
-            "logical_error_rate": float(logical_errors.mean()),
+            "logical_error_rate": _logical_error_rate(logical_errors),
         }
 
     def _get_code_distance(self) -> int:
@@ -185,7 +266,7 @@ class Experiment(ABC):
         print("[run_decode/detection] circuit length =", len(circuit))
 
         # 2) Sample from circuit directly
-        sampler = circuit.compile_sampler()
+        sampler = self._circuit_sampler(circuit)
         samples = sampler.sample(shots=shots)
 
         # 3) Parse samples: handle both tuple and array formats
@@ -216,10 +297,10 @@ class Experiment(ABC):
         
         # Undetected errors: logical error occurred but syndrome was zero
         undetected = (logical_errors == 1) & (syndrome_nonzero == 0)
-        undetected_count = np.sum(undetected)
+        undetected_count = np.count_nonzero(undetected)
         
         # Total logical errors
-        logical_error_count = np.sum(logical_errors)
+        logical_error_count = np.count_nonzero(logical_errors)
         
         # Detection efficiency: of errors that occurred, how many were detected?
         if logical_error_count > 0:
@@ -228,7 +309,7 @@ class Experiment(ABC):
             detection_efficiency = 1.0  # No errors to detect
         
         print("[run_decode/detection] logical_error_count =", int(logical_error_count))
-        print("[run_decode/detection] syndrome_nonzero_count =", int(np.sum(syndrome_nonzero)))
+        print("[run_decode/detection] syndrome_nonzero_count =", int(np.count_nonzero(syndrome_nonzero)))
         print("[run_decode/detection] undetected_errors =", int(undetected_count))
         print("[run_decode/detection] detection_efficiency =", float(detection_efficiency))
         print("[run_decode/detection] logical_error_rate =", float(logical_error_count / shots))
@@ -237,7 +318,7 @@ class Experiment(ABC):
             'shots': shots,
             'logical_errors': logical_errors,
             'logical_error_rate': float(logical_error_count / shots),
-            'syndrome_nonzero': int(np.sum(syndrome_nonzero)),
+            'syndrome_nonzero': int(np.count_nonzero(syndrome_nonzero)),
             'undetected_errors': int(undetected_count),
             'non_detection_rate': float(undetected_count / shots),
             'detection_efficiency': float(detection_efficiency),
@@ -276,8 +357,9 @@ class Experiment(ABC):
             circuit = base_circuit
         print("[run_decode/correction] noisy circuit   =", len(circuit), "instructions")
 
-        # 3) Build DetectorErrorModel from noisy circuit.
-        dem = circuit.detector_error_model(decompose_errors=True)
+        # 3) Build DetectorErrorModel from noisy circuit; hyperedges are only
+        #    decomposed for the matching-family decoders that need it.
+        dem = self._circuit_dem(circuit, needs_decomposed_dem(decoder_name))
         print("[run_decode/correction] DEM: detectors   =", dem.num_detectors)
         print("[run_decode/correction] DEM: errors      =", dem.num_errors)
         print("[run_decode/correction] DEM: observables =", dem.num_observables)
@@ -288,16 +370,28 @@ class Experiment(ABC):
             return {
                 "shots": shots,
                 "logical_errors": logical_errors,
-                "logical_error_rate": float(logical_errors.mean()),
+                "logical_error_rate": _logical_error_rate(logical_errors),
             }
 
         # 4) Build decoder from DEM.
-        decoder = select_decoder(dem, preferred=decoder_name)
+        decoder, decoder_lock = _cached_decoder(str(dem), decoder_name)
         print("[run_decode/correction] decoder type    =", type(decoder))
 
+        # Decoders with a bit-packed entry point never see unpacked samples.
+        if hasattr(decoder, "decode_batch_packed"):
+            print("[run_decode/correction] sampling DEM directly (bit-packed)...")
+            with decoder_lock:
+                logical_errors = _packed_logical_errors(self._dem_sampler(dem), decoder, shots)
+            print("[run_decode/correction] logical_error_rate =", _logical_error_rate(logical_errors))
+            return {
+                "shots": shots,
+                "logical_errors": logical_errors,
+                "logical_error_rate": _logical_error_rate(logical_errors),
+            }
+
         # 5) Sample from the DEM directly.
         print("[run_decode/correction] sampling DEM directly...")
-        sampler = dem.compile_sampler()
+        sampler = self._dem_sampler(dem)
         raw = sampler.sample(shots=shots)
         print("[run_decode/correction] type(raw)       =", type(raw))
 
@@ -340,7 +434,8 @@ class Experiment(ABC):
 
         # 6) Decode detector outcomes -> predicted logical flips.
         print("[run_decode/correction] decoding detector samples...")
-        corrections = decoder.decode_batch(det_samples)
+        with decoder_lock:
+            corrections = decoder.decode_batch(det_samples)
         corrections = np.asarray(corrections, dtype=np.uint8)
         print("[run_decode/correction] corrections.shape =", corrections.shape)
 
@@ -358,12 +453,12 @@ class Experiment(ABC):
 
         logical_errors = (pred_log ^ true_log).astype(np.uint8)
 
-        print("[run_decode/correction] logical_error_rate =", float(logical_errors.mean()))
+        print("[run_decode/correction] logical_error_rate =", _logical_error_rate(logical_errors))
 
         return {
             "shots": shots,
             "logical_errors": logical_errors,
-            "logical_error_rate": float(logical_errors.mean()),
+            "logical_error_rate": _logical_error_rate(logical_errors),
         }
     
 
@@ -396,8 +491,11 @@ class Experiment(ABC):
 
         print("[run_decode] noisy circuit   =", len(circuit), "instructions")
 
-        # 3) Build DetectorErrorModel from noisy circuit.
-        dem = circuit.detector_error_model(decompose_errors=True)
+        # 3) Build DetectorErrorModel from noisy circuit; hyperedges are only
+        #    decomposed for the matching-family decoders that need it.
+        dem = circuit.detector_error_model(
+            decompose_errors=needs_decomposed_dem(decoder_name)
+        )
         print("[run_decode] DEM: detectors   =", dem.num_detectors)
         print("[run_decode] DEM: errors      =", dem.num_errors)
         print("[run_decode] DEM: observables =", dem.num_observables)
@@ -409,13 +507,25 @@ class Experiment(ABC):
             return {
                 "shots": shots,
                 "logical_errors": logical_errors,
-                "logical_error_rate": float(logical_errors.mean()),
+                "logical_error_rate": _logical_error_rate(logical_errors),
             }
 
         # 4) Build decoder from DEM.
-        decoder = select_decoder(dem, preferred=decoder_name)
+        decoder, decoder_lock = _cached_decoder(str(dem), decoder_name)
         print("[run_decode] decoder type    =", type(decoder))
 
+        # Decoders with a bit-packed entry point never see unpacked samples.
+        if hasattr(decoder, "decode_batch_packed"):
+            print("[run_decode] sampling DEM directly (bit-packed)...")
+            with decoder_lock:
+                logical_errors = _packed_logical_errors(dem.compile_sampler(), decoder, shots)
+            print("[run_decode] logical_error_rate =", _logical_error_rate(logical_errors))
+            return {
+                "shots": shots,
+                "logical_errors": logical_errors,
+                "logical_error_rate": _logical_error_rate(logical_errors),
+            }
+
         # 5) Sample from the DEM directly.
         #
         # For stim 1.15.0 + polyfill, dem.compile_sampler().sample(shots)
@@ -474,7 +584,8 @@ class Experiment(ABC):
         # 6) Decode detector outcomes -> predicted logical flips.
         #    PyMatchingDecoder exposes decode_batch(det_samples) -> (shots, num_observables)
         print("[run_decode] decoding detector samples...")
-        corrections = decoder.decode_batch(det_samples)
+        with decoder_lock:
+            corrections = decoder.decode_batch(det_samples)
         corrections = np.asarray(corrections, dtype=np.uint8)
         print("[run_decode] corrections.shape =", corrections.shape)
         print("[run_decode] first 5 corrections rows:\n", corrections[:5])
@@ -503,10 +614,10 @@ class Experiment(ABC):
         print("[run_decode] first 20 true_log:      ", true_log[:20])
         print("[run_decode] first 20 pred_log:      ", pred_log[:20])
         print("[run_decode] first 20 logical_errors:", logical_errors[:20])
-        print("[run_decode] logical_error_rate =", float(logical_errors.mean()))
+        print("[run_decode] logical_error_rate =", _logical_error_rate(logical_errors))
 
         return {
             "shots": shots,
             "logical_errors": logical_errors,
-            "logical_error_rate": float(logical_errors.mean()),
+            "logical_error_rate": _logical_error_rate(logical_errors),
         }
\ No newline at end of file
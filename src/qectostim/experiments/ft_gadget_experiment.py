@@ -822,8 +822,10 @@ class FaultTolerantGadgetExperiment(Experiment):
         # Decode
         predictions = decoder.decode_batch(detector_shots)
         
-        # Count errors
-        num_errors = int(np.sum(predictions != observable_shots))
+        # Count shots where any observable was mispredicted
+        predictions = np.asarray(predictions).reshape(observable_shots.shape)
+        shot_failed = np.any(predictions != observable_shots, axis=1)
+        num_errors = int(np.count_nonzero(shot_failed))
         logical_error_rate = num_errors / num_shots
         
         # Get gadget metadata if available
@@ -917,7 +919,7 @@ class FaultTolerantGadgetExperiment(Experiment):
             observable_shots = samples[:, num_detectors:num_detectors + num_observables]
             
             # Detector check: any non-zero detector indicates a problem
-            total_detector_flips = np.sum(detector_shots)
+            total_detector_flips = np.count_nonzero(detector_shots)
             if total_detector_flips > 0:
                 flip_rate = total_detector_flips / (num_shots * num_detectors)
                 return False, 1.0, f"Detectors firing with no noise (flip_rate={flip_rate:.4f})"
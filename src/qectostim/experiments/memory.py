@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import abc
+import weakref
+from collections.abc import Mapping, Sequence
 from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
@@ -8,6 +10,7 @@ import stim
 
 from qectostim.codes.abstract_code import Code, StabilizerCode, PauliString
 from qectostim.codes.abstract_css import CSSCode
+from qectostim.codes.utils import binary_csr, pauli_strings_to_matrix
 from qectostim.experiments.experiment import Experiment
 from qectostim.experiments.stabilizer_rounds import (
     DetectorContext,
@@ -16,12 +19,36 @@ from qectostim.experiments.stabilizer_rounds import (
     ColorCodeStabilizerRoundBuilder,
     GeneralStabilizerRoundBuilder,
     StabilizerBasis,
+    append_detectors,
+    append_gate,
+    append_observable,
+    append_qubit_coords,
     get_logical_support,
 )
 from qectostim.noise.models import NoiseModel
 from qectostim.utils.scheduling_core import graph_coloring_cnots
 
 
+# Ideal memory circuits already built for a code, keyed by the experiment
+# settings that shape them, so a sweep that re-creates experiments on the
+# same code reuses the circuit. Codes can still be edited after construction
+# (metadata in particular), so each entry also stores a fingerprint of the
+# code contents the builders read and is rebuilt when that changes.
+_MEMORY_CIRCUITS: "weakref.WeakKeyDictionary[Code, Dict[tuple, Tuple[tuple, stim.Circuit]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+def _freeze(value: Any) -> Any:
+    """Comparable snapshot of code data: arrays as bytes, containers as tuples."""
+    if isinstance(value, np.ndarray):
+        return (value.shape, value.dtype.str, value.tobytes())
+    if isinstance(value, Mapping):
+        return tuple((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, Sequence) and not isinstance(value, (str, bytes)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
 # ============================================================================
 # Helper Functions (shared across experiment classes)
 # ============================================================================
@@ -61,6 +88,48 @@ def pauli_at(pauli_obj, q: int) -> str:
     return 'I'
 
 
+def logical_op_support(code, basis: str, logical_qubit: int, n: int) -> List[int]:
+    """Qubits in [0, n) where logical ``basis`` operator ``logical_qubit`` acts as basis or Y.
+
+    Full-length string operators of a CSS code are read from the code's
+    cached (k, n) support matrix; other strings are compared as a byte
+    array rather than character by character.
+    """
+    pauli_type = basis.upper()
+    ops = get_logical_ops(code, pauli_type.lower())
+    if not (ops_valid(ops) and logical_qubit < ops_len(ops)):
+        return []
+    L = ops[logical_qubit]
+    if (
+        isinstance(L, str)
+        and n == len(L) == getattr(code, "n", None)
+        and ops is getattr(code, f"_logical_{pauli_type.lower()}", None)
+        and hasattr(code, "_logical_matrix")
+    ):
+        return np.flatnonzero(code._logical_matrix(pauli_type)[logical_qubit]).tolist()
+    if isinstance(L, str):
+        return np.flatnonzero(pauli_strings_to_matrix([L], n, pauli_type)[0]).tolist()
+    return [q for q in range(n) if pauli_at(L, q) in (pauli_type, "Y")]
+
+
+def check_csr(code, matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """CSR ``(indptr, indices)`` of a binary check matrix.
+
+    When ``matrix`` is the code's own ``hx``/``hz`` the arrays come from the
+    code's cached CSR form; any other matrix is compressed on the spot.
+    """
+    for attr in ("_hx", "_hz"):
+        if getattr(code, attr, None) is matrix and hasattr(code, "_check_csr"):
+            return code._check_csr(attr)
+    return binary_csr(matrix)
+
+
+def check_supports(code, matrix: np.ndarray) -> List[List[int]]:
+    """Nonzero columns of each row of ``matrix``, as lists of ints."""
+    indptr, indices = check_csr(code, matrix)
+    return [part.tolist() for part in np.split(indices, indptr[1:-1])]
+
+
 def apply_general_stabilizer_gates_with_ticks(
     circuit: stim.Circuit,
     stab_matrix: np.ndarray,
@@ -150,8 +219,7 @@ def apply_general_stabilizer_gates_with_ticks(
             circuit.append("H", y_data)
         
         # Apply all CNOTs
-        for dq, anc in layer_cnots:
-            circuit.append("CX", [dq, anc])
+        circuit.append("CX", [q for pair in layer_cnots for q in pair])
         
         # Post-rotation for X components: H
         if x_ops:
@@ -193,42 +261,62 @@ def apply_stabilizer_cnots_with_ticks(
     is_x_type : bool
         True for X-type stabilizers (H applied before/after), False for Z-type.
     """
+    emit_cnot_layers(
+        circuit, stabilizer_cnot_layers(parity_check, data_qubits, ancilla_qubits, is_x_type)
+    )
+
+
+def stabilizer_cnot_layers(
+    parity_check: np.ndarray,
+    data_qubits: List[int],
+    ancilla_qubits: List[int],
+    is_x_type: bool = False,
+) -> List[List[int]]:
+    """
+    Flat CX targets for each graph-coloured layer of a CSS check matrix.
+    
+    The layers depend only on the check matrix and qubit labels, so callers
+    emitting several rounds can compute them once and pass the result to
+    :func:`emit_cnot_layers` every round. Arguments are as for
+    :func:`apply_stabilizer_cnots_with_ticks`.
+    """
     if parity_check is None or parity_check.size == 0:
-        return
+        return []
     
-    n_stabs = parity_check.shape[0]
     n = len(data_qubits)
     
-    # Collect all CNOT pairs
-    cnot_pairs: List[Tuple[int, int]] = []
-    
-    for s_idx in range(min(n_stabs, len(ancilla_qubits))):
-        anc = ancilla_qubits[s_idx]
-        row = parity_check[s_idx]
-        
-        for q in range(min(n, len(row))):
-            if row[q]:
-                dq = data_qubits[q]
-                if is_x_type:
-                    # X-type: CNOT from data to ancilla
-                    cnot_pairs.append((dq, anc))
-                else:
-                    # Z-type: CNOT from ancilla to data
-                    cnot_pairs.append((anc, dq))
+    # Collect all CNOT pairs, scanning the check matrix in one pass
+    rows, cols = np.nonzero(parity_check[:len(ancilla_qubits), :n])
+    if is_x_type:
+        # X-type: CNOT from data to ancilla
+        cnot_pairs: List[Tuple[int, int]] = [
+            (data_qubits[q], ancilla_qubits[s_idx])
+            for s_idx, q in zip(rows.tolist(), cols.tolist())
+        ]
+    else:
+        # Z-type: CNOT from ancilla to data
+        cnot_pairs = [
+            (ancilla_qubits[s_idx], data_qubits[q])
+            for s_idx, q in zip(rows.tolist(), cols.tolist())
+        ]
     
     if not cnot_pairs:
-        return
+        return []
     
     # Schedule into conflict-free layers
-    layers = graph_coloring_cnots(cnot_pairs)
-    
-    # Apply each layer with TICK separation
-    for layer_idx, layer_cnots in enumerate(layers):
+    return [
+        [q for pair in layer_cnots for q in pair]
+        for layer_cnots in graph_coloring_cnots(cnot_pairs)
+    ]
+
+
+def emit_cnot_layers(circuit: stim.Circuit, layers: List[List[int]]) -> None:
+    """Append one CX per layer, with a TICK between consecutive layers."""
+    for layer_idx, targets in enumerate(layers):
         if layer_idx > 0:
             circuit.append("TICK")
         
-        for ctrl, targ in layer_cnots:
-            circuit.append("CX", [ctrl, targ])
+        append_gate(circuit, "CX", targets)
 
 
 # ============================================================================
@@ -279,6 +367,7 @@ class MemoryExperiment(Experiment):
         Returns a mapping from (x, y) coordinate to data qubit index.
         """
         coord_to_data: Dict[Tuple[float, float], int] = {}
+        coords: List[Tuple[int, Tuple[float, float]]] = []
         
         if data_coords is not None:
             for q, coord in zip(data_qubits, data_coords):
@@ -287,13 +376,14 @@ class MemoryExperiment(Experiment):
                     coord_tuple = (x, y)
                     if coord_tuple not in coord_to_data:
                         coord_to_data[coord_tuple] = q
-                        circuit.append("QUBIT_COORDS", [q], [x, y])
+                        coords.append((q, coord_tuple))
         
         if ancilla_qubits is not None and ancilla_coords is not None:
             for a, coord in zip(ancilla_qubits, ancilla_coords):
                 if len(coord) >= 2:
-                    circuit.append("QUBIT_COORDS", [a], [float(coord[0]), float(coord[1])])
+                    coords.append((a, (float(coord[0]), float(coord[1]))))
         
+        append_qubit_coords(circuit, coords)
         return coord_to_data
     
     def _add_detector(
@@ -337,9 +427,7 @@ class MemoryExperiment(Experiment):
         """
         if not rec_indices:
             return
-        lookbacks = [idx - m_index for idx in rec_indices]
-        obs_targets = [stim.target_rec(lb) for lb in lookbacks]
-        circuit.append("OBSERVABLE_INCLUDE", obs_targets, observable_index)
+        append_observable(circuit, [idx - m_index for idx in rec_indices], observable_index)
     
     def _get_detector_coords(
         self,
@@ -382,17 +470,7 @@ class MemoryExperiment(Experiment):
         Returns:
             List of qubit indices in the logical operator support.
         """
-        if basis == "Z":
-            ops = get_logical_ops(code, 'z')
-            pauli_chars = ("Z", "Y")
-        else:
-            ops = get_logical_ops(code, 'x')
-            pauli_chars = ("X", "Y")
-        
-        if ops_valid(ops) and logical_qubit < ops_len(ops):
-            L = ops[logical_qubit]
-            return [q for q in range(n) if pauli_at(L, q) in pauli_chars]
-        return []
+        return logical_op_support(code, "Z" if basis == "Z" else "X", logical_qubit, n)
 
 
 class StabilizerMemoryExperiment(MemoryExperiment):
@@ -434,9 +512,49 @@ class StabilizerMemoryExperiment(MemoryExperiment):
         3. Emit stabilizer rounds with time-like detectors
         4. Final data measurement with space-like detectors
         5. Observable declaration
+        
+        The circuit depends only on the code and the experiment settings, so
+        it is built once per code and configuration and handed out as a copy;
+        noise is applied to that copy. A cached circuit is only reused while
+        the code contents it was built from are unchanged.
         """
         basis = self.basis.upper()
+        key = self._circuit_key(basis)
+        fingerprint = self._code_state()
+        circuits = _MEMORY_CIRCUITS.setdefault(self.code, {})
+        entry = circuits.get(key)
+        if entry is None or entry[0] != fingerprint:
+            entry = circuits[key] = (fingerprint, self._build_circuit(basis))
+        return entry[1].copy()
+    
+    def _circuit_key(self, basis: str) -> tuple:
+        """Settings, besides the code, that shape the ideal circuit.
         
+        Must cover every experiment attribute ``_build_circuit`` reads;
+        subclasses that read more extend the tuple.
+        """
+        return (type(self), self.rounds, basis, self.logical_qubit)
+    
+    def _code_state(self) -> tuple:
+        """Snapshot of the code contents ``_build_circuit``'s builder reads.
+        
+        Compared on every call, so a code edited after construction gets a
+        fresh circuit; subclasses with other builders override it.
+        """
+        code = self.code
+        meta = getattr(code, "metadata", None) or {}
+        return (
+            code.n,
+            _freeze(code.stabilizer_matrix),
+            _freeze(getattr(code, "logical_x", None)),
+            _freeze(getattr(code, "logical_z", None)),
+            _freeze(getattr(code, "logical_x_ops", None)),
+            _freeze(getattr(code, "logical_z_ops", None)),
+            _freeze(meta.get("data_coords")),
+        )
+    
+    def _build_circuit(self, basis: str) -> stim.Circuit:
+        """Emit the memory circuit with GeneralStabilizerRoundBuilder."""
         # Create detector context for tracking
         ctx = DetectorContext()
         
@@ -477,8 +595,20 @@ class CSSMemoryExperiment(StabilizerMemoryExperiment):
     
     Uses StabilizerRoundBuilder for efficient circuit construction with
     proper scheduling and detector generation.
+    
+    With ``repeat_rounds=True`` the steady-state rounds are emitted as one
+    ``REPEAT`` block, so circuit size no longer grows with ``rounds``.
     """
 
+    # Metadata entries CSSStabilizerRoundBuilder reads.
+    _BUILDER_METADATA_KEYS: Tuple[str, ...] = (
+        "data_coords",
+        "x_stab_coords",
+        "z_stab_coords",
+        "x_schedule",
+        "z_schedule",
+    )
+    
     def __init__(
         self,
         code: CSSCode,
@@ -486,6 +616,7 @@ class CSSMemoryExperiment(StabilizerMemoryExperiment):
         noise_model: Dict[str, Any] | None = None,
         basis: str = "Z",
         metadata: Optional[Dict[str, Any]] = None,
+        repeat_rounds: bool = False,
     ):
         super().__init__(
             code=code,
@@ -494,8 +625,26 @@ class CSSMemoryExperiment(StabilizerMemoryExperiment):
             basis=basis,
             metadata=metadata
         )
+        self.repeat_rounds = repeat_rounds
 
-    def to_stim(self) -> stim.Circuit:
+    def _circuit_key(self, basis: str) -> tuple:
+        """Settings, besides the code, that shape the ideal circuit."""
+        return super()._circuit_key(basis) + (self.repeat_rounds,)
+    
+    def _code_state(self) -> tuple:
+        """Snapshot of the check matrices, logicals and layout metadata."""
+        code = self.code
+        meta = getattr(code, "metadata", None) or {}
+        return (
+            code.n,
+            _freeze(code.hx),
+            _freeze(code.hz),
+            _freeze(code.logical_x_ops),
+            _freeze(code.logical_z_ops),
+            tuple(_freeze(meta.get(key)) for key in self._BUILDER_METADATA_KEYS),
+        )
+    
+    def _build_circuit(self, basis: str) -> stim.Circuit:
         """
         Build a CSS memory experiment using CSSStabilizerRoundBuilder.
         
@@ -506,8 +655,6 @@ class CSSMemoryExperiment(StabilizerMemoryExperiment):
           4. Final data measurement with space-like detectors
           5. Observable declaration
         """
-        basis = self.basis.upper()
-        
         # Create detector context for tracking
         ctx = DetectorContext()
         
@@ -531,8 +678,9 @@ class CSSMemoryExperiment(StabilizerMemoryExperiment):
         builder.emit_prepare_logical_state(c, state=initial_state, logical_idx=self.logical_qubit)
         
         # Emit stabilizer rounds with time-like detectors
-        for _ in range(self.rounds):
-            builder.emit_round(c, stab_type=StabilizerBasis.BOTH, emit_detectors=True)
+        builder.emit_rounds(
+            c, self.rounds, stab_type=StabilizerBasis.BOTH, use_repeat=self.repeat_rounds
+        )
         
         # Final measurement and space-like detectors
         builder.emit_final_measurement(c, basis=basis, logical_idx=self.logical_qubit)
@@ -578,14 +726,19 @@ class CSSMemoryExperiment(StabilizerMemoryExperiment):
         # Cache basis as upper-case once.
         basis = self.basis.upper()
 
+        # ---- Geometry / metadata (fetched once) ---------------------------
+        meta = getattr(code, "metadata", None) or {}
+        data_coords = meta.get("data_coords")
+        x_stab_coords = meta.get("x_stab_coords")
+        z_stab_coords = meta.get("z_stab_coords")
+        x_schedule = meta.get("x_schedule")
+        z_schedule = meta.get("z_schedule")
+
         # --- Align layer matrices (hx/hz) with provided geometric coords.
         # Some chain-complex constructions may order/label faces differently,
         # so ensure that the X layer count matches x_stab_coords and likewise for Z.
-        meta = getattr(code, "metadata", {}) if hasattr(code, "metadata") else {}
-        x_coords_meta = meta.get("x_stab_coords")
-        z_coords_meta = meta.get("z_stab_coords")
-        if x_coords_meta is not None and z_coords_meta is not None:
-            if hx.shape[0] != len(x_coords_meta) and hz.shape[0] == len(x_coords_meta):
+        if x_stab_coords is not None and z_stab_coords is not None:
+            if hx.shape[0] != len(x_stab_coords) and hz.shape[0] == len(x_stab_coords):
                 # Swap layers so hx corresponds to X faces and hz to Z faces.
                 hx, hz = hz, hx
 
@@ -598,40 +751,36 @@ class CSSMemoryExperiment(StabilizerMemoryExperiment):
 
         c = stim.Circuit()
 
-        # ---- Geometry / metadata ------------------------------------------
-        meta = getattr(code, "metadata", {}) if hasattr(code, "metadata") else {}
-        data_coords = meta.get("data_coords")
-        x_stab_coords = meta.get("x_stab_coords")
-        z_stab_coords = meta.get("z_stab_coords")
-        x_schedule = meta.get("x_schedule")
-        z_schedule = meta.get("z_schedule")
-
-        coord_to_data: dict[tuple[float, float], int] = {}
-
-        if data_coords is not None:
-            for q, (x, y) in enumerate(data_coords):
-                coord = (float(x), float(y))
-                if coord in coord_to_data:
-                    continue
-                coord_to_data[coord] = q
-                c.append("QUBIT_COORDS", [q], [coord[0], coord[1]])
+        # Coordinates as float pairs, converted once and shared by the qubit
+        # coordinates, the schedule lookup and every detector below.
+        def float_xy(coords) -> List[tuple[float, float]]:
+            return [(float(x), float(y)) for x, y in coords or ()]
 
-        if x_stab_coords is not None:
-            for a, (x, y) in zip(anc_x, x_stab_coords):
-                c.append("QUBIT_COORDS", [a], [float(x), float(y)])
+        data_xy = float_xy(data_coords)
+        x_stab_xy = float_xy(x_stab_coords)
+        z_stab_xy = float_xy(z_stab_coords)
 
-        if z_stab_coords is not None:
-            for a, (x, y) in zip(anc_z, z_stab_coords):
-                c.append("QUBIT_COORDS", [a], [float(x), float(y)])
+        coord_to_data: dict[tuple[float, float], int] = {}
+        for q, coord in enumerate(data_xy):
+            coord_to_data.setdefault(coord, q)
+
+        # One QUBIT_COORDS per distinct data coordinate, then the ancillas,
+        # parsed as a single program-text batch.
+        append_qubit_coords(
+            c,
+            [(q, coord) for coord, q in coord_to_data.items()]
+            + list(zip(anc_x, x_stab_xy))
+            + list(zip(anc_z, z_stab_xy)),
+        )
 
         # ---- Initial preparation ------------------------------------------
         total_qubits = n + n_x + n_z
         if total_qubits:
-            c.append("R", range(total_qubits))
+            append_gate(c, "R", range(total_qubits))
 
         # Prepare logical in chosen basis (crude: apply H to all data for X-basis).
         if self.basis.upper() == "X" and n > 0:
-            c.append("H", data_qubits)
+            append_gate(c, "H", data_qubits)
 
         c.append("TICK")
 
@@ -640,10 +789,14 @@ class CSSMemoryExperiment(StabilizerMemoryExperiment):
         last_x_meas: list[Optional[int]] = [None] * n_x
         last_z_meas: list[Optional[int]] = [None] * n_z
 
+        # Detectors are queued by add_detector and appended a group at a time
+        # by flush_detectors (one program-text parse per group).
+        detectors: List[Tuple[List[int], Tuple[float, ...]]] = []
+
         def add_detector(coord: tuple[float, float],
                          rec_indices: list[int],
                          t: float = 0.0) -> None:
-            """Emit a DETECTOR at space-time coord with rec lookbacks.
+            """Queue a DETECTOR at space-time coord with rec lookbacks.
 
             `rec_indices` are absolute measurement indices (0,1,2,...).
             At the moment we call this, `m_index` is the total #meas so far.
@@ -653,123 +806,123 @@ class CSSMemoryExperiment(StabilizerMemoryExperiment):
             if not rec_indices:
                 return
             lookbacks = [idx - m_index for idx in rec_indices]
-            c.append(
-                "DETECTOR",
-                [stim.target_rec(lb) for lb in lookbacks],
-                [float(coord[0]), float(coord[1]), t],
-            )
-
-        def stab_coord(coords: Optional[List[tuple[float, float]]], idx: int) -> tuple[float, float]:
-            if coords is None or idx >= len(coords):
-                return (0.0, 0.0)
-            x, y = coords[idx]
-            return (float(x), float(y))
-
-        use_geo_x = bool(
-            x_schedule
-            and data_coords is not None
-            and x_stab_coords is not None
-            and len(x_stab_coords) == n_x
+            detectors.append((lookbacks, (coord[0], coord[1], t)))
+
+        def flush_detectors() -> None:
+            append_detectors(c, detectors)
+            detectors.clear()
+
+        def time_detectors(det_xy: List[tuple[float, float]],
+                           last_meas: list[Optional[int]],
+                           meas_start: int,
+                           first_round: bool,
+                           deterministic: bool) -> None:
+            """Queue and flush one batch of time-like detectors.
+
+            Every round measures all checks of a type, so `last_meas` is
+            unset exactly on the first round and fully set afterwards; the
+            branch is taken once per batch instead of once per check. On the
+            first round a lone detector is only emitted when the outcome is
+            deterministic (check type matches the memory basis).
+            """
+            count = len(last_meas)
+            if not first_round:
+                for s_idx in range(count):
+                    add_detector(det_xy[s_idx], [last_meas[s_idx], meas_start + s_idx], t=0.0)
+            elif deterministic:
+                for s_idx in range(count):
+                    add_detector(det_xy[s_idx], [meas_start + s_idx], t=0.0)
+            last_meas[:] = range(meas_start, meas_start + count)
+            flush_detectors()
+
+        # Detector (x, y) per check; checks without coordinates sit at the origin.
+        x_det_xy = x_stab_xy[:n_x] + [(0.0, 0.0)] * (n_x - len(x_stab_xy[:n_x]))
+        z_det_xy = z_stab_xy[:n_z] + [(0.0, 0.0)] * (n_z - len(z_stab_xy[:n_z]))
+
+        # Geometric scheduling needs the data coordinates plus a schedule and
+        # one coordinate per check of that type; with both types available
+        # the X and Z CNOT phases are interleaved.
+        has_data_coords = data_coords is not None
+        use_geo_x = bool(x_schedule) and has_data_coords and (
+            x_stab_coords is not None and len(x_stab_coords) == n_x
         )
-        use_geo_z = bool(
-            z_schedule
-            and data_coords is not None
-            and z_stab_coords is not None
-            and len(z_stab_coords) == n_z
+        use_geo_z = bool(z_schedule) and has_data_coords and (
+            z_stab_coords is not None and len(z_stab_coords) == n_z
         )
+        interleaved_geo = use_geo_x and use_geo_z
+
+        def geo_layers(stab_coords, schedule, ancillas) -> List[List[int]]:
+            """Flat CNOT targets per schedule step, matched once for all rounds."""
+            layers: List[List[int]] = []
+            for dx, dy in schedule or []:
+                targets: List[int] = []
+                for a, (sx, sy) in zip(ancillas, stab_coords):
+                    dq = coord_to_data.get((sx + dx, sy + dy))
+                    if dq is not None:
+                        targets += (dq, a)
+                layers.append(targets)
+            return layers
 
         # ---- Syndrome rounds ----------------------------------------------
-        interleaved_geo = bool(
-            (x_schedule and z_schedule)
-            and (data_coords is not None)
-            and (x_stab_coords is not None)
-            and (z_stab_coords is not None)
-            and (len(x_stab_coords) == n_x)
-            and (len(z_stab_coords) == n_z)
-        )
-
-        for r in range(self.rounds):
-            # Prepare ancillas for this round.
-            # X ancillas: rotate into |+> at the start of each round.
+        # The gates of a round (ancilla rotations, CNOT layers and TICKs)
+        # are the same every round, so they are emitted once into a
+        # standalone circuit and each round appends that parsed block.
+        round_gates = stim.Circuit()
+        # X ancillas: rotate into |+> at the start of each round.
+        # Z ancillas start in |0> from the initial global reset or the
+        # previous round's demolition measurement, so no per-round reset
+        # is needed.
+        if n_x:
+            append_gate(round_gates, "H", anc_x)
+
+        if interleaved_geo:
+            # Interleave X and Z checks per phase (Stim style)
+            geo_x_layers = geo_layers(x_stab_xy, x_schedule, anc_x)
+            geo_z_layers = geo_layers(z_stab_xy, z_schedule, anc_z)
+            for x_targets, z_targets in zip(geo_x_layers, geo_z_layers):
+                round_gates.append("TICK")
+                # X layer: CNOT(data -> ancilla)
+                if x_targets:
+                    append_gate(round_gates, "CNOT", x_targets)
+                # Z layer: CNOT(data -> ancilla)
+                if z_targets:
+                    append_gate(round_gates, "CNOT", z_targets)
+            # Rotate X ancillas back before measurement
+            append_gate(round_gates, "H", anc_x)
+        else:
+            # Fallback: perform X layer then Z layer (non-interleaved), using
+            # the geometric schedule where available and graph-coloring
+            # scheduling with TICK separation otherwise
             if n_x:
-                if interleaved_geo or use_geo_x:
-                    for s_idx, (sx, sy) in enumerate(x_stab_coords or []):
-                        a = anc_x[s_idx]
-                        c.append("H", [a])
+                if use_geo_x:
+                    for targets in geo_layers(x_stab_xy, x_schedule, anc_x):
+                        round_gates.append("TICK")
+                        if targets:
+                            append_gate(round_gates, "CNOT", targets)
                 else:
-                    for s_idx in range(n_x):
-                        a = anc_x[s_idx]
-                        c.append("H", [a])
-
-            # Z ancillas start in |0> from the initial global reset or the
-            # previous round's demolition measurement, so no per-round reset
-            # is needed here.
-
-            if interleaved_geo:
-                # Interleave X and Z checks per phase (Stim style)
-                for (dx_x, dy_x), (dx_z, dy_z) in zip(x_schedule, z_schedule):
-                    c.append("TICK")
-                    # X layer: CNOT(data -> ancilla)
-                    for s_idx, (sx, sy) in enumerate(x_stab_coords):
-                        a = anc_x[s_idx]
-                        nbr = (float(sx) + dx_x, float(sy) + dy_x)
-                        dq = coord_to_data.get(nbr)
-                        if dq is not None:
-                            c.append("CNOT", [dq, a])
-                    # Z layer: CNOT(data -> ancilla)
-                    for s_idx, (sx, sy) in enumerate(z_stab_coords):
-                        a = anc_z[s_idx]
-                        nbr = (float(sx) + dx_z, float(sy) + dy_z)
-                        dq = coord_to_data.get(nbr)
-                        if dq is not None:
-                            c.append("CNOT", [dq, a])
+                    emit_cnot_layers(
+                        round_gates,
+                        stabilizer_cnot_layers(hx, data_qubits, anc_x, is_x_type=True),
+                    )
                 # Rotate X ancillas back before measurement
-                for s_idx in range(n_x):
-                    a = anc_x[s_idx]
-                    c.append("H", [a])
-            else:
-                # Fallback: perform X layer then Z layer (non-interleaved)
-                # Uses graph-coloring scheduling with TICK separation
-                if n_x:
-                    if use_geo_x:
-                        for dx, dy in x_schedule or []:
-                            c.append("TICK")
-                            for s_idx, (sx, sy) in enumerate(x_stab_coords or []):
-                                a = anc_x[s_idx]
-                                nbr = (float(sx) + dx, float(sy) + dy)
-                                dq = coord_to_data.get(nbr)
-                                if dq is not None:
-                                    c.append("CNOT", [dq, a])
-                        for s_idx in range(n_x):
-                            a = anc_x[s_idx]
-                            c.append("H", [a])
-                    else:
-                        # Use graph-coloring scheduling for proper timing
-                        apply_stabilizer_cnots_with_ticks(
-                            c, hx, list(range(n)), anc_x, is_x_type=True
-                        )
-                        # Rotate X ancillas back before measurement
-                        for s_idx in range(n_x):
-                            a = anc_x[s_idx]
-                            c.append("H", [a])
-                
-                c.append("TICK")  # Separate X and Z stabilizer layers
-                
-                if n_z:
-                    if use_geo_z:
-                        for dx, dy in z_schedule or []:
-                            c.append("TICK")
-                            for s_idx, (sx, sy) in enumerate(z_stab_coords or []):
-                                a = anc_z[s_idx]
-                                nbr = (float(sx) + dx, float(sy) + dy)
-                                dq = coord_to_data.get(nbr)
-                                if dq is not None:
-                                    c.append("CNOT", [dq, a])
-                    else:
-                        # Use graph-coloring scheduling for proper timing
-                        apply_stabilizer_cnots_with_ticks(
-                            c, hz, list(range(n)), anc_z, is_x_type=False
-                        )
+                append_gate(round_gates, "H", anc_x)
+
+            round_gates.append("TICK")  # Separate X and Z stabilizer layers
+
+            if n_z:
+                if use_geo_z:
+                    for targets in geo_layers(z_stab_xy, z_schedule, anc_z):
+                        round_gates.append("TICK")
+                        if targets:
+                            append_gate(round_gates, "CNOT", targets)
+                else:
+                    emit_cnot_layers(
+                        round_gates,
+                        stabilizer_cnot_layers(hz, data_qubits, anc_z, is_x_type=False),
+                    )
+
+        for r in range(self.rounds):
+            c += round_gates
 
             # ---- Measure ancillas in batches (like Stim) ----
             # For a CSS memory experiment, we need BOTH X and Z syndromes:
@@ -781,73 +934,28 @@ class CSSMemoryExperiment(StabilizerMemoryExperiment):
             # Both types of stabilizers should be measured in EVERY round to enable
             # proper error correction. The final round may use M instead of MR.
             
-            # Collect all X-ancillas to measure in this round
-            # X-ancillas are measured every round (not just for X-basis)
-            x_ancillas_to_measure = []
-            for s_idx in range(n_x):
-                # Always measure X-ancillas in every round for proper syndrome extraction
-                x_ancillas_to_measure.append((s_idx, anc_x[s_idx]))
-            
-            # Collect all Z-ancillas to measure in this round
-            # Z-ancillas are measured every round for syndrome extraction and space-like detectors
-            z_ancillas_to_measure = []
-            for s_idx in range(n_z):
-                z_ancillas_to_measure.append((s_idx, anc_z[s_idx]))
-            
-            # Measure X-ancillas in one batch (if any)
+            # X- and Z-ancillas are measured every round, each type in one
+            # batch; ancilla s_idx of a type is the s_idx-th record of its batch.
             x_meas_start_idx = m_index
-            if x_ancillas_to_measure:
-                x_qubits = [a for _, a in x_ancillas_to_measure]
-                if r < self.rounds - 1:
-                    c.append("MR", x_qubits)
-                else:
-                    c.append("MR", x_qubits)  # Use MR even in last round for consistency
-                m_index += len(x_qubits)
+            if n_x:
+                append_gate(c, "MR", anc_x)  # MR in every round, including the last
+                m_index += n_x
             
             # Create time-like detectors for X-ancillas
             # For Z-basis memory, X-ancillas have random first-round outcomes (|0> is not X eigenstate)
             # For X-basis memory, X-ancillas have deterministic first-round outcomes (|+> is X eigenstate)
-            for offset, (s_idx, _) in enumerate(x_ancillas_to_measure):
-                cur = x_meas_start_idx + offset
-                coord = stab_coord(x_stab_coords, s_idx)
-                
-                if last_x_meas[s_idx] is None:
-                    # First round: only create detector if basis matches (X-basis memory)
-                    if basis == "X":
-                        add_detector(coord, [cur], t=0.0)
-                    # else: skip first-round detector for X stabilizers in Z-basis memory
-                else:
-                    add_detector(coord, [last_x_meas[s_idx], cur], t=0.0)
-                
-                last_x_meas[s_idx] = cur
+            time_detectors(x_det_xy, last_x_meas, x_meas_start_idx, r == 0, basis == "X")
             
             # Measure Z-ancillas in one batch (if any)
             z_meas_start_idx = m_index
-            if z_ancillas_to_measure:
-                z_qubits = [a for _, a in z_ancillas_to_measure]
-                c.append("MR", z_qubits)
-                m_index += len(z_qubits)
+            if n_z:
+                append_gate(c, "MR", anc_z)
+                m_index += n_z
             
             # Create time-like detectors for Z-ancillas
             # For Z-basis memory, Z-ancillas have deterministic first-round outcomes (|0> is Z eigenstate)
             # For X-basis memory, Z-ancillas have random first-round outcomes (|+> is not Z eigenstate)
-            for offset, (s_idx, _) in enumerate(z_ancillas_to_measure):
-                cur = z_meas_start_idx + offset
-                coord = stab_coord(z_stab_coords, s_idx)
-                
-                if last_z_meas[s_idx] is None:
-                    # First round: only create detector if basis matches (Z-basis memory)
-                    if basis == "Z":
-                        add_detector(coord, [cur], t=0.0)
-                    # else: skip first-round detector for Z stabilizers in X-basis memory
-                else:
-                    add_detector(coord, [last_z_meas[s_idx], cur], t=0.0)
-                
-                last_z_meas[s_idx] = cur
-            
-            # Update last_x_meas for all X-ancillas (they are now measured in every round)
-            for offset, (s_idx, _) in enumerate(x_ancillas_to_measure):
-                last_x_meas[s_idx] = x_meas_start_idx + offset
+            time_detectors(z_det_xy, last_z_meas, z_meas_start_idx, r == 0, basis == "Z")
 
             if data_coords is not None:
                 c.append("SHIFT_COORDS", [], [0.0, 0.0, 1.0])
@@ -860,19 +968,19 @@ class CSSMemoryExperiment(StabilizerMemoryExperiment):
             
             # Measure in chosen basis. For X-basis, rotate with H first.
             if basis == "X":
-                c.append("H", qubits_to_measure)
+                append_gate(c, "H", qubits_to_measure)
             # Remove disentangling CX gates: do NOT entangle data with ancillas before measurement.
             # Measure data qubits deterministically.
             #
             # REPLACE demolition measurement (MR) with standard M for data qubits.
-            c.append("M", qubits_to_measure)
+            append_gate(c, "M", qubits_to_measure)
 
             first_data_idx = m_index
             # Track which qubits were actually measured
             measured_qubits = list(qubits_to_measure)
-            data_meas_indices_all = {}  # qubit_index -> measurement_record_index
-            for i, q in enumerate(measured_qubits):
-                data_meas_indices_all[q] = first_data_idx + i
+            # Data qubits are 0..n-1 and measured in order, so qubit q's
+            # measurement record index is data_meas_idx[q].
+            data_meas_idx = np.arange(first_data_idx, first_data_idx + n, dtype=np.int64)
             m_index += len(measured_qubits)
 
             # Choose which stabiliser layer to use for *space-like* detectors.
@@ -883,80 +991,53 @@ class CSSMemoryExperiment(StabilizerMemoryExperiment):
             if basis == "Z":
                 stab_mat = hz
                 last_stab_meas = last_z_meas
-                stab_coords = z_stab_coords
+                det_xy = z_det_xy
             else:  # basis == "X"
                 stab_mat = hx
                 last_stab_meas = last_x_meas
-                stab_coords = x_stab_coords
+                det_xy = x_det_xy
 
             # Create space-like detectors combining final data measurements with last stabilizer measurements.
             # These detectors represent the parity checks: each stabilizer measures a product of data qubits.
             # We do this regardless of whether the observable covers all stabilizer qubits, since Stim's
             # native implementation also generates these detectors.
-            obs_subset = set(measured_qubits) if measured_qubits else set(range(n))
-            stab_all_qubits = set()
             if stab_mat is not None and stab_mat.size > 0:
-                for row in stab_mat:
-                    stab_all_qubits.update(np.where(row == 1)[0])
-            
-            should_create_space_like = stab_mat is not None and stab_mat.size > 0
-            
-            if should_create_space_like and stab_mat is not None and stab_mat.size > 0:
-                num_stab = stab_mat.shape[0]
-                for s_idx in range(num_stab):
-                    row = stab_mat[s_idx]
-                    # Data measurement indices that participate in this stabiliser.
-                    data_idxs = [
-                        data_meas_indices_all[q]
-                        for q in np.where(row == 1)[0]
-                        if q in data_meas_indices_all
-                    ]
-                    recs = list(data_idxs)
-                    # For Z-basis: pair with last Z-ancilla measurements.
-                    # For X-basis: pair with last X-ancilla measurements.
-                    if basis == "Z":
-                        # Z-basis: use Z-ancilla meas (last_z_meas)
-                        if s_idx < len(last_z_meas) and last_z_meas[s_idx] is not None:
-                            recs.append(last_z_meas[s_idx])
-                    else:
-                        # X-basis: use X-ancilla meas (last_x_meas)
-                        if s_idx < len(last_x_meas) and last_x_meas[s_idx] is not None:
-                            recs.append(last_x_meas[s_idx])
+                # Record indices of every stabiliser's data support in one
+                # gather over the CSR column indices; row s is the slice
+                # indptr[s]:indptr[s + 1].
+                indptr, indices = check_csr(code, stab_mat)
+                stab_recs = data_meas_idx[indices]
+                bounds = indptr.tolist()
+                for s_idx in range(stab_mat.shape[0]):
+                    recs = stab_recs[bounds[s_idx]:bounds[s_idx + 1]].tolist()
+                    # Pair with the last measurement of the same-type ancilla
+                    # (Z ancillas for Z-basis memory, X ancillas for X-basis).
+                    if s_idx < len(last_stab_meas) and last_stab_meas[s_idx] is not None:
+                        recs.append(last_stab_meas[s_idx])
                     if not recs:
                         continue
                     # Use correct spacetime coordinates for detector
                     # Note: Stim uses t=1.0 for space-like detectors (final measurement layer)
-                    coord = stab_coord(stab_coords, s_idx)
-                    add_detector(coord, recs, t=1.0)
+                    add_detector(det_xy[s_idx], recs, t=1.0)
+                flush_detectors()
 
             # ---- Logical observable ---------------------------------------
-            rec_indices_by_data = data_meas_indices_all
-
-            # Use module-level helper functions (get_logical_ops, pauli_at, ops_valid, ops_len)
             logical_support: list[int] = []
-            z_ops = get_logical_ops(code, 'z')
-            x_ops = get_logical_ops(code, 'x')
-            
-            if basis == "Z" and ops_valid(z_ops) and self.logical_qubit < ops_len(z_ops):
-                L = z_ops[self.logical_qubit]
-                logical_support = [q for q in range(n) if pauli_at(L, q) in ("Z", "Y")]
-            elif basis == "X" and ops_valid(x_ops) and self.logical_qubit < ops_len(x_ops):
-                L = x_ops[self.logical_qubit]
-                logical_support = [q for q in range(n) if pauli_at(L, q) in ("X", "Y")]
+            if basis in ("Z", "X"):
+                logical_support = logical_op_support(code, basis, self.logical_qubit, n)
 
             if not logical_support:
                 logical_support = measured_qubits
 
-            obs_rec_indices = [
-                rec_indices_by_data[q] for q in logical_support if q in rec_indices_by_data
-            ]
-            if not obs_rec_indices:
-                obs_rec_indices = list(data_meas_indices_all.values())
+            # Gather the support's record indices in one step, dropping
+            # out-of-range qubits; fall back to every data measurement.
+            support = np.asarray(logical_support, dtype=np.int64)
+            obs_recs = data_meas_idx[support[(support >= 0) & (support < n)]]
+            if not obs_recs.size:
+                obs_recs = data_meas_idx
 
             # Convert absolute indices -> lookbacks for OBSERVABLE_INCLUDE.
-            lookbacks = [idx - m_index for idx in obs_rec_indices]
-            obs_targets = [stim.target_rec(lb) for lb in lookbacks]
-            c.append("OBSERVABLE_INCLUDE", obs_targets, 0)
+            append_observable(c, (obs_recs - m_index).tolist(), 0)
 
         # NOTE: Final measurement block on data qubits uses M (not MR).
         #       Detector coordinates above use correct spacetime (x, y, t).
@@ -981,8 +1062,17 @@ class ColorCodeMemoryExperiment(CSSMemoryExperiment):
     
     For self-dual color codes (where X and Z stabilizers have the same support),
     both X and Z detectors use the same color assignments.
+    
+    ``repeat_rounds`` folds the steady-state rounds into a ``REPEAT`` block,
+    as for :class:`CSSMemoryExperiment`.
     """
     
+    # The colour builder also reads the stabiliser colouring.
+    _BUILDER_METADATA_KEYS = CSSMemoryExperiment._BUILDER_METADATA_KEYS + (
+        "is_chromobius_compatible",
+        "stab_colors",
+    )
+    
     def __init__(
         self,
         code: CSSCode,
@@ -990,9 +1080,10 @@ class ColorCodeMemoryExperiment(CSSMemoryExperiment):
         noise_model: Dict[str, Any] | None = None,
         basis: str = "Z",
         metadata: Optional[Dict[str, Any]] = None,
+        repeat_rounds: bool = False,
     ):
         # Validate that code has color metadata
-        code_meta = getattr(code, "metadata", {}) if hasattr(code, "metadata") else {}
+        code_meta = getattr(code, "metadata", None) or {}
         if not code_meta.get("is_chromobius_compatible", False):
             raise ValueError(
                 "ColorCodeMemoryExperiment requires a code with "
@@ -1009,20 +1100,19 @@ class ColorCodeMemoryExperiment(CSSMemoryExperiment):
             rounds=rounds,
             noise_model=noise_model,
             basis=basis,
-            metadata=metadata
+            metadata=metadata,
+            repeat_rounds=repeat_rounds,
         )
         
         self._stab_colors = code_meta["stab_colors"]
     
-    def to_stim(self) -> stim.Circuit:
+    def _build_circuit(self, basis: str) -> stim.Circuit:
         """
         Build a color code memory experiment using ColorCodeStabilizerRoundBuilder.
         
         Uses the specialized builder that emits 4D detector coordinates
         with color encoding for Chromobius compatibility.
         """
-        basis = self.basis.upper()
-        
         # Create detector context for tracking
         ctx = DetectorContext()
         
@@ -1046,8 +1136,9 @@ class ColorCodeMemoryExperiment(CSSMemoryExperiment):
         builder.emit_prepare_logical_state(c, state=initial_state, logical_idx=self.logical_qubit)
         
         # Emit stabilizer rounds with time-like detectors (4D coords with color)
-        for _ in range(self.rounds):
-            builder.emit_round(c, stab_type=StabilizerBasis.BOTH, emit_detectors=True)
+        builder.emit_rounds(
+            c, self.rounds, stab_type=StabilizerBasis.BOTH, use_repeat=self.repeat_rounds
+        )
         
         # Final measurement and space-like detectors (4D coords with color)
         builder.emit_final_measurement(c, basis=basis, logical_idx=self.logical_qubit)
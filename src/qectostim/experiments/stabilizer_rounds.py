@@ -22,6 +22,7 @@ from enum import Enum
 import numpy as np
 import stim
 
+from qectostim.codes.utils import binary_csr
 from qectostim.utils.scheduling_core import (
     CodeMetadataCache,
     graph_coloring_cnots,
@@ -253,9 +254,8 @@ class DetectorContext:
         if not meas_indices:
             return
         
-        lookbacks = [idx - self.measurement_index for idx in meas_indices]
-        targets = [stim.target_rec(lb) for lb in lookbacks]
-        circuit.append("OBSERVABLE_INCLUDE", targets, observable_idx)
+        m_index = self.measurement_index
+        append_observable(circuit, [idx - m_index for idx in meas_indices], observable_idx)
     
     def clone(self) -> "DetectorContext":
         """Create a copy of the context."""
@@ -368,6 +368,80 @@ class DetectorContext:
                 }
 
 
+def append_detectors(
+    circuit: stim.Circuit,
+    detectors: List[Tuple[List[int], Tuple[float, ...]]],
+) -> None:
+    """
+    Append a batch of DETECTOR instructions.
+    
+    Each detector is a ``(lookbacks, coord)`` pair of negative record offsets
+    and coordinates. The batch is written as stim program text and parsed in
+    one call, which costs far less than one ``circuit.append`` per detector.
+    """
+    if not detectors:
+        return
+    lines = []
+    for lookbacks, coord in detectors:
+        args = "({})".format(", ".join(map(str, coord))) if len(coord) else ""
+        lines.append("DETECTOR{} {}".format(args, " ".join(f"rec[{lb}]" for lb in lookbacks)))
+    circuit.append_from_stim_program_text("\n".join(lines))
+
+
+def append_observable(
+    circuit: stim.Circuit,
+    lookbacks: List[int],
+    observable_idx: int = 0,
+) -> None:
+    """
+    Append one OBSERVABLE_INCLUDE over the given negative record offsets.
+    
+    Written as stim program text, like :func:`append_detectors`, so a
+    logical support of ~d² records is not converted one target at a time.
+    """
+    if not lookbacks:
+        return
+    circuit.append_from_stim_program_text("OBSERVABLE_INCLUDE({}) {}".format(
+        observable_idx, " ".join(f"rec[{lb}]" for lb in lookbacks)
+    ))
+
+
+def append_qubit_coords(
+    circuit: stim.Circuit,
+    coords: List[Tuple[int, Tuple[float, ...]]],
+) -> None:
+    """
+    Append a batch of QUBIT_COORDS instructions.
+    
+    Each entry is a ``(qubit, coord)`` pair. As with
+    :func:`append_detectors`, the batch is written as stim program text and
+    parsed in one call instead of one ``circuit.append`` per qubit.
+    """
+    if not coords:
+        return
+    circuit.append_from_stim_program_text("\n".join(
+        "QUBIT_COORDS({}) {}".format(", ".join(map(str, coord)), q)
+        for q, coord in coords
+    ))
+
+
+def append_gate(circuit: stim.Circuit, name: str, targets) -> None:
+    """
+    Append one gate instruction on plain qubit targets.
+
+    The instruction is written as stim program text (``"CX 0 9 1 10"``) and
+    parsed in one call, which avoids converting every target through the
+    Python bindings; for wide layers this is an order of magnitude cheaper
+    than ``circuit.append``. Like ``append``, it fuses with a preceding
+    instruction of the same gate.
+    """
+    text = " ".join(map(str, targets))
+    if text:
+        circuit.append_from_stim_program_text(f"{name} {text}")
+    else:
+        circuit.append(name, [])
+
+
 class BaseStabilizerRoundBuilder:
     """
     Base class for stabilizer measurement round builders.
@@ -445,10 +519,12 @@ class BaseStabilizerRoundBuilder:
     def emit_qubit_coords(self, circuit: stim.Circuit) -> None:
         """Emit QUBIT_COORDS for all qubits in this block."""
         # Data qubits
-        for local_idx, coord in enumerate(self._data_coords):
-            if len(coord) >= 2:
-                global_idx = self.data_offset + local_idx
-                circuit.append("QUBIT_COORDS", [global_idx], [float(coord[0]), float(coord[1])])
+        coords = [
+            (self.data_offset + local_idx, (float(coord[0]), float(coord[1])))
+            for local_idx, coord in enumerate(self._data_coords)
+            if len(coord) >= 2
+        ]
+        append_qubit_coords(circuit, coords)
     
     def emit_reset_all(self, circuit: stim.Circuit) -> None:
         """Reset all data and ancilla qubits."""
@@ -580,16 +656,36 @@ class CSSStabilizerRoundBuilder(BaseStabilizerRoundBuilder):
         self._n_x = self._hx.shape[0] if self._hx is not None and self._hx.size > 0 else 0
         self._n_z = self._hz.shape[0] if self._hz is not None and self._hz.size > 0 else 0
         
+        # Data-qubit support of each check row, taken from the code's CSR cache
+        self._x_supports = self._check_supports("_hx") if self._n_x else []
+        self._z_supports = self._check_supports("_hz") if self._n_z else []
+        
         # Cache CSS-specific stabilizer coordinates
         self._x_stab_coords = self._meta.get('x_stab_coords', [])
         self._z_stab_coords = self._meta.get('z_stab_coords', [])
         self._x_schedule = self._meta.get('x_schedule')
         self._z_schedule = self._meta.get('z_schedule')
         
+        # Geometric CNOT layers per stabilizer type, built on first use
+        self._geo_layers: Dict[str, List[List[int]]] = {}
+        # Graph-coloured CNOT layers per check matrix, built on first use
+        self._coloring_layers: Dict[bool, Tuple[np.ndarray, List[List[int]]]] = {}
+        # Gate block (rotations, CNOTs, TICKs, MR) per stabilizer type, built on first use
+        self._round_templates: Dict[str, stim.Circuit] = {}
+        
         # Track last measurements for each stabilizer (for time-like detectors)
         self._last_x_meas: List[Optional[int]] = [None] * self._n_x
         self._last_z_meas: List[Optional[int]] = [None] * self._n_z
     
+    def _check_supports(self, attr: str) -> List[np.ndarray]:
+        """Per-row data supports of ``self.<attr>``, shared via the code when possible."""
+        matrix = getattr(self, attr)
+        if getattr(self.code, attr, None) is matrix and hasattr(self.code, "_check_csr"):
+            indptr, indices = self.code._check_csr(attr)
+        else:
+            indptr, indices = binary_csr(matrix)
+        return np.split(indices, indptr[1:-1])
+    
     @property
     def x_ancillas(self) -> List[int]:
         """Global indices of X stabilizer ancillas."""
@@ -611,28 +707,32 @@ class CSSStabilizerRoundBuilder(BaseStabilizerRoundBuilder):
     def emit_qubit_coords(self, circuit: stim.Circuit) -> None:
         """Emit QUBIT_COORDS for all qubits in this block."""
         # Data qubits
-        for local_idx, coord in enumerate(self._data_coords):
-            if len(coord) >= 2:
-                global_idx = self.data_offset + local_idx
-                circuit.append("QUBIT_COORDS", [global_idx], [float(coord[0]), float(coord[1])])
+        coords = [
+            (self.data_offset + local_idx, (float(coord[0]), float(coord[1])))
+            for local_idx, coord in enumerate(self._data_coords)
+            if len(coord) >= 2
+        ]
         
         # X ancillas
-        for local_idx, coord in enumerate(self._x_stab_coords):
-            if len(coord) >= 2 and local_idx < self._n_x:
-                global_idx = self.ancilla_offset + local_idx
-                circuit.append("QUBIT_COORDS", [global_idx], [float(coord[0]), float(coord[1])])
+        coords += [
+            (self.ancilla_offset + local_idx, (float(coord[0]), float(coord[1])))
+            for local_idx, coord in enumerate(self._x_stab_coords[:self._n_x])
+            if len(coord) >= 2
+        ]
         
         # Z ancillas
-        for local_idx, coord in enumerate(self._z_stab_coords):
-            if len(coord) >= 2 and local_idx < self._n_z:
-                global_idx = self.ancilla_offset + self._n_x + local_idx
-                circuit.append("QUBIT_COORDS", [global_idx], [float(coord[0]), float(coord[1])])
+        coords += [
+            (self.ancilla_offset + self._n_x + local_idx, (float(coord[0]), float(coord[1])))
+            for local_idx, coord in enumerate(self._z_stab_coords[:self._n_z])
+            if len(coord) >= 2
+        ]
+        append_qubit_coords(circuit, coords)
     
     def emit_reset_all(self, circuit: stim.Circuit) -> None:
         """Reset all data and ancilla qubits."""
         all_qubits = self.data_qubits + self.x_ancillas + self.z_ancillas
         if all_qubits:
-            circuit.append("R", all_qubits)
+            append_gate(circuit, "R", all_qubits)
     
     def emit_prepare_logical_state(
         self,
@@ -675,7 +775,7 @@ class CSSStabilizerRoundBuilder(BaseStabilizerRoundBuilder):
                 for q in support:
                     circuit.append("Z", [self.data_offset + q])
             # Apply H to all data qubits
-            circuit.append("H", self.data_qubits)
+            append_gate(circuit, "H", self.data_qubits)
         
         circuit.append("TICK")
     
@@ -715,110 +815,120 @@ class CSSStabilizerRoundBuilder(BaseStabilizerRoundBuilder):
         if self._hx is None or self._n_x == 0:
             return
         
-        x_anc = self.x_ancillas
-        
-        # Prepare X ancillas with H
-        circuit.append("H", x_anc)
-        circuit.append("TICK")
-        
-        # Apply CNOTs using geometric or graph-coloring schedule
-        if self._use_geometric_x():
-            self._emit_geometric_cnots(circuit, "x")
-        else:
-            self._emit_graph_coloring_cnots(circuit, self._hx, self.data_qubits, x_anc, is_x_type=True)
-        
-        # TICK to separate CNOTs from final H
-        circuit.append("TICK")
-        
-        # Final H on X ancillas
-        circuit.append("H", x_anc)
-        circuit.append("TICK")
-        
-        # Measure X ancillas
+        # H, CNOTs, H and MR on the X ancillas, identical every round
+        circuit += self._round_template("x")
         meas_start = self.ctx.add_measurement(self._n_x)
-        circuit.append("MR", x_anc)
         
         # Time-like detectors with proper first-round logic
         # For Z-basis memory: X stabilizers have RANDOM first-round outcomes (|0⟩ is not X eigenstate)
         # For X-basis memory: X stabilizers have DETERMINISTIC first-round outcomes (|+⟩ is X eigenstate)
-        if emit_detectors:
-            for s_idx in range(self._n_x):
-                cur_meas = meas_start + s_idx
-                prev_meas = self._last_x_meas[s_idx]
-                
-                if prev_meas is None:
-                    # First round: only create detector if basis matches
-                    if self.measurement_basis == "X":
-                        coord = self._get_stab_coord("x", s_idx)
-                        self.ctx.emit_detector(circuit, [cur_meas], coord)
-                    # else: skip first-round detector for X stabilizers in Z-basis memory
-                else:
-                    # Compare with previous round
-                    coord = self._get_stab_coord("x", s_idx)
-                    self.ctx.emit_detector(circuit, [prev_meas, cur_meas], coord)
-                
-                self._last_x_meas[s_idx] = cur_meas
-                # Also record in context for FT gadget experiments
-                self.ctx.record_stabilizer_measurement(
-                    self.block_name, "x", s_idx, cur_meas
-                )
-        else:
-            # Still record measurements even without detectors
-            for s_idx in range(self._n_x):
-                cur_meas = meas_start + s_idx
-                self._last_x_meas[s_idx] = cur_meas
-                self.ctx.record_stabilizer_measurement(
-                    self.block_name, "x", s_idx, cur_meas
-                )
+        self._emit_time_detectors(circuit, "x", meas_start, emit_detectors)
     
     def _emit_z_round(self, circuit: stim.Circuit, emit_detectors: bool) -> None:
         """Emit Z stabilizer measurements."""
         if self._hz is None or self._n_z == 0:
             return
         
-        z_anc = self.z_ancillas
-        
-        # Apply CNOTs using geometric or graph-coloring schedule
-        if self._use_geometric_z():
-            self._emit_geometric_cnots(circuit, "z")
-        else:
-            self._emit_graph_coloring_cnots(circuit, self._hz, self.data_qubits, z_anc, is_x_type=False)
-        
-        circuit.append("TICK")
-        
-        # Measure Z ancillas
+        # CNOTs and MR on the Z ancillas, identical every round
+        circuit += self._round_template("z")
         meas_start = self.ctx.add_measurement(self._n_z)
-        circuit.append("MR", z_anc)
         
         # Time-like detectors with proper first-round logic
         # For Z-basis memory: Z stabilizers have DETERMINISTIC first-round outcomes (|0⟩ is Z eigenstate)
         # For X-basis memory: Z stabilizers have RANDOM first-round outcomes (|+⟩ is not Z eigenstate)
+        self._emit_time_detectors(circuit, "z", meas_start, emit_detectors)
+    
+    def _round_template(self, stab_type: str) -> stim.Circuit:
+        """Gate block of one X or Z measurement, built once per builder.
+        
+        The ancilla rotations, CNOT schedule, TICKs and ancilla MR depend
+        only on the code and the qubit layout, so they are emitted into a
+        standalone circuit on first use and each round appends it with
+        ``+=``; only the detectors are produced per round.
+        """
+        template = self._round_templates.get(stab_type)
+        if template is not None:
+            return template
+        
+        template = stim.Circuit()
+        if stab_type == "x":
+            x_anc = self.x_ancillas
+            
+            # Prepare X ancillas with H
+            append_gate(template, "H", x_anc)
+            template.append("TICK")
+            
+            # Apply CNOTs using geometric or graph-coloring schedule
+            if self._use_geometric_x():
+                self._emit_geometric_cnots(template, "x")
+            else:
+                self._emit_graph_coloring_cnots(template, self._hx, self.data_qubits, x_anc, is_x_type=True)
+            
+            # TICK to separate CNOTs from final H
+            template.append("TICK")
+            
+            # Final H on X ancillas
+            append_gate(template, "H", x_anc)
+            template.append("TICK")
+            
+            # Measure X ancillas
+            append_gate(template, "MR", x_anc)
+        else:
+            z_anc = self.z_ancillas
+            
+            # Apply CNOTs using geometric or graph-coloring schedule
+            if self._use_geometric_z():
+                self._emit_geometric_cnots(template, "z")
+            else:
+                self._emit_graph_coloring_cnots(template, self._hz, self.data_qubits, z_anc, is_x_type=False)
+            
+            template.append("TICK")
+            
+            # Measure Z ancillas
+            append_gate(template, "MR", z_anc)
+        
+        self._round_templates[stab_type] = template
+        return template
+    
+    def _emit_time_detectors(
+        self,
+        circuit: stim.Circuit,
+        stab_type: str,
+        meas_start: int,
+        emit_detectors: bool,
+    ) -> None:
+        """
+        Emit the time-like detectors for one block of ancilla measurements.
+        
+        Each stabilizer is compared with its previous measurement; on the
+        first round a lone detector is emitted only when the stabilizer type
+        matches the memory basis. Lookbacks are taken against the current
+        measurement index once and the block is appended in one batch; the
+        last-measurement tracking is updated either way (FT gadget
+        experiments read it back from the context).
+        """
+        last = self._last_x_meas if stab_type == "x" else self._last_z_meas
+        n = len(last)
         if emit_detectors:
-            for s_idx in range(self._n_z):
-                cur_meas = meas_start + s_idx
-                prev_meas = self._last_z_meas[s_idx]
-                
-                if prev_meas is None:
-                    # First round: only create detector if basis matches
-                    if self.measurement_basis == "Z":
-                        coord = self._get_stab_coord("z", s_idx)
-                        self.ctx.emit_detector(circuit, [cur_meas], coord)
-                    # else: skip first-round detector for Z stabilizers in X-basis memory
+            m_index = self.ctx.measurement_index
+            first_round = self.measurement_basis.lower() == stab_type
+            detectors = []
+            for s_idx in range(n):
+                prev_meas = last[s_idx]
+                cur = meas_start + s_idx - m_index
+                if prev_meas is not None:
+                    lookbacks = [prev_meas - m_index, cur]
+                elif first_round:
+                    lookbacks = [cur]
                 else:
-                    coord = self._get_stab_coord("z", s_idx)
-                    self.ctx.emit_detector(circuit, [prev_meas, cur_meas], coord)
-                
-                self._last_z_meas[s_idx] = cur_meas
-                self.ctx.record_stabilizer_measurement(
-                    self.block_name, "z", s_idx, cur_meas
-                )
-        else:
-            for s_idx in range(self._n_z):
-                cur_meas = meas_start + s_idx
-                self._last_z_meas[s_idx] = cur_meas
-                self.ctx.record_stabilizer_measurement(
-                    self.block_name, "z", s_idx, cur_meas
-                )
+                    continue
+                detectors.append((lookbacks, self._get_stab_coord(stab_type, s_idx)))
+            append_detectors(circuit, detectors)
+        
+        last[:] = range(meas_start, meas_start + n)
+        record = self.ctx.record_stabilizer_measurement
+        for s_idx in range(n):
+            record(self.block_name, stab_type, s_idx, meas_start + s_idx)
     
     def _use_geometric_x(self) -> bool:
         """Check if geometric scheduling is available for X stabilizers."""
@@ -843,6 +953,23 @@ class CSSStabilizerRoundBuilder(BaseStabilizerRoundBuilder):
         - X-type stabilizers: CNOT(data, ancilla) - data controls
         - Z-type stabilizers: CNOT(ancilla, data) - ancilla controls
         """
+        for layer_idx, targets in enumerate(self._geometric_cnot_layers(stab_type)):
+            if layer_idx > 0:
+                circuit.append("TICK")
+            if targets:
+                append_gate(circuit, "CNOT", targets)
+    
+    def _geometric_cnot_layers(self, stab_type: str) -> List[List[int]]:
+        """Flat CNOT targets for each schedule step, resolved once per builder.
+        
+        Each step offsets every stabilizer coordinate and looks the neighbour
+        up in the data-coordinate hash; the schedule and coordinates are fixed,
+        so every round reuses the same layers.
+        """
+        layers = self._geo_layers.get(stab_type)
+        if layers is not None:
+            return layers
+        
         if stab_type == "x":
             schedule = self._x_schedule
             stab_coords = self._x_stab_coords
@@ -852,22 +979,22 @@ class CSSStabilizerRoundBuilder(BaseStabilizerRoundBuilder):
             stab_coords = self._z_stab_coords
             ancillas = self.z_ancillas
         
-        for layer_idx, (dx, dy) in enumerate(schedule):
-            if layer_idx > 0:
-                circuit.append("TICK")
-            for s_idx, (sx, sy) in enumerate(stab_coords):
-                if s_idx >= len(ancillas):
-                    continue
-                anc = ancillas[s_idx]
-                nbr = (float(sx) + dx, float(sy) + dy)
-                dq = self._coord_to_data.get(nbr)
+        stab_xy = [(float(sx), float(sy)) for sx, sy in stab_coords[:len(ancillas)]]
+        layers = []
+        for dx, dy in schedule:
+            targets: List[int] = []
+            for anc, (sx, sy) in zip(ancillas, stab_xy):
+                dq = self._coord_to_data.get((sx + dx, sy + dy))
                 if dq is not None:
                     if stab_type == "x":
                         # X-type: CNOT from data to ancilla
-                        circuit.append("CNOT", [dq, anc])
+                        targets += (dq, anc)
                     else:
                         # Z-type: CNOT from ancilla to data
-                        circuit.append("CNOT", [anc, dq])
+                        targets += (anc, dq)
+            layers.append(targets)
+        self._geo_layers[stab_type] = layers
+        return layers
     
     def _emit_graph_coloring_cnots(
         self,
@@ -896,37 +1023,53 @@ class CSSStabilizerRoundBuilder(BaseStabilizerRoundBuilder):
         is_x_type : bool
             True for X-type stabilizers, False for Z-type.
         """
+        # The colouring depends only on the matrix and the qubit labels, which
+        # are fixed for the builder, so every round reuses the first result
+        cached = self._coloring_layers.get(is_x_type)
+        if cached is not None and cached[0] is stab_matrix:
+            layers = cached[1]
+        else:
+            layers = self._graph_coloring_layers(stab_matrix, data_qubits, ancilla_qubits, is_x_type)
+            self._coloring_layers[is_x_type] = (stab_matrix, layers)
+        
+        # Emit layers with TICKs (between layers, not after last); each
+        # layer is conflict-free, so it goes out as one CNOT instruction
+        for layer_idx, targets in enumerate(layers):
+            if layer_idx > 0:
+                circuit.append("TICK")
+            append_gate(circuit, "CNOT", targets)
+    
+    @staticmethod
+    def _graph_coloring_layers(
+        stab_matrix: np.ndarray,
+        data_qubits: List[int],
+        ancilla_qubits: List[int],
+        is_x_type: bool,
+    ) -> List[List[int]]:
+        """Flat CNOT targets for each conflict-free graph-coloured layer."""
         if stab_matrix is None or stab_matrix.size == 0:
-            return
+            return []
         
         n_stabs, n_data = stab_matrix.shape
         
-        # Collect all CNOT pairs with correct direction
-        all_cnots: List[Tuple[int, int]] = []
-        for s_idx in range(min(n_stabs, len(ancilla_qubits))):
-            anc = ancilla_qubits[s_idx]
-            for d_idx in range(min(n_data, len(data_qubits))):
-                if stab_matrix[s_idx, d_idx]:
-                    dq = data_qubits[d_idx]
-                    if is_x_type:
-                        # X-type: CNOT from data to ancilla
-                        all_cnots.append((dq, anc))
-                    else:
-                        # Z-type: CNOT from ancilla to data
-                        all_cnots.append((anc, dq))
+        # Collect all CNOT pairs with correct direction, in row-major
+        # (stabilizer, data) order from a single nonzero scan
+        block = stab_matrix[:min(n_stabs, len(ancilla_qubits)), :min(n_data, len(data_qubits))]
+        s_idx, d_idx = np.nonzero(block)
+        ancs = np.asarray(ancilla_qubits)[s_idx].tolist()
+        dqs = np.asarray(data_qubits)[d_idx].tolist()
+        if is_x_type:
+            # X-type: CNOT from data to ancilla
+            all_cnots: List[Tuple[int, int]] = list(zip(dqs, ancs))
+        else:
+            # Z-type: CNOT from ancilla to data
+            all_cnots = list(zip(ancs, dqs))
         
         if not all_cnots:
-            return
+            return []
         
         # Use shared graph coloring algorithm
-        layers = graph_coloring_cnots(all_cnots)
-        
-        # Emit layers with TICKs (between layers, not after last)
-        for layer_idx, layer in enumerate(layers):
-            if layer_idx > 0:
-                circuit.append("TICK")
-            for ctrl, tgt in layer:
-                circuit.append("CNOT", [ctrl, tgt])
+        return [[q for pair in layer for q in pair] for layer in graph_coloring_cnots(all_cnots)]
     
     def _get_stab_coord(self, stab_type: str, s_idx: int) -> Tuple[float, float, float]:
         """Get detector coordinate for a stabilizer."""
@@ -945,6 +1088,7 @@ class CSSStabilizerRoundBuilder(BaseStabilizerRoundBuilder):
         circuit: stim.Circuit,
         num_rounds: int,
         stab_type: StabilizerBasis = StabilizerBasis.BOTH,
+        use_repeat: bool = False,
     ) -> None:
         """
         Emit multiple stabilizer measurement rounds.
@@ -957,9 +1101,51 @@ class CSSStabilizerRoundBuilder(BaseStabilizerRoundBuilder):
             Number of rounds.
         stab_type : StabilizerBasis
             Which stabilizers to measure.
+        use_repeat : bool
+            Fold the steady-state rounds into a ``REPEAT`` block. The first
+            and last rounds stay unrolled, and the flattened circuit
+            (detector coordinates included) matches the unrolled one.
         """
-        for _ in range(num_rounds):
-            self.emit_round(circuit, stab_type, emit_detectors=True)
+        if not use_repeat or num_rounds < 4:
+            for _ in range(num_rounds):
+                self.emit_round(circuit, stab_type, emit_detectors=True)
+            return
+        
+        self.emit_round(circuit, stab_type, emit_detectors=True)
+        
+        # Every middle round measures the same checks against the previous
+        # round, so its detector lookbacks are identical; only the absolute
+        # time coordinate differs, which an extra per-iteration shift (undone
+        # after the block) reproduces.
+        repeats = num_rounds - 2
+        meas_before = self.ctx.measurement_index
+        time_step = self.ctx.time_step
+        body = stim.Circuit()
+        self.emit_round(body, stab_type, emit_detectors=True)
+        if time_step:
+            body.append("SHIFT_COORDS", [], [0.0, 0.0, time_step])
+        circuit.append(stim.CircuitRepeatBlock(repeats, body))
+        if time_step:
+            circuit.append("SHIFT_COORDS", [], [0.0, 0.0, -time_step * repeats])
+        self._skip_rounds(repeats - 1, self.ctx.measurement_index - meas_before, stab_type)
+        
+        self.emit_round(circuit, stab_type, emit_detectors=True)
+    
+    def _skip_rounds(self, count: int, meas_per_round: int, stab_type: StabilizerBasis) -> None:
+        """Advance the tracking state past ``count`` rounds emitted by a REPEAT block."""
+        shift = count * meas_per_round
+        self.ctx.measurement_index += shift
+        for stab, last in (("x", self._last_x_meas), ("z", self._last_z_meas)):
+            if stab_type not in (StabilizerBasis.BOTH, StabilizerBasis(stab)):
+                continue
+            for s_idx, meas in enumerate(last):
+                if meas is not None:
+                    last[s_idx] = meas + shift
+                    self.ctx.record_stabilizer_measurement(
+                        self.block_name, stab, s_idx, last[s_idx]
+                    )
+        self.ctx.advance_time(count * self.ctx.time_step)
+        self._round_number += count
     
     def emit_final_measurement(
         self,
@@ -990,11 +1176,11 @@ class CSSStabilizerRoundBuilder(BaseStabilizerRoundBuilder):
         
         # Basis change if needed
         if basis == "X":
-            circuit.append("H", data)
+            append_gate(circuit, "H", data)
         
         # Measure all data qubits (not just logical support)
         meas_start = self.ctx.add_measurement(n)
-        circuit.append("M", data)
+        append_gate(circuit, "M", data)
         
         # Build data measurement lookup
         data_meas = {q: meas_start + i for i, q in enumerate(range(n))}
@@ -1002,6 +1188,10 @@ class CSSStabilizerRoundBuilder(BaseStabilizerRoundBuilder):
         # Space-like detectors: pair final data measurements with last stabilizer round
         # For Z-basis: use Z stabilizers (hz) and last_z_meas
         # For X-basis: use X stabilizers (hx) and last_x_meas
+        # They are collected as record lookbacks and appended as one batch.
+        m_index = self.ctx.measurement_index
+        data_offset = meas_start - m_index
+        detectors: List[Tuple[List[int], Tuple[float, ...]]] = []
         if basis == "Z" and self._hz is not None:
             for s_idx in range(self._n_z):
                 last_meas = self._last_z_meas[s_idx]
@@ -1009,16 +1199,15 @@ class CSSStabilizerRoundBuilder(BaseStabilizerRoundBuilder):
                     continue
                 
                 # Get data qubits in this stabilizer
-                row = self._hz[s_idx]
-                data_idxs = [meas_start + d_idx for d_idx in range(min(n, len(row))) if row[d_idx]]
+                support = self._z_supports[s_idx]
+                data_lookbacks = (data_offset + support[support < n]).tolist()
                 
-                if data_idxs:
-                    recs = data_idxs + [last_meas]
+                if data_lookbacks:
                     # Space-like detectors: get stabilizer coordinate and update time
                     coord = self._get_stab_coord("z", s_idx)
                     # Preserve all dimensions (3D or 4D for color codes)
                     coord = (coord[0], coord[1], self.ctx.current_time) + coord[3:]
-                    self.ctx.emit_detector(circuit, recs, coord)
+                    detectors.append((data_lookbacks + [last_meas - m_index], coord))
         
         elif basis == "X" and self._hx is not None:
             for s_idx in range(self._n_x):
@@ -1026,16 +1215,16 @@ class CSSStabilizerRoundBuilder(BaseStabilizerRoundBuilder):
                 if last_meas is None:
                     continue
                 
-                row = self._hx[s_idx]
-                data_idxs = [meas_start + d_idx for d_idx in range(min(n, len(row))) if row[d_idx]]
+                support = self._x_supports[s_idx]
+                data_lookbacks = (data_offset + support[support < n]).tolist()
                 
-                if data_idxs:
-                    recs = data_idxs + [last_meas]
+                if data_lookbacks:
                     # Space-like detectors: get stabilizer coordinate and update time
                     coord = self._get_stab_coord("x", s_idx)
                     # Preserve all dimensions (3D or 4D for color codes)
                     coord = (coord[0], coord[1], self.ctx.current_time) + coord[3:]
-                    self.ctx.emit_detector(circuit, recs, coord)
+                    detectors.append((data_lookbacks + [last_meas - m_index], coord))
+        append_detectors(circuit, detectors)
         
         # Compute logical observable measurements
         logical_meas = []
@@ -1095,10 +1284,8 @@ class CSSStabilizerRoundBuilder(BaseStabilizerRoundBuilder):
                     continue
                 
                 # Get data qubits in this stabilizer
-                support = []
-                for d_idx in range(min(n, self._hz.shape[1])):
-                    if self._hz[s_idx, d_idx]:
-                        support.append(meas_start + d_idx)
+                support = self._z_supports[s_idx]
+                support = (meas_start + support[support < n]).tolist()
                 
                 if support:
                     coord = self._get_stab_coord("z", s_idx)
@@ -1112,10 +1299,8 @@ class CSSStabilizerRoundBuilder(BaseStabilizerRoundBuilder):
                 if last_meas is None:
                     continue
                 
-                support = []
-                for d_idx in range(min(n, self._hx.shape[1])):
-                    if self._hx[s_idx, d_idx]:
-                        support.append(meas_start + d_idx)
+                support = self._x_supports[s_idx]
+                support = (meas_start + support[support < n]).tolist()
                 
                 if support:
                     coord = self._get_stab_coord("x", s_idx)
@@ -1182,31 +1367,27 @@ def _parse_pauli_support(
     n: int,
 ) -> List[int]:
     """Parse Pauli operator support."""
-    support = []
     if isinstance(pauli_op, str):
-        for q, p in enumerate(pauli_op):
-            if p in paulis:
-                support.append(q)
+        chars = np.frombuffer(pauli_op.encode('ascii'), dtype=np.uint8)
+        wanted = np.frombuffer(''.join(paulis).encode('ascii'), dtype=np.uint8)
+        return np.flatnonzero(np.isin(chars, wanted)).tolist()
     elif isinstance(pauli_op, dict):
-        for q, p in pauli_op.items():
-            if p in paulis:
-                support.append(q)
+        return [q for q, p in pauli_op.items() if p in paulis]
     elif isinstance(pauli_op, np.ndarray):
+        # Symplectic [x | z] vector: classify every qubit at once
         half = len(pauli_op) // 2
-        for q in range(min(n, half)):
-            has_x = bool(pauli_op[q])
-            has_z = bool(pauli_op[half + q]) if half + q < len(pauli_op) else False
-            if has_x and has_z:
-                p = 'Y'
-            elif has_x:
-                p = 'X'
-            elif has_z:
-                p = 'Z'
-            else:
-                continue
-            if p in paulis:
-                support.append(q)
-    return support
+        m = min(n, half)
+        has_x = pauli_op[:m] != 0
+        has_z = pauli_op[half:half + m] != 0
+        mask = np.zeros(m, dtype=bool)
+        if 'Y' in paulis:
+            mask |= has_x & has_z
+        if 'X' in paulis:
+            mask |= has_x & ~has_z
+        if 'Z' in paulis:
+            mask |= has_z & ~has_x
+        return np.flatnonzero(mask).tolist()
+    return []
 
 
 class ColorCodeStabilizerRoundBuilder(CSSStabilizerRoundBuilder):
@@ -1338,16 +1519,18 @@ class GeneralStabilizerRoundBuilder(BaseStabilizerRoundBuilder):
     
     def emit_qubit_coords(self, circuit: stim.Circuit) -> None:
         """Emit QUBIT_COORDS for all qubits."""
-        for local_idx, coord in enumerate(self._data_coords):
-            if len(coord) >= 2:
-                global_idx = self.data_offset + local_idx
-                circuit.append("QUBIT_COORDS", [global_idx], [float(coord[0]), float(coord[1])])
+        coords = [
+            (self.data_offset + local_idx, (float(coord[0]), float(coord[1])))
+            for local_idx, coord in enumerate(self._data_coords)
+            if len(coord) >= 2
+        ]
+        append_qubit_coords(circuit, coords)
     
     def emit_reset_all(self, circuit: stim.Circuit) -> None:
         """Reset all data and ancilla qubits."""
         all_qubits = self.data_qubits + self.ancilla_qubits
         if all_qubits:
-            circuit.append("R", all_qubits)
+            append_gate(circuit, "R", all_qubits)
     
     def emit_prepare_logical_state(
         self,
@@ -1384,7 +1567,7 @@ class GeneralStabilizerRoundBuilder(BaseStabilizerRoundBuilder):
         elif state in ("+", "-"):
             # X-basis eigenstate - apply H to all data qubits
             # Then apply Z to logical X support for |-⟩
-            circuit.append("H", self.data_qubits)
+            append_gate(circuit, "H", self.data_qubits)
             if state == "-" and logical_x is not None:
                 support = _parse_pauli_support(logical_x, ('X', 'Y', 'Z'), self._n)
                 for q in support:
@@ -1409,7 +1592,7 @@ class GeneralStabilizerRoundBuilder(BaseStabilizerRoundBuilder):
         anc = self.ancilla_qubits
         
         # Reset ancillas at start of round
-        circuit.append("R", anc)
+        append_gate(circuit, "R", anc)
         circuit.append("TICK")
         
         # Apply stabilizer gates with graph-coloring scheduling
@@ -1419,7 +1602,7 @@ class GeneralStabilizerRoundBuilder(BaseStabilizerRoundBuilder):
         
         # Measure all ancillas
         meas_start = self.ctx.add_measurement(self._n_stabs)
-        circuit.append("MR", anc)
+        append_gate(circuit, "MR", anc)
         
         # Time-like detectors - for non-CSS codes, skip first round
         # (initial state is generally not eigenstate of all stabilizers)
@@ -1504,8 +1687,7 @@ class GeneralStabilizerRoundBuilder(BaseStabilizerRoundBuilder):
                 circuit.append("H", y_data)
             
             # Apply all CNOTs (data controls ancilla)
-            for dq, a in layer_cnots:
-                circuit.append("CX", [dq, a])
+            append_gate(circuit, "CX", [q for pair in layer_cnots for q in pair])
             
             # Post-rotation for X: H
             if x_ops:
@@ -1575,7 +1757,7 @@ class GeneralStabilizerRoundBuilder(BaseStabilizerRoundBuilder):
         
         # Measure all data qubits
         meas_start = self.ctx.add_measurement(n)
-        circuit.append("M", data)
+        append_gate(circuit, "M", data)
         
         # Space-like detectors (simplified for non-CSS)
         # Only emit if we can verify stabilizers with final measurements
@@ -296,6 +296,15 @@ class GadgetScheduler:
             for local_idx, coord in enumerate(data_coords):
                 coord_to_data[tuple(coord)] = data_qubits[local_idx] if local_idx < len(data_qubits) else None
         
+        def geo_pairs(stab_coords, ancillas, dx, dy):
+            """(data, ancilla) pairs one schedule step away, over float coords hoisted once."""
+            pairs = []
+            for anc, (sx, sy) in zip(ancillas, stab_coords):
+                dq = coord_to_data.get((sx + dx, sy + dy))
+                if dq is not None:
+                    pairs.append((dq, anc))
+            return pairs
+        
         # Schedule X stabilizers
         if stab_type in ("x", "both") and hx is not None and len(x_ancillas) > 0:
             # Prepare X ancillas (H gate)
@@ -306,16 +315,11 @@ class GadgetScheduler:
             
             if use_geo_x:
                 # Geometric scheduling: one TICK per phase
+                stab_xy = [(float(sx), float(sy)) for sx, sy in x_stab_coords]
                 for dx, dy in x_schedule:
                     cnot_layer = self.add_layer()
-                    for s_idx, (sx, sy) in enumerate(x_stab_coords):
-                        if s_idx >= len(x_ancillas):
-                            continue
-                        anc = x_ancillas[s_idx]
-                        nbr = (float(sx) + dx, float(sy) + dy)
-                        dq = coord_to_data.get(nbr)
-                        if dq is not None:
-                            cnot_layer.add_two_qubit_gate("CNOT", dq, anc)
+                    for dq, anc in geo_pairs(stab_xy, x_ancillas, dx, dy):
+                        cnot_layer.add_two_qubit_gate("CNOT", dq, anc)
                     self.advance_time()
                     layers.append(cnot_layer)
             else:
@@ -341,16 +345,11 @@ class GadgetScheduler:
         if stab_type in ("z", "both") and hz is not None and len(z_ancillas) > 0:
             if use_geo_z:
                 # Geometric scheduling
+                stab_xy = [(float(sx), float(sy)) for sx, sy in z_stab_coords]
                 for dx, dy in z_schedule:
                     cnot_layer = self.add_layer()
-                    for s_idx, (sx, sy) in enumerate(z_stab_coords):
-                        if s_idx >= len(z_ancillas):
-                            continue
-                        anc = z_ancillas[s_idx]
-                        nbr = (float(sx) + dx, float(sy) + dy)
-                        dq = coord_to_data.get(nbr)
-                        if dq is not None:
-                            cnot_layer.add_two_qubit_gate("CNOT", dq, anc)
+                    for dq, anc in geo_pairs(stab_xy, z_ancillas, dx, dy):
+                        cnot_layer.add_two_qubit_gate("CNOT", dq, anc)
                     self.advance_time()
                     layers.append(cnot_layer)
             else:
@@ -396,16 +395,14 @@ class GadgetScheduler:
         if stab_matrix is None or stab_matrix.size == 0:
             return []
         
-        n_stabs, n_data = stab_matrix.shape
-        
         # Collect all CNOT operations: (data_qubit, ancilla_qubit)
-        all_cnots = []
-        for s_idx in range(min(n_stabs, len(ancilla_qubits))):
-            anc = ancilla_qubits[s_idx]
-            for d_idx in range(min(n_data, len(data_qubits))):
-                if stab_matrix[s_idx, d_idx]:
-                    dq = data_qubits[d_idx]
-                    all_cnots.append((dq, anc))
+        rows, cols = np.nonzero(
+            stab_matrix[:len(ancilla_qubits), :len(data_qubits)]
+        )
+        all_cnots = [
+            (data_qubits[d_idx], ancilla_qubits[s_idx])
+            for s_idx, d_idx in zip(rows.tolist(), cols.tolist())
+        ]
         
         if not all_cnots:
             return []
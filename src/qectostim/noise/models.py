@@ -43,12 +43,19 @@ class CircuitDepolarizingNoise(NoiseModel):
         # as gates for this purpose.
         last_gate_on_qubit: Dict[int, int] = {}
 
-        instructions: List[stim.CircuitInstruction] = list(circuit)
+        instructions = list(circuit)
         for idx, inst in enumerate(instructions):
+            if isinstance(inst, stim.CircuitRepeatBlock):
+                # Qubits touched inside a REPEAT block are touched at its index.
+                for body_inst in inst.body_copy().flattened():
+                    if body_inst.name.upper() not in self._NON_GATES:
+                        for t in body_inst.targets_copy():
+                            if t.is_qubit_target:
+                                last_gate_on_qubit[t.value] = idx
+                continue
+
             name = inst.name.upper()
-            if name in {"M", "MR", "R", "MRX", "MX", "MY", "MZ",
-                        "DETECTOR", "OBSERVABLE_INCLUDE",
-                        "TICK", "SHIFT_COORDS"}:
+            if name in self._NON_GATES:
                 continue
 
             for t in inst.targets_copy():
@@ -59,8 +66,10 @@ class CircuitDepolarizingNoise(NoiseModel):
         noisy = stim.Circuit()
 
         for idx, inst in enumerate(instructions):
+            if isinstance(inst, stim.CircuitRepeatBlock):
+                noisy.append(stim.CircuitRepeatBlock(inst.repeat_count, self._apply_body(inst.body_copy())))
+                continue
             noisy.append(inst)
-            name = inst.name.upper()
 
             # Extract only qubit targets.
             qubit_targets = [t.value for t in inst.targets_copy() if t.is_qubit_target]
@@ -71,21 +80,45 @@ class CircuitDepolarizingNoise(NoiseModel):
             # skip injecting noise here. This suppresses many "naked L0"
             # error terms that correspond to pure logical readout faults.
             is_final_touch = all(last_gate_on_qubit.get(q, -1) == idx for q in qubit_targets)
+            if not is_final_touch:
+                self._append_noise(noisy, inst.name.upper(), qubit_targets)
+
+        return noisy
 
-            # 1-qubit gates: add DEPOLARIZE1 on each target unless it's the last touch.
-            if name in {
-                "H", "X", "Y", "Z", "S", "S_DAG",
-                "SQRT_X", "SQRT_X_DAG",
-                "SQRT_Y", "SQRT_Y_DAG",
-            } and self.p1 > 0 and not is_final_touch:
-                noisy.append("DEPOLARIZE1", qubit_targets, self.p1)
-
-            # 2-qubit gates: add DEPOLARIZE2 in pairs unless they're all final touches.
-            if name in {"CX", "CNOT", "CZ", "ISWAP", "SWAP"} and self.p2 > 0 and not is_final_touch:
-                if len(qubit_targets) % 2 != 0:
-                    raise ValueError(
-                        f"Gate {name} has odd number of qubit targets: {qubit_targets}"
-                    )
-                noisy.append("DEPOLARIZE2", qubit_targets, self.p2)
-
-        return noisy
\ No newline at end of file
+    # Instructions that do not count as gates when locating final touches.
+    _NON_GATES = frozenset({
+        "M", "MR", "R", "MRX", "MX", "MY", "MZ",
+        "DETECTOR", "OBSERVABLE_INCLUDE",
+        "TICK", "SHIFT_COORDS",
+    })
+
+    def _apply_body(self, body: stim.Circuit) -> stim.Circuit:
+        """Noisy copy of a REPEAT body; no gate in it is treated as a final touch."""
+        noisy = stim.Circuit()
+        for inst in body:
+            if isinstance(inst, stim.CircuitRepeatBlock):
+                noisy.append(stim.CircuitRepeatBlock(inst.repeat_count, self._apply_body(inst.body_copy())))
+                continue
+            noisy.append(inst)
+            qubit_targets = [t.value for t in inst.targets_copy() if t.is_qubit_target]
+            if qubit_targets:
+                self._append_noise(noisy, inst.name.upper(), qubit_targets)
+        return noisy
+
+    def _append_noise(self, noisy: stim.Circuit, name: str, qubit_targets: List[int]) -> None:
+        """Append the depolarizing channel that follows gate ``name``, if any."""
+        # 1-qubit gates: add DEPOLARIZE1 on each target.
+        if name in {
+            "H", "X", "Y", "Z", "S", "S_DAG",
+            "SQRT_X", "SQRT_X_DAG",
+            "SQRT_Y", "SQRT_Y_DAG",
+        } and self.p1 > 0:
+            noisy.append("DEPOLARIZE1", qubit_targets, self.p1)
+
+        # 2-qubit gates: add DEPOLARIZE2 in pairs.
+        if name in {"CX", "CNOT", "CZ", "ISWAP", "SWAP"} and self.p2 > 0:
+            if len(qubit_targets) % 2 != 0:
+                raise ValueError(
+                    f"Gate {name} has odd number of qubit targets: {qubit_targets}"
+                )
+            noisy.append("DEPOLARIZE2", qubit_targets, self.p2)
\ No newline at end of file
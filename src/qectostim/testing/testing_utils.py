@@ -210,7 +210,7 @@ def test_decoder_on_code(
             obs_samples = arr[:, dem.num_detectors:] if dem.num_observables > 0 else None
         
         if obs_samples is not None and len(obs_samples.shape) > 1 and obs_samples.shape[1] > 0:
-            result.ler_no_decode = float(obs_samples[:, 0].mean())
+            result.ler_no_decode = np.count_nonzero(obs_samples[:, 0]) / len(obs_samples)
         
         # Create decoder
         try:
@@ -283,7 +283,7 @@ def test_decoder_on_code(
         
         if obs_samples is not None and len(obs_samples.shape) > 1 and obs_samples.shape[1] > 0:
             logical_errors = (corrections[:, 0] ^ obs_samples[:, 0]).astype(np.uint8)
-            result.ler = float(logical_errors.mean())
+            result.ler = np.count_nonzero(logical_errors) / len(logical_errors)
         
         result.status = 'OK'
         